@@ -20,12 +20,16 @@ import os
 from abc import ABC, abstractmethod
 from collections.abc import Coroutine
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from dotenv import load_dotenv
 
 from graphiti_core.driver.graph_operations.graph_operations import GraphOperationsInterface
 from graphiti_core.driver.search_interface.search_interface import SearchInterface
+from graphiti_core.tracer import NoOpTracer, Tracer
+
+if TYPE_CHECKING:
+    from graphiti_core.driver.vector_index import GraphVectorIndexes
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +83,13 @@ class GraphDriver(ABC):
     default_group_id: str = ''
     search_interface: SearchInterface | None = None
     graph_operations_interface: GraphOperationsInterface | None = None
+    tracer: Tracer = NoOpTracer()
+    # Optional in-process ANN indexes consulted by similarity search before hydrating results
+    vector_indexes: 'GraphVectorIndexes | None' = None
+
+    def set_tracer(self, tracer: Tracer) -> None:
+        """Set the tracer used for driver-level spans."""
+        self.tracer = tracer
 
     @abstractmethod
     def execute_query(self, cypher_query_: str, **kwargs: Any) -> Coroutine:
@@ -34,6 +34,7 @@ else:
         ) from None
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.vector_index import GraphVectorIndexes, VectorIndexConfig
 from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
 
@@ -125,6 +126,7 @@ class FalkorDriver(GraphDriver):
         password: str | None = None,
         falkor_db: FalkorDB | None = None,
         database: str = 'default_db',
+        vector_index: VectorIndexConfig | None = None,
     ):
         """
         Initialize the FalkorDB driver.
@@ -140,9 +142,17 @@ class FalkorDriver(GraphDriver):
         password (str | None): The password for authentication (if required).
         falkor_db (FalkorDB | None): An existing FalkorDB instance to use instead of creating a new one.
         database (str): The name of the database to connect to. Defaults to 'default_db'.
+        vector_index (VectorIndexConfig | None): If set, similarity searches take their candidates
+            from in-process vector indexes, one pair per database.
         """
         super().__init__()
         self._database = database
+        self.vector_index = vector_index
+        # Shared with clones, so switching between databases does not reload their indexes
+        self._vector_indexes_by_database: dict[str, GraphVectorIndexes] = {}
+        if vector_index is not None:
+            self.vector_indexes = GraphVectorIndexes(vector_index)
+            self._vector_indexes_by_database[database] = self.vector_indexes
         if falkor_db is not None:
             # If a FalkorDB instance is provided, use it directly
             self.client = falkor_db
@@ -255,13 +265,21 @@ class FalkorDriver(GraphDriver):
         Reuses the same connection (e.g. FalkorDB, Neo4j).
         """
         if database == self._database:
-            cloned = self
+            return self
         elif database == self.default_group_id:
             cloned = FalkorDriver(falkor_db=self.client)
         else:
             # Create a new instance of FalkorDriver with the same connection but a different database
             cloned = FalkorDriver(falkor_db=self.client, database=database)
 
+        cloned.set_tracer(self.tracer)
+        if self.vector_index is not None:
+            cloned.vector_index = self.vector_index
+            cloned._vector_indexes_by_database = self._vector_indexes_by_database
+            cloned.vector_indexes = self._vector_indexes_by_database.setdefault(
+                cloned._database, GraphVectorIndexes(self.vector_index)
+            )
+
         return cloned
 
     async def health_check(self) -> None:
@@ -20,6 +20,7 @@ from typing import Any
 import kuzu
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.driver.vector_index import GraphVectorIndexes, VectorIndexConfig
 
 logger = logging.getLogger(__name__)
 
@@ -98,9 +99,12 @@ class KuzuDriver(GraphDriver):
         self,
         db: str = ':memory:',
         max_concurrent_queries: int = 1,
+        vector_index: VectorIndexConfig | None = None,
     ):
         super().__init__()
         self.db = kuzu.Database(db)
+        # Kuzu similarity search otherwise computes cosine similarity over every row
+        self.vector_indexes = GraphVectorIndexes(vector_index) if vector_index is not None else None
 
         self.setup_schema()
 
@@ -14,11 +14,14 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
 from collections.abc import Coroutine
+from time import monotonic
 from typing import Any
 
-from neo4j import AsyncGraphDatabase, EagerResult
+from neo4j import AsyncDriver, AsyncGraphDatabase, EagerResult, RoutingControl
+from pydantic import BaseModel
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
@@ -27,6 +30,44 @@ from graphiti_core.helpers import semaphore_gather
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONNECTION_POOL_SIZE = 100
+DEFAULT_CONNECTION_ACQUISITION_TIMEOUT = 60.0
+DEFAULT_FETCH_SIZE = 1000
+
+
+class Neo4jDriverConfig(BaseModel):
+    """
+    Connection pool and routing settings for Neo4jDriver.
+
+    read_uri points read-routed queries (routing_='r') at a separate endpoint, e.g. a cluster's
+    read replicas. When route_reads is False every query is sent to the writer, which gives
+    read-your-writes consistency at the cost of replica offloading.
+    """
+
+    max_connection_pool_size: int = DEFAULT_MAX_CONNECTION_POOL_SIZE
+    connection_acquisition_timeout: float = DEFAULT_CONNECTION_ACQUISITION_TIMEOUT
+    liveness_check_timeout: float | None = None
+    max_connection_lifetime: float | None = None
+    fetch_size: int = DEFAULT_FETCH_SIZE
+    read_uri: str | None = None
+    route_reads: bool = True
+
+
+class Neo4jPoolStats(BaseModel):
+    queries: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    acquisition_wait_total: float = 0.0
+    acquisition_wait_max: float = 0.0
+
+    @property
+    def acquisition_wait_avg(self) -> float:
+        return self.acquisition_wait_total / self.queries if self.queries else 0.0
+
+
+def _is_read_routing(routing: Any) -> bool:
+    return routing == RoutingControl.READ or routing == 'r'
+
 
 class Neo4jDriver(GraphDriver):
     provider = GraphProvider.NEO4J
@@ -38,17 +79,29 @@ class Neo4jDriver(GraphDriver):
         user: str | None,
         password: str | None,
         database: str = 'neo4j',
+        config: Neo4jDriverConfig | None = None,
     ):
         super().__init__()
-        self.client = AsyncGraphDatabase.driver(
-            uri=uri,
-            auth=(user or '', password or ''),
+        if config is None:
+            config = Neo4jDriverConfig()
+        if config.max_connection_pool_size < 1:
+            raise ValueError('max_connection_pool_size must be at least 1')
+
+        self.config = config
+        auth = (user or '', password or '')
+        self.client = self._create_client(uri, auth)
+        self.read_client: AsyncDriver | None = (
+            self._create_client(config.read_uri, auth) if config.read_uri else None
         )
         self._database = database
 
-        # Schedule the indices and constraints to be built
-        import asyncio
+        # execute_query waits on these before handing a query to the driver, so fan-outs wider
+        # than the pool queue here, where the wait is measured, rather than inside the driver.
+        self._pool_slots = asyncio.Semaphore(config.max_connection_pool_size)
+        self._read_pool_slots = asyncio.Semaphore(config.max_connection_pool_size)
+        self.pool_stats = Neo4jPoolStats()
 
+        # Schedule the indices and constraints to be built
         try:
             # Try to get the current event loop
             loop = asyncio.get_running_loop()
@@ -60,6 +113,19 @@ class Neo4jDriver(GraphDriver):
 
         self.aoss_client = None
 
+    def _create_client(self, uri: str, auth: tuple[str, str]) -> AsyncDriver:
+        pool_config: dict[str, Any] = {
+            'max_connection_pool_size': self.config.max_connection_pool_size,
+            'connection_acquisition_timeout': self.config.connection_acquisition_timeout,
+            'fetch_size': self.config.fetch_size,
+        }
+        if self.config.liveness_check_timeout is not None:
+            pool_config['liveness_check_timeout'] = self.config.liveness_check_timeout
+        if self.config.max_connection_lifetime is not None:
+            pool_config['max_connection_lifetime'] = self.config.max_connection_lifetime
+
+        return AsyncGraphDatabase.driver(uri=uri, auth=auth, **pool_config)
+
     async def execute_query(self, cypher_query_: LiteralString, **kwargs: Any) -> EagerResult:
         # Check if database_ is provided in kwargs.
         # If not populated, set the value to retain backwards compatibility
@@ -68,11 +134,46 @@ class Neo4jDriver(GraphDriver):
             params = {}
         params.setdefault('database_', self._database)
 
-        try:
-            result = await self.client.execute_query(cypher_query_, parameters_=params, **kwargs)
-        except Exception as e:
-            logger.error(f'Error executing Neo4j query: {e}\n{cypher_query_}\n{params}')
-            raise
+        is_read = _is_read_routing(kwargs.get('routing_'))
+        if is_read and not self.config.route_reads:
+            kwargs.pop('routing_')
+            is_read = False
+
+        client = self.client
+        pool_slots = self._pool_slots
+        if is_read and self.read_client is not None:
+            client = self.read_client
+            pool_slots = self._read_pool_slots
+
+        stats = self.pool_stats
+        with self.tracer.start_span('neo4j.execute_query') as span:
+            wait_start = monotonic()
+            async with pool_slots:
+                wait = monotonic() - wait_start
+                stats.queries += 1
+                stats.in_flight += 1
+                stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+                stats.acquisition_wait_total += wait
+                stats.acquisition_wait_max = max(stats.acquisition_wait_max, wait)
+                span.add_attributes(
+                    {
+                        'db.routing': 'read' if is_read else 'write',
+                        'db.read_replica': client is not self.client,
+                        'pool.max_size': self.config.max_connection_pool_size,
+                        'pool.in_flight': stats.in_flight,
+                        'pool.utilization': stats.in_flight / self.config.max_connection_pool_size,
+                        'pool.acquisition_wait_ms': wait * 1000,
+                    }
+                )
+                try:
+                    result = await client.execute_query(cypher_query_, parameters_=params, **kwargs)
+                except Exception as e:
+                    span.set_status('error', str(e))
+                    span.record_exception(e)
+                    logger.error(f'Error executing Neo4j query: {e}\n{cypher_query_}\n{params}')
+                    raise
+                finally:
+                    stats.in_flight -= 1
 
         return result
 
@@ -81,6 +182,8 @@ class Neo4jDriver(GraphDriver):
         return self.client.session(database=_database)  # type: ignore
 
     async def close(self) -> None:
+        if self.read_client is not None:
+            await self.read_client.close()
         return await self.client.close()
 
     def delete_all_indexes(self) -> Coroutine:
@@ -106,7 +209,7 @@ class Neo4jDriver(GraphDriver):
                 for query in index_queries
             ]
         )
-    
+
     async def health_check(self) -> None:
         """Check Neo4j connectivity by running the driver's verify_connectivity method."""
         try:
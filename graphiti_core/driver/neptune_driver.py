@@ -15,10 +15,13 @@ limitations under the License.
 """
 
 import asyncio
+import copy
 import datetime
+import functools
 import logging
-from collections.abc import Coroutine
-from typing import Any
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 import boto3
 from langchain_aws.graphs import NeptuneAnalyticsGraph, NeptuneGraph
@@ -28,6 +31,9 @@ from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphPr
 
 logger = logging.getLogger(__name__)
 DEFAULT_SIZE = 10
+DEFAULT_MAX_CONCURRENT_QUERIES = 16
+
+T = TypeVar('T')
 
 aoss_indices = [
     {
@@ -109,17 +115,31 @@ aoss_indices = [
 class NeptuneDriver(GraphDriver):
     provider: GraphProvider = GraphProvider.NEPTUNE
 
-    def __init__(self, host: str, aoss_host: str, port: int = 8182, aoss_port: int = 443):
+    def __init__(
+        self,
+        host: str,
+        aoss_host: str,
+        port: int = 8182,
+        aoss_port: int = 443,
+        max_concurrent_queries: int = DEFAULT_MAX_CONCURRENT_QUERIES,
+    ):
         """This initializes a NeptuneDriver for use with Neptune as a backend
 
+        The Neptune and OpenSearch clients are synchronous, so every call runs on a bounded
+        thread pool instead of blocking the event loop.
+
         Args:
             host (str): The Neptune Database or Neptune Analytics host
             aoss_host (str): The OpenSearch host value
             port (int, optional): The Neptune Database port, ignored for Neptune Analytics. Defaults to 8182.
             aoss_port (int, optional): The OpenSearch port. Defaults to 443.
+            max_concurrent_queries (int, optional): Maximum number of Neptune and OpenSearch requests
+                in flight at once; also sizes the OpenSearch connection pool. Defaults to 16.
         """
         if not host:
             raise ValueError('You must provide an endpoint to create a NeptuneDriver')
+        if max_concurrent_queries < 1:
+            raise ValueError('max_concurrent_queries must be at least 1')
 
         if host.startswith('neptune-db://'):
             # This is a Neptune Database Cluster
@@ -148,9 +168,17 @@ class NeptuneDriver(GraphDriver):
             use_ssl=True,
             verify_certs=True,
             connection_class=Urllib3HttpConnection,
-            pool_maxsize=20,
+            pool_maxsize=max_concurrent_queries,
         )
 
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_queries, thread_name_prefix='neptune'
+        )
+
+    async def _run_in_executor(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
     def _sanitize_parameters(self, query, params: dict):
         if isinstance(query, list):
             queries = []
@@ -194,10 +222,10 @@ class NeptuneDriver(GraphDriver):
         params = dict(kwargs)
         if isinstance(cypher_query_, list):
             for q in cypher_query_:
-                result, _, _ = self._run_query(q[0], q[1])
+                result, _, _ = await self._run_in_executor(self._run_query, q[0], q[1])
             return result, None, None
         else:
-            return self._run_query(cypher_query_, params)
+            return await self._run_in_executor(self._run_query, cypher_query_, params)
 
     def _run_query(self, cypher_query_, params):
         cypher_query_ = str(self._sanitize_parameters(cypher_query_, params))
@@ -215,7 +243,8 @@ class NeptuneDriver(GraphDriver):
         return NeptuneDriverSession(driver=self)
 
     async def close(self) -> None:
-        return self.client.client.close()
+        await self._run_in_executor(self.client.client.close)
+        self._executor.shutdown(wait=False)
 
     async def _delete_all_data(self) -> Any:
         return await self.execute_query('MATCH (n) DETACH DELETE n')
@@ -231,8 +260,10 @@ class NeptuneDriver(GraphDriver):
         for index in aoss_indices:
             index_name = index['index_name']
             client = self.aoss_client
-            if not client.indices.exists(index=index_name):
-                client.indices.create(index=index_name, body=index['body'])
+            if not await self._run_in_executor(client.indices.exists, index=index_name):
+                await self._run_in_executor(
+                    client.indices.create, index=index_name, body=index['body']
+                )
         # Sleep for 1 minute to let the index creation complete
         await asyncio.sleep(60)
 
@@ -240,19 +271,21 @@ class NeptuneDriver(GraphDriver):
         for index in aoss_indices:
             index_name = index['index_name']
             client = self.aoss_client
-            if client.indices.exists(index=index_name):
-                client.indices.delete(index=index_name)
+            if await self._run_in_executor(client.indices.exists, index=index_name):
+                await self._run_in_executor(client.indices.delete, index=index_name)
 
-    def run_aoss_query(self, name: str, query_text: str, limit: int = 10) -> dict[str, Any]:
+    async def run_aoss_query(self, name: str, query_text: str, limit: int = 10) -> dict[str, Any]:
         for index in aoss_indices:
             if name.lower() == index['index_name']:
-                index['query']['query']['multi_match']['query'] = query_text
-                query = {'size': limit, 'query': index['query']}
-                resp = self.aoss_client.search(body=query['query'], index=index['index_name'])
-                return resp
+                # copy the template so concurrent queries do not overwrite each other's text
+                body = copy.deepcopy(index['query'])
+                body['query']['multi_match']['query'] = query_text
+                return await self._run_in_executor(
+                    self.aoss_client.search, body=body, index=index['index_name']
+                )
         return {}
 
-    def save_to_aoss(self, name: str, data: list[dict]) -> int:
+    async def save_to_aoss(self, name: str, data: list[dict]) -> int:
         for index in aoss_indices:
             if name.lower() == index['index_name']:
                 to_index = []
@@ -262,7 +295,9 @@ class NeptuneDriver(GraphDriver):
                         if p in d:
                             item[p] = d[p]
                     to_index.append(item)
-                success, failed = helpers.bulk(self.aoss_client, to_index, stats_only=True)
+                success, failed = await self._run_in_executor(
+                    helpers.bulk, self.aoss_client, to_index, stats_only=True
+                )
                 return success
 
         return 0
@@ -0,0 +1,481 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from graphiti_core.driver.driver import GraphDriver
+    from graphiti_core.edges import EntityEdge
+    from graphiti_core.nodes import EntityNode
+
+logger = logging.getLogger(__name__)
+
+VECTOR_INDEX_LOAD_PAGE_SIZE = 5000
+_INITIAL_CAPACITY = 1024
+_KMEANS_ITERATIONS = 10
+_MAX_TRAINING_SAMPLE = 50_000
+
+
+class VectorIndexConfig(BaseModel):
+    """
+    Settings for the in-process IVF vector indexes.
+
+    Below train_threshold live vectors a search scores every vector of the searched groups in one
+    matrix product. From train_threshold on, vectors are clustered into about sqrt(n) lists and a
+    search only scores the n_probe lists whose centroids are closest to the query. The lists are
+    retrained whenever the index has doubled in size since the last training.
+
+    A search returns max(limit * oversample, min_candidates) candidates, which are then hydrated
+    and filtered by the database. If path is set, vectors are kept in memory-mapped float32 files
+    in that directory instead of on the heap.
+    """
+
+    n_probe: int = 8
+    train_threshold: int = 20_000
+    oversample: int = 4
+    min_candidates: int = 100
+    path: str | None = None
+
+
+def _normalize(vectors: NDArray[np.float32]) -> NDArray[np.float32]:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return (vectors / np.where(norms == 0, 1, norms)).astype(np.float32, copy=False)
+
+
+def _train_ivf(
+    vectors: NDArray[np.float32], n_lists: int, seed: int = 0
+) -> tuple[NDArray[np.float32], NDArray[np.int32]]:
+    """Spherical k-means over vectors. Returns the centroids and each vector's list."""
+    rng = np.random.default_rng(seed)
+    sample = vectors
+    if len(vectors) > _MAX_TRAINING_SAMPLE:
+        sample = vectors[rng.choice(len(vectors), _MAX_TRAINING_SAMPLE, replace=False)]
+
+    centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assignments = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        empty = np.bincount(assignments, minlength=n_lists) == 0
+        # Reseed empty lists so every centroid stays useful
+        sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+        centroids = _normalize(sums)
+
+    assignments = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), _MAX_TRAINING_SAMPLE):
+        chunk = vectors[start : start + _MAX_TRAINING_SAMPLE]
+        assignments[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+
+    return centroids, assignments
+
+
+class VectorIndex:
+    """
+    Inverted-file (IVF) index of unit-normalized float32 vectors keyed by uuid.
+
+    Slots freed by remove() are reused by later adds. Adds are assigned to the nearest existing
+    list; training runs in a worker thread on a snapshot and slots written meanwhile are
+    reassigned when the new lists are installed.
+    """
+
+    def __init__(self, name: str, config: VectorIndexConfig | None = None):
+        self.name = name
+        self.config = config or VectorIndexConfig()
+        self.dim: int | None = None
+        self._vectors: NDArray[np.float32] = np.empty((0, 0), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._group_codes = np.zeros(0, dtype=np.int32)
+        self._list_ids = np.zeros(0, dtype=np.int32)
+        self._uuids: list[str | None] = []
+        self._slot_by_uuid: dict[str, int] = {}
+        self._code_by_group: dict[str, int] = {}
+        self._free: list[int] = []
+        self._next_slot = 0
+        self._file: str | None = None
+
+        self._centroids: NDArray[np.float32] | None = None
+        self._members: list[NDArray[np.int64]] = []
+        self._member_count = 0
+        self._trained_size = 0
+        self._training = False
+        self._touched: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._slot_by_uuid)
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    def _allocate(self, capacity: int, dim: int):
+        if self.config.path is None:
+            vectors = np.zeros((capacity, dim), dtype=np.float32)
+        else:
+            os.makedirs(self.config.path, exist_ok=True)
+            file = os.path.join(self.config.path, f'{self.name}.{capacity}.f32')
+            vectors = np.memmap(file, dtype=np.float32, mode='w+', shape=(capacity, dim))
+
+        used = self._next_slot
+        if used:
+            vectors[:used] = self._vectors[:used]
+        self._vectors = vectors
+        self._alive = np.resize(self._alive, capacity)
+        self._alive[used:] = False
+        self._group_codes = np.resize(self._group_codes, capacity)
+        self._list_ids = np.resize(self._list_ids, capacity)
+        self._list_ids[used:] = -1
+
+        if self.config.path is not None:
+            if self._file is not None:
+                os.remove(self._file)
+            self._file = file
+
+    def add(self, items: Iterable[tuple[str, str, list[float]]]):
+        """Insert or replace (uuid, group_id, vector) items."""
+        for uuid, group_id, vector in items:
+            if self.dim is None:
+                self.dim = len(vector)
+                self._allocate(_INITIAL_CAPACITY, self.dim)
+            if len(vector) != self.dim:
+                logger.debug(f'Skipping {self.name} vector for {uuid} with dimension {len(vector)}')
+                continue
+
+            slot = self._slot_by_uuid.get(uuid)
+            if slot is None:
+                if self._free:
+                    slot = self._free.pop()
+                else:
+                    if self._next_slot == len(self._vectors):
+                        self._allocate(2 * len(self._vectors), self.dim)
+                    slot = self._next_slot
+                    self._next_slot += 1
+                    self._uuids.append(None)
+                self._slot_by_uuid[uuid] = slot
+                self._uuids[slot] = uuid
+
+            group_code = self._code_by_group.setdefault(group_id, len(self._code_by_group))
+            self._vectors[slot] = _normalize(np.asarray(vector, dtype=np.float32))
+            self._alive[slot] = True
+            self._group_codes[slot] = group_code
+            self._assign(slot)
+            if self._training:
+                self._touched.add(slot)
+
+    def _assign(self, slot: int):
+        if self._centroids is None:
+            return
+        list_id = int(np.argmax(self._centroids @ self._vectors[slot]))
+        if self._list_ids[slot] != list_id:
+            self._list_ids[slot] = list_id
+            self._members[list_id] = np.append(self._members[list_id], slot)
+            self._member_count += 1
+            # Stale member entries are only filtered out at search time, so compact occasionally
+            if self._member_count > 2 * len(self) + _INITIAL_CAPACITY:
+                self._rebuild_members()
+
+    def remove(self, uuids: Iterable[str]):
+        for uuid in uuids:
+            slot = self._slot_by_uuid.pop(uuid, None)
+            if slot is None:
+                continue
+            self._alive[slot] = False
+            self._list_ids[slot] = -1
+            self._uuids[slot] = None
+            self._free.append(slot)
+
+    def remove_groups(self, group_ids: Iterable[str]) -> list[str]:
+        """Remove every vector of the given groups and return the removed uuids."""
+        codes = [self._code_by_group[g] for g in group_ids if g in self._code_by_group]
+        if not codes:
+            return []
+        slots = np.flatnonzero(self._alive[: self._next_slot])
+        slots = slots[np.isin(self._group_codes[slots], codes)]
+        uuids: list[str] = [self._uuids[slot] for slot in slots]  # type: ignore[misc]
+        self.remove(uuids)
+        return uuids
+
+    def clear(self):
+        self.remove([uuid for uuid in self._uuids if uuid is not None])
+        self._centroids = None
+        self._members = []
+        self._trained_size = 0
+
+    def needs_training(self) -> bool:
+        size = len(self)
+        return (
+            not self._training
+            and size >= self.config.train_threshold
+            and size >= 2 * self._trained_size
+        )
+
+    async def train(self):
+        """Recluster the live vectors into about sqrt(n) lists without blocking the event loop."""
+        if self.dim is None or not self.needs_training():
+            return
+
+        slots = np.flatnonzero(self._alive[: self._next_slot])
+        n_lists = max(1, min(len(slots), int(np.sqrt(len(slots)))))
+        snapshot = np.array(self._vectors[slots])
+
+        self._training = True
+        self._touched = set()
+        try:
+            centroids, assignments = await asyncio.to_thread(_train_ivf, snapshot, n_lists)
+        finally:
+            self._training = False
+
+        self._centroids = centroids
+        self._trained_size = len(slots)
+        self._list_ids[:] = -1
+        self._list_ids[slots] = assignments
+        self._rebuild_members()
+        for slot in self._touched:
+            if self._alive[slot]:
+                self._assign(slot)
+        self._touched = set()
+        logger.debug(f'Trained {self.name} vector index: {len(slots)} vectors, {n_lists} lists')
+
+    def _rebuild_members(self):
+        assert self._centroids is not None
+        slots = np.flatnonzero(self._list_ids[: self._next_slot] >= 0)
+        list_ids = self._list_ids[slots]
+        order = np.argsort(list_ids, kind='stable')
+        bounds = np.searchsorted(list_ids[order], np.arange(len(self._centroids) + 1))
+        self._members = [
+            slots[order[bounds[i] : bounds[i + 1]]] for i in range(len(self._centroids))
+        ]
+        self._member_count = len(slots)
+
+    def _probe(self, query: NDArray[np.float32]) -> NDArray[np.int64]:
+        assert self._centroids is not None
+        n_probe = min(self.config.n_probe, len(self._centroids))
+        probe = np.argpartition(-(self._centroids @ query), n_probe - 1)[:n_probe]
+        slots = np.unique(np.concatenate([self._members[list_id] for list_id in probe]))
+        # Members are appended lazily, so drop slots that were freed or moved since
+        return slots[self._alive[slots] & np.isin(self._list_ids[slots], probe)]
+
+    def search(
+        self, vector: list[float], limit: int, group_ids: list[str] | None = None
+    ) -> list[tuple[str, float]]:
+        """Return up to limit (uuid, cosine score) pairs, best first."""
+        if self.dim is None or len(vector) != self.dim or limit <= 0 or not len(self):
+            return []
+
+        query = _normalize(np.asarray(vector, dtype=np.float32))
+        live = self._alive[: self._next_slot]
+        if group_ids is None:
+            slots = np.flatnonzero(live) if self._centroids is None else self._probe(query)
+        else:
+            codes = [self._code_by_group[g] for g in group_ids if g in self._code_by_group]
+            group_slots = np.flatnonzero(
+                live & np.isin(self._group_codes[: self._next_slot], codes)
+            )
+            # Groups small enough to scan exactly keep full recall even in a trained index
+            if self._centroids is None or len(group_slots) < self.config.train_threshold:
+                slots = group_slots
+            else:
+                slots = self._probe(query)
+                slots = slots[np.isin(self._group_codes[slots], codes)]
+
+        if len(slots) == 0:
+            return []
+
+        scores = self._vectors[slots] @ query
+        if len(slots) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(slots))
+        top = top[np.argsort(-scores[top])]
+
+        return [(self._uuids[slots[i]], float(scores[i])) for i in top]  # type: ignore[misc]
+
+
+class GraphVectorIndexes:
+    """
+    Entity name and fact vector indexes kept alongside a graph.
+
+    The indexes are filled from the graph on first use and then kept current by the save and
+    delete paths of this process. Writes made by other processes are not seen; candidates that no
+    longer exist are dropped when the search hydrates them. The endpoints of every indexed fact
+    are tracked so that removing an entity also removes the facts deleted along with it.
+    """
+
+    def __init__(self, config: VectorIndexConfig | None = None):
+        self.config = config or VectorIndexConfig()
+        self.nodes = VectorIndex('entity_name', self.config)
+        self.edges = VectorIndex('entity_fact', self.config)
+        self.loaded = False
+        self.lock = asyncio.Lock()
+        self._edge_endpoints: dict[str, tuple[str, str]] = {}
+        self._edges_by_node: dict[str, set[str]] = {}
+
+    def add_nodes(self, nodes: Iterable['EntityNode']):
+        self.nodes.add(
+            (node.uuid, node.group_id, node.name_embedding)
+            for node in nodes
+            if node.name_embedding is not None
+        )
+
+    def add_edges(self, edges: Iterable['EntityEdge']):
+        edges = list(edges)
+        self.edges.add(
+            (edge.uuid, edge.group_id, edge.fact_embedding)
+            for edge in edges
+            if edge.fact_embedding is not None
+        )
+        self._link_edges(
+            (edge.uuid, edge.source_node_uuid, edge.target_node_uuid)
+            for edge in edges
+            if edge.fact_embedding is not None
+        )
+
+    def _link_edges(self, endpoints: Iterable[tuple[str, str, str]]):
+        for edge_uuid, source_uuid, target_uuid in endpoints:
+            self._unlink_edges([edge_uuid])
+            self._edge_endpoints[edge_uuid] = (source_uuid, target_uuid)
+            self._edges_by_node.setdefault(source_uuid, set()).add(edge_uuid)
+            self._edges_by_node.setdefault(target_uuid, set()).add(edge_uuid)
+
+    def _unlink_edges(self, edge_uuids: Iterable[str]):
+        for edge_uuid in edge_uuids:
+            for node_uuid in self._edge_endpoints.pop(edge_uuid, ()):
+                node_edges = self._edges_by_node.get(node_uuid)
+                if node_edges is None:
+                    continue
+                node_edges.discard(edge_uuid)
+                if not node_edges:
+                    del self._edges_by_node[node_uuid]
+
+    def remove(self, uuids: Iterable[str]):
+        uuids = list(uuids)
+        # Deleting an entity deletes its facts too, so their vectors go with it
+        edge_uuids = uuids + [
+            edge_uuid for uuid in uuids for edge_uuid in self._edges_by_node.get(uuid, ())
+        ]
+        self.nodes.remove(uuids)
+        self.edges.remove(edge_uuids)
+        self._unlink_edges(edge_uuids)
+
+    def remove_groups(self, group_ids: Iterable[str]):
+        group_ids = list(group_ids)
+        self.remove(self.nodes.remove_groups(group_ids))
+        self._unlink_edges(self.edges.remove_groups(group_ids))
+
+    def clear(self):
+        self.nodes.clear()
+        self.edges.clear()
+        self._edge_endpoints = {}
+        self._edges_by_node = {}
+
+    def candidate_count(self, limit: int) -> int:
+        return max(limit * self.config.oversample, self.config.min_candidates)
+
+    async def search_nodes(
+        self,
+        driver: 'GraphDriver',
+        vector: list[float],
+        group_ids: list[str] | None,
+        limit: int,
+        candidate_count: int | None = None,
+    ) -> list[str]:
+        await self.ensure_loaded(driver)
+        await self.nodes.train()
+        count = candidate_count or self.candidate_count(limit)
+        return [uuid for uuid, _ in self.nodes.search(vector, count, group_ids)]
+
+    async def search_edges(
+        self,
+        driver: 'GraphDriver',
+        vector: list[float],
+        group_ids: list[str] | None,
+        limit: int,
+        candidate_count: int | None = None,
+    ) -> list[str]:
+        await self.ensure_loaded(driver)
+        await self.edges.train()
+        count = candidate_count or self.candidate_count(limit)
+        return [uuid for uuid, _ in self.edges.search(vector, count, group_ids)]
+
+    async def ensure_loaded(self, driver: 'GraphDriver'):
+        if self.loaded:
+            return
+
+        async with self.lock:
+            if self.loaded:
+                return
+
+            # imported lazily because the driver package is imported by graphiti_core.driver
+            from graphiti_core.driver.driver import GraphProvider
+
+            edge_match = (
+                'MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)'
+                if driver.provider == GraphProvider.KUZU
+                else 'MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)'
+            )
+            await self._load(driver, 'MATCH (e:Entity)', 'name_embedding', self.nodes)
+            await self._load(driver, edge_match, 'fact_embedding', self.edges, link_endpoints=True)
+            self.loaded = True
+            logger.debug(
+                f'Loaded vector indexes: {len(self.nodes)} entities, {len(self.edges)} facts'
+            )
+
+    async def _load(
+        self,
+        driver: 'GraphDriver',
+        match: str,
+        field: str,
+        index: VectorIndex,
+        link_endpoints: bool = False,
+    ):
+        endpoint_returns = (
+            ', n.uuid AS source_node_uuid, m.uuid AS target_node_uuid' if link_endpoints else ''
+        )
+        skip = 0
+        while True:
+            records: list[Any]
+            records, _, _ = await driver.execute_query(
+                match
+                + f"""
+                WHERE e.{field} IS NOT NULL
+                RETURN e.uuid AS uuid, e.group_id AS group_id, e.{field} AS embedding
+                {endpoint_returns}
+                ORDER BY e.uuid
+                SKIP $skip
+                LIMIT $limit
+                """,
+                skip=skip,
+                limit=VECTOR_INDEX_LOAD_PAGE_SIZE,
+                routing_='r',
+            )
+            index.add(
+                (record['uuid'], record['group_id'], record['embedding']) for record in records
+            )
+            if link_endpoints:
+                self._link_edges(
+                    (record['uuid'], record['source_node_uuid'], record['target_node_uuid'])
+                    for record in records
+                )
+            if len(records) < VECTOR_INDEX_LOAD_PAGE_SIZE:
+                return
+            skip += VECTOR_INDEX_LOAD_PAGE_SIZE
@@ -17,13 +17,14 @@ limitations under the License.
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from time import time
 from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
-from typing_extensions import LiteralString
+from typing_extensions import LiteralString, Self
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.embedder import EmbedderClient
@@ -37,7 +38,7 @@ from graphiti_core.models.edges.edge_db_queries import (
     get_entity_edge_return_query,
     get_entity_edge_save_query,
 )
-from graphiti_core.nodes import Node
+from graphiti_core.nodes import DEFAULT_PAGE_SIZE, Node
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +81,9 @@ class Edge(BaseModel, ABC):
                 uuid=self.uuid,
             )
 
+        if driver.vector_indexes is not None:
+            driver.vector_indexes.remove([self.uuid])
+
         logger.debug(f'Deleted Edge: {self.uuid}')
 
     @classmethod
@@ -114,6 +118,9 @@ class Edge(BaseModel, ABC):
                 uuids=uuids,
             )
 
+        if driver.vector_indexes is not None:
+            driver.vector_indexes.remove(uuids)
+
         logger.debug(f'Deleted Edges: {uuids}')
 
     def __hash__(self):
@@ -127,6 +134,43 @@ class Edge(BaseModel, ABC):
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str): ...
 
+    @classmethod
+    async def get_by_group_ids(
+        cls,
+        driver: GraphDriver,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[Self]: ...
+
+    @classmethod
+    async def iter_by_group_ids(
+        cls,
+        driver: GraphDriver,
+        group_ids: list[str],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        **kwargs: Any,
+    ) -> AsyncIterator[list[Self]]:
+        """
+        Yield the edges of the given groups in pages of at most page_size, walking
+        get_by_group_ids with a uuid cursor so only one page is held in memory at a time.
+
+        Extra keyword arguments such as with_embeddings are passed to get_by_group_ids.
+        """
+        uuid_cursor: str | None = None
+        while True:
+            try:
+                page = await cls.get_by_group_ids(
+                    driver, group_ids, limit=page_size, uuid_cursor=uuid_cursor, **kwargs
+                )
+            except GroupsEdgesNotFoundError:
+                page = []
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            uuid_cursor = page[-1].uuid
+
 
 class EpisodicEdge(Edge):
     async def save(self, driver: GraphDriver):
@@ -311,6 +355,9 @@ class EntityEdge(Edge):
                 edge_data=edge_data,
             )
 
+        if driver.vector_indexes is not None:
+            driver.vector_indexes.add_edges([self])
+
         logger.debug(f'Saved edge to Graph: {self.uuid}')
 
         return result
@@ -1,8 +1,13 @@
+from .cache import CachedEmbedder, EmbeddingCacheConfig
 from .client import EmbedderClient
+from .micro_batch import BatchingEmbedder
 from .openai import OpenAIEmbedder, OpenAIEmbedderConfig
 
 __all__ = [
+    'BatchingEmbedder',
+    'CachedEmbedder',
     'EmbedderClient',
+    'EmbeddingCacheConfig',
     'OpenAIEmbedder',
     'OpenAIEmbedderConfig',
 ]
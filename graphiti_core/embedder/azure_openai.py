@@ -19,7 +19,9 @@ from typing import Any
 
 from openai import AsyncAzureOpenAI
 
-from .client import EmbedderClient
+from .batching import create_batch_chunked
+from .client import EMBEDDING_BATCH_CONCURRENCY, EmbedderClient
+from .openai import MAX_BATCH_SIZE, MAX_BATCH_TOKENS
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +29,15 @@ logger = logging.getLogger(__name__)
 class AzureOpenAIEmbedderClient(EmbedderClient):
     """Wrapper class for AsyncAzureOpenAI that implements the EmbedderClient interface."""
 
-    def __init__(self, azure_client: AsyncAzureOpenAI, model: str = 'text-embedding-3-small'):
+    def __init__(
+        self,
+        azure_client: AsyncAzureOpenAI,
+        model: str = 'text-embedding-3-small',
+        max_concurrent_batches: int = EMBEDDING_BATCH_CONCURRENCY,
+    ):
         self.azure_client = azure_client
         self.model = model
+        self.max_concurrent_batches = max_concurrent_batches
 
     async def create(self, input_data: str | list[str] | Any) -> list[float]:
         """Create embeddings using Azure OpenAI client."""
@@ -51,8 +59,7 @@ class AzureOpenAIEmbedderClient(EmbedderClient):
             logger.error(f'Error in Azure OpenAI embedding: {e}')
             raise
 
-    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
-        """Create batch embeddings using Azure OpenAI client."""
+    async def _create_batch_request(self, input_data_list: list[str]) -> list[list[float]]:
         try:
             response = await self.azure_client.embeddings.create(
                 model=self.model, input=input_data_list
@@ -62,3 +69,13 @@ class AzureOpenAIEmbedderClient(EmbedderClient):
         except Exception as e:
             logger.error(f'Error in Azure OpenAI batch embedding: {e}')
             raise
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        """Create batch embeddings using Azure OpenAI client."""
+        return await create_batch_chunked(
+            self._create_batch_request,
+            input_data_list,
+            max_items=MAX_BATCH_SIZE,
+            max_tokens=MAX_BATCH_TOKENS,
+            max_concurrency=self.max_concurrent_batches,
+        )
@@ -0,0 +1,98 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from graphiti_core.helpers import semaphore_gather
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used to keep requests under provider token limits
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def chunk_inputs(
+    input_data_list: list[str], max_items: int, max_tokens: int | None = None
+) -> list[list[str]]:
+    """
+    Splits inputs into consecutive chunks of at most max_items items and, if set, at most
+    max_tokens estimated tokens. An input that exceeds max_tokens on its own gets its own chunk.
+    """
+    chunks: list[list[str]] = []
+    chunk: list[str] = []
+    chunk_tokens = 0
+    for text in input_data_list:
+        tokens = estimate_tokens(text)
+        if chunk and (
+            len(chunk) >= max_items
+            or (max_tokens is not None and chunk_tokens + tokens > max_tokens)
+        ):
+            chunks.append(chunk)
+            chunk = []
+            chunk_tokens = 0
+
+        chunk.append(text)
+        chunk_tokens += tokens
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+async def create_batch_chunked(
+    embed_chunk: Callable[[list[str]], Coroutine[Any, Any, list[list[float]]]],
+    input_data_list: list[str],
+    max_items: int,
+    max_tokens: int | None = None,
+    max_concurrency: int | None = None,
+) -> list[list[float]]:
+    """
+    Embeds a list of strings using a provider's single-request embed function.
+
+    Identical strings are embedded once, the distinct strings are split into chunks that respect
+    the provider's item and token limits, chunks are dispatched concurrently (bounded by
+    max_concurrency) and the results are returned in input order.
+    """
+    if not input_data_list:
+        return []
+
+    unique_inputs = list(dict.fromkeys(input_data_list))
+    chunks = chunk_inputs(unique_inputs, max_items, max_tokens)
+
+    if len(chunks) > 1:
+        logger.debug(
+            f'Embedding {len(unique_inputs)} unique inputs in {len(chunks)} chunks '
+            f'({len(input_data_list)} requested)'
+        )
+
+    chunk_results: list[list[list[float]]] = await semaphore_gather(
+        *[embed_chunk(chunk) for chunk in chunks], max_coroutines=max_concurrency
+    )
+
+    embeddings: dict[str, list[float]] = {}
+    for chunk, result in zip(chunks, chunk_results, strict=True):
+        if len(result) != len(chunk):
+            raise ValueError(f'Expected {len(chunk)} embeddings for chunk, got {len(result)}')
+        embeddings.update(zip(chunk, result, strict=True))
+
+    return [embeddings[text] for text in input_data_list]
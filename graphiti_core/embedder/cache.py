@@ -0,0 +1,179 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from time import monotonic
+
+from diskcache import Cache
+from pydantic import BaseModel
+
+from .client import EmbedderClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_CACHE_SIZE = 10_000
+DEFAULT_EMBEDDING_CACHE_DIR = './embedding_cache'
+
+
+class EmbeddingCacheConfig(BaseModel):
+    max_size: int = DEFAULT_EMBEDDING_CACHE_SIZE
+    ttl: float | None = None
+    disk_cache: bool = False
+    cache_dir: str = DEFAULT_EMBEDDING_CACHE_DIR
+    disk_size_limit: int | None = None
+
+
+class EmbeddingCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachedEmbedder(EmbedderClient):
+    """
+    Caching wrapper around an EmbedderClient.
+
+    Embeddings are kept in an in-memory LRU and, optionally, in an on-disk diskcache tier.
+    Entries are keyed on the wrapped embedder's model and dimension and the whitespace-normalized
+    input text. Only text inputs are cached; token id inputs are passed through unchanged.
+
+    Example:
+        embedder = CachedEmbedder(OpenAIEmbedder(), EmbeddingCacheConfig(disk_cache=True))
+    """
+
+    def __init__(self, embedder: EmbedderClient, config: EmbeddingCacheConfig | None = None):
+        if config is None:
+            config = EmbeddingCacheConfig()
+
+        self.embedder = embedder
+        self.config = config
+        self.stats = EmbeddingCacheStats()
+        self._memory: OrderedDict[str, tuple[float, list[float]]] = OrderedDict()
+        self._disk: Cache | None = None
+
+        if config.disk_cache:
+            self._disk = (
+                Cache(config.cache_dir, size_limit=config.disk_size_limit)
+                if config.disk_size_limit is not None
+                else Cache(config.cache_dir)
+            )
+
+        embedder_config = getattr(embedder, 'config', None)
+        model = getattr(embedder_config, 'embedding_model', None) or getattr(
+            embedder, 'model', None
+        )
+        self._namespace = (
+            f'{model or embedder.__class__.__name__}:'
+            f'{getattr(embedder_config, "embedding_dim", "")}'
+        )
+
+    def _get_cache_key(self, text: str) -> str:
+        normalized = ' '.join(text.split())
+        return hashlib.sha256(f'{self._namespace}:{normalized}'.encode()).hexdigest()
+
+    def _get(self, key: str) -> list[float] | None:
+        entry = self._memory.get(key)
+        if entry is not None:
+            stored_at, embedding = entry
+            if self.config.ttl is None or monotonic() - stored_at < self.config.ttl:
+                self._memory.move_to_end(key)
+                self.stats.hits += 1
+                return embedding
+            del self._memory[key]
+            self.stats.evictions += 1
+
+        if self._disk is not None:
+            embedding = self._disk.get(key)
+            if embedding is not None:
+                self._set_memory(key, embedding)
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+                return embedding
+
+        self.stats.misses += 1
+        return None
+
+    def _set_memory(self, key: str, embedding: list[float]):
+        self._memory[key] = (monotonic(), embedding)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.config.max_size:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _set(self, key: str, embedding: list[float]):
+        self._set_memory(key, embedding)
+        if self._disk is not None:
+            self._disk.set(key, embedding, expire=self.config.ttl)
+
+    def clear(self):
+        """Remove all cached embeddings from both tiers."""
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        if isinstance(input_data, str):
+            text = input_data
+        elif (
+            isinstance(input_data, list) and len(input_data) == 1 and isinstance(input_data[0], str)
+        ):
+            text = input_data[0]
+        else:
+            return await self.embedder.create(input_data)
+
+        key = self._get_cache_key(text)
+        embedding = self._get(key)
+        if embedding is not None:
+            return embedding
+
+        embedding = await self.embedder.create(input_data)
+        self._set(key, embedding)
+
+        return embedding
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        keys = [self._get_cache_key(text) for text in input_data_list]
+        embeddings: list[list[float] | None] = [self._get(key) for key in keys]
+
+        # Embed each distinct missing key once
+        missing: dict[str, str] = {}
+        for key, text, embedding in zip(keys, input_data_list, embeddings, strict=True):
+            if embedding is None and key not in missing:
+                missing[key] = text
+
+        new_embeddings: dict[str, list[float]] = {}
+        if missing:
+            logger.debug(f'Embedding cache miss for {len(missing)} of {len(keys)} inputs')
+            results = await self.embedder.create_batch(list(missing.values()))
+            for key, embedding in zip(missing, results, strict=True):
+                self._set(key, embedding)
+                new_embeddings[key] = embedding
+
+        return [
+            embedding if embedding is not None else new_embeddings[key]
+            for key, embedding in zip(keys, embeddings, strict=True)
+        ]
@@ -21,10 +21,15 @@ from collections.abc import Iterable
 from pydantic import BaseModel, Field
 
 EMBEDDING_DIM = int(os.getenv('EMBEDDING_DIM', 1024))
+EMBEDDING_BATCH_CONCURRENCY = int(os.getenv('EMBEDDING_BATCH_CONCURRENCY', 4))
 
 
 class EmbedderConfig(BaseModel):
     embedding_dim: int = Field(default=EMBEDDING_DIM, frozen=True)
+    # Overrides the provider's maximum number of inputs per create_batch request
+    batch_size: int | None = None
+    # Maximum number of create_batch requests in flight at once
+    max_concurrent_batches: int = EMBEDDING_BATCH_CONCURRENCY
 
 
 class EmbedderClient(ABC):
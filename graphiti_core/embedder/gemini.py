@@ -33,6 +33,7 @@ else:
 
 from pydantic import Field
 
+from .batching import create_batch_chunked
 from .client import EmbedderClient, EmbedderConfig
 
 logger = logging.getLogger(__name__)
@@ -76,6 +77,9 @@ class GeminiEmbedder(EmbedderClient):
         else:
             self.client = client
 
+        if batch_size is None:
+            batch_size = self.config.batch_size
+
         if batch_size is None and self.config.embedding_model == 'gemini-embedding-001':
             # Gemini API has a limit on the number of instances per request
             # https://cloud.google.com/vertex-ai/generative-ai/docs/model-reference/text-embeddings-api
@@ -110,12 +114,64 @@ class GeminiEmbedder(EmbedderClient):
 
         return result.embeddings[0].values
 
+    async def _create_batch_request(self, batch: list[str]) -> list[list[float]]:
+        try:
+            # Generate embeddings for this batch
+            result = await self.client.aio.models.embed_content(
+                model=self.config.embedding_model or DEFAULT_EMBEDDING_MODEL,
+                contents=batch,  # type: ignore[arg-type]  # mypy fails on broad union type
+                config=types.EmbedContentConfig(output_dimensionality=self.config.embedding_dim),
+            )
+
+            if not result.embeddings or len(result.embeddings) == 0:
+                raise Exception('No embeddings returned')
+
+            # Process embeddings from this batch
+            embeddings = []
+            for embedding in result.embeddings:
+                if not embedding.values:
+                    raise ValueError('Empty embedding values returned')
+                embeddings.append(embedding.values)
+
+            return embeddings
+
+        except Exception as e:
+            # If batch processing fails, fall back to individual processing
+            logger.warning(
+                f'Batch embedding failed for batch of {len(batch)} items, falling back to individual processing: {e}'
+            )
+
+            embeddings = []
+            for item in batch:
+                try:
+                    # Process each item individually
+                    result = await self.client.aio.models.embed_content(
+                        model=self.config.embedding_model or DEFAULT_EMBEDDING_MODEL,
+                        contents=[item],  # type: ignore[arg-type]  # mypy fails on broad union type
+                        config=types.EmbedContentConfig(
+                            output_dimensionality=self.config.embedding_dim
+                        ),
+                    )
+
+                    if not result.embeddings or len(result.embeddings) == 0:
+                        raise ValueError('No embeddings returned from Gemini API')
+                    if not result.embeddings[0].values:
+                        raise ValueError('Empty embedding values returned')
+
+                    embeddings.append(result.embeddings[0].values)
+
+                except Exception as individual_error:
+                    logger.error(f'Failed to embed individual item: {individual_error}')
+                    raise individual_error
+
+            return embeddings
+
     async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
         """
         Create embeddings for a batch of input data using Google's Gemini embedding model.
 
-        This method handles batching to respect the Gemini API's limits on the number
-        of instances that can be processed in a single request.
+        This method splits the inputs into requests that respect the Gemini API's limits on the
+        number of instances per request and sends them concurrently.
 
         Args:
             input_data_list: A list of strings to create embeddings for.
@@ -123,61 +179,9 @@ class GeminiEmbedder(EmbedderClient):
         Returns:
             A list of embedding vectors (each vector is a list of floats).
         """
-        if not input_data_list:
-            return []
-
-        batch_size = self.batch_size
-        all_embeddings = []
-
-        # Process inputs in batches
-        for i in range(0, len(input_data_list), batch_size):
-            batch = input_data_list[i : i + batch_size]
-
-            try:
-                # Generate embeddings for this batch
-                result = await self.client.aio.models.embed_content(
-                    model=self.config.embedding_model or DEFAULT_EMBEDDING_MODEL,
-                    contents=batch,  # type: ignore[arg-type]  # mypy fails on broad union type
-                    config=types.EmbedContentConfig(
-                        output_dimensionality=self.config.embedding_dim
-                    ),
-                )
-
-                if not result.embeddings or len(result.embeddings) == 0:
-                    raise Exception('No embeddings returned')
-
-                # Process embeddings from this batch
-                for embedding in result.embeddings:
-                    if not embedding.values:
-                        raise ValueError('Empty embedding values returned')
-                    all_embeddings.append(embedding.values)
-
-            except Exception as e:
-                # If batch processing fails, fall back to individual processing
-                logger.warning(
-                    f'Batch embedding failed for batch {i // batch_size + 1}, falling back to individual processing: {e}'
-                )
-
-                for item in batch:
-                    try:
-                        # Process each item individually
-                        result = await self.client.aio.models.embed_content(
-                            model=self.config.embedding_model or DEFAULT_EMBEDDING_MODEL,
-                            contents=[item],  # type: ignore[arg-type]  # mypy fails on broad union type
-                            config=types.EmbedContentConfig(
-                                output_dimensionality=self.config.embedding_dim
-                            ),
-                        )
-
-                        if not result.embeddings or len(result.embeddings) == 0:
-                            raise ValueError('No embeddings returned from Gemini API')
-                        if not result.embeddings[0].values:
-                            raise ValueError('Empty embedding values returned')
-
-                        all_embeddings.append(result.embeddings[0].values)
-
-                    except Exception as individual_error:
-                        logger.error(f'Failed to embed individual item: {individual_error}')
-                        raise individual_error
-
-        return all_embeddings
+        return await create_batch_chunked(
+            self._create_batch_request,
+            input_data_list,
+            max_items=self.batch_size,
+            max_concurrency=self.config.max_concurrent_batches,
+        )
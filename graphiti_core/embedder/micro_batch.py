@@ -0,0 +1,123 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+
+from .client import EmbedderClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 5.0
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-text embedding requests into batches.
+
+    Texts submitted within max_wait seconds of the first pending text are embedded together with
+    one call to process_batch. A batch is dispatched early once it reaches max_batch_size texts.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[str]], Awaitable[list[list[float]]]],
+        max_batch_size: int,
+        max_wait: float,
+    ):
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be at least 1')
+
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future[list[float]]]]):
+        try:
+            embeddings = await self.process_batch([text for text, _ in batch])
+            if len(embeddings) != len(batch):
+                raise ValueError(f'Expected {len(batch)} embeddings, got {len(embeddings)}')
+        except Exception as e:
+            logger.error(f'Micro-batch embedding of {len(batch)} texts failed: {e}')
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings, strict=True):
+            if not future.done():
+                future.set_result(embedding)
+
+
+class BatchingEmbedder(EmbedderClient):
+    """
+    Embedder wrapper that coalesces concurrent single-text create() calls.
+
+    Calls arriving within max_wait_ms of each other are sent to the wrapped embedder as one
+    create_batch request of at most max_batch_size texts. Other calls are passed through.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbedderClient,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ):
+        self.embedder = embedder
+        self._batcher = MicroBatcher(embedder.create_batch, max_batch_size, max_wait_ms / 1000)
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        if isinstance(input_data, str):
+            return await self._batcher.submit(input_data)
+        if isinstance(input_data, list) and len(input_data) == 1 and isinstance(input_data[0], str):
+            return await self._batcher.submit(input_data[0])
+
+        return await self.embedder.create(input_data)
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        return await self.embedder.create_batch(input_data_list)
@@ -19,10 +19,15 @@ from collections.abc import Iterable
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 from openai.types import EmbeddingModel
 
+from .batching import create_batch_chunked
 from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'text-embedding-3-small'
 
+# OpenAI embeddings API limits per request
+MAX_BATCH_SIZE = 2048
+MAX_BATCH_TOKENS = 300_000
+
 
 class OpenAIEmbedderConfig(EmbedderConfig):
     embedding_model: EmbeddingModel | str = DEFAULT_EMBEDDING_MODEL
@@ -59,8 +64,17 @@ class OpenAIEmbedder(EmbedderClient):
         )
         return result.data[0].embedding[: self.config.embedding_dim]
 
-    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+    async def _create_batch_request(self, input_data_list: list[str]) -> list[list[float]]:
         result = await self.client.embeddings.create(
             input=input_data_list, model=self.config.embedding_model
         )
         return [embedding.embedding[: self.config.embedding_dim] for embedding in result.data]
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        return await create_batch_chunked(
+            self._create_batch_request,
+            input_data_list,
+            max_items=self.config.batch_size or MAX_BATCH_SIZE,
+            max_tokens=MAX_BATCH_TOKENS,
+            max_concurrency=self.config.max_concurrent_batches,
+        )
@@ -0,0 +1,123 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+else:
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            'sentence-transformers is required for SentenceTransformerEmbedder. '
+            'Install it with: pip install graphiti-core[sentence-transformers]'
+        ) from None
+
+from pydantic import Field
+
+from .batching import create_batch_chunked
+from .client import EmbedderClient, EmbedderConfig
+from .micro_batch import MicroBatcher
+
+DEFAULT_EMBEDDING_MODEL = 'BAAI/bge-m3'
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_MAX_BATCH_WAIT_MS = 5.0
+
+
+class SentenceTransformerEmbedderConfig(EmbedderConfig):
+    embedding_model: str = Field(default=DEFAULT_EMBEDDING_MODEL)
+    device: str | None = None
+    normalize_embeddings: bool = True
+    # How long a create() call waits for other calls to share its forward pass
+    max_batch_wait_ms: float = DEFAULT_MAX_BATCH_WAIT_MS
+
+
+class SentenceTransformerEmbedder(EmbedderClient):
+    """
+    Local Sentence Transformers Embedder Client
+
+    Runs the model on a dedicated worker thread. Concurrent create() calls are coalesced into a
+    single forward pass of up to batch_size texts.
+    """
+
+    def __init__(
+        self,
+        config: SentenceTransformerEmbedderConfig | None = None,
+        model: 'SentenceTransformer | None' = None,
+    ):
+        """
+        Initialize the SentenceTransformerEmbedder.
+
+        Args:
+            config (SentenceTransformerEmbedderConfig | None): The configuration, including model name, device and batching options.
+            model (SentenceTransformer | None): An optional preloaded model. If not provided, the configured model is loaded.
+        """
+        if config is None:
+            config = SentenceTransformerEmbedderConfig()
+        self.config = config
+
+        if model is None:
+            self.model = SentenceTransformer(
+                config.embedding_model, device=config.device, truncate_dim=config.embedding_dim
+            )
+        else:
+            self.model = model
+
+        self.batch_size = config.batch_size or DEFAULT_BATCH_SIZE
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='graphiti-embedder')
+        self._batcher = MicroBatcher(self._encode, self.batch_size, config.max_batch_wait_ms / 1000)
+
+    def _encode_sync(self, texts: list[str]) -> list[list[float]]:
+        embeddings = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=self.config.normalize_embeddings,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return embeddings[:, : self.config.embedding_dim].tolist()
+
+    async def _encode(self, texts: list[str]) -> list[list[float]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._encode_sync, texts)
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        if isinstance(input_data, str):
+            text = input_data
+        elif (
+            isinstance(input_data, list) and len(input_data) > 0 and isinstance(input_data[0], str)
+        ):
+            text = input_data[0]
+        else:
+            raise ValueError('SentenceTransformerEmbedder only supports text input')
+
+        return await self._batcher.submit(text)
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        return await create_batch_chunked(
+            self._encode, input_data_list, max_items=self.batch_size, max_concurrency=1
+        )
+
+    def close(self):
+        """Shut down the worker thread."""
+        self._executor.shutdown(wait=False)
@@ -30,10 +30,15 @@ else:
 
 from pydantic import Field
 
+from .batching import create_batch_chunked
 from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'voyage-3'
 
+# VoyageAI embeddings API limits per request
+MAX_BATCH_SIZE = 1000
+MAX_BATCH_TOKENS = 120_000
+
 
 class VoyageAIEmbedderConfig(EmbedderConfig):
     embedding_model: str = Field(default=DEFAULT_EMBEDDING_MODEL)
@@ -68,9 +73,18 @@ class VoyageAIEmbedder(EmbedderClient):
         result = await self.client.embed(input_list, model=self.config.embedding_model)
         return [float(x) for x in result.embeddings[0][: self.config.embedding_dim]]
 
-    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+    async def _create_batch_request(self, input_data_list: list[str]) -> list[list[float]]:
         result = await self.client.embed(input_data_list, model=self.config.embedding_model)
         return [
             [float(x) for x in embedding[: self.config.embedding_dim]]
             for embedding in result.embeddings
         ]
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        return await create_batch_chunked(
+            self._create_batch_request,
+            input_data_list,
+            max_items=self.config.batch_size or MAX_BATCH_SIZE,
+            max_tokens=MAX_BATCH_TOKENS,
+            max_concurrency=self.config.max_concurrent_batches,
+        )
@@ -150,13 +150,15 @@ def get_vector_cosine_func_query(vec1, vec2, provider: GraphProvider) -> str:
     return f'vector.similarity.cosine({vec1}, {vec2})'
 
 
-def get_relationships_query(name: str, limit: int, provider: GraphProvider) -> str:
+def get_relationships_query(
+    name: str, limit: int, provider: GraphProvider, query: str = '$query'
+) -> str:
     if provider == GraphProvider.FALKORDB:
         label = NEO4J_TO_FALKORDB_MAPPING[name]
-        return f"CALL db.idx.fulltext.queryRelationships('{label}', $query)"
+        return f"CALL db.idx.fulltext.queryRelationships('{label}', {query})"
 
     if provider == GraphProvider.KUZU:
         label = INDEX_TO_LABEL_KUZU_MAPPING[name]
-        return f"CALL QUERY_FTS_INDEX('{label}', '{name}', cast($query AS STRING), TOP := $limit)"
+        return f"CALL QUERY_FTS_INDEX('{label}', '{name}', cast({query} AS STRING), TOP := $limit)"
 
-    return f'CALL db.index.fulltext.queryRelationships("{name}", $query, {{limit: $limit}})'
+    return f'CALL db.index.fulltext.queryRelationships("{name}", {query}, {{limit: $limit}})'
@@ -14,7 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator
 from datetime import datetime
 from time import time
 
@@ -35,6 +38,7 @@ from graphiti_core.edges import (
     create_entity_edge_embeddings,
 )
 from graphiti_core.embedder import EmbedderClient, OpenAIEmbedder
+from graphiti_core.embedder.micro_batch import DEFAULT_MAX_BATCH_SIZE, BatchingEmbedder
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import (
     get_default_group_id,
@@ -52,6 +56,7 @@ from graphiti_core.nodes import (
     create_entity_node_embeddings,
 )
 from graphiti_core.search.search import SearchConfig, search
+from graphiti_core.search.search_cache import SearchCache, SearchCacheConfig
 from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT, SearchResults
 from graphiti_core.search.search_config_recipes import (
     COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
@@ -76,8 +81,10 @@ from graphiti_core.utils.bulk_utils import (
 )
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.community_operations import (
+    CommunitySummaryCache,
     build_communities,
     remove_communities,
+    update_communities_incrementally,
     update_community,
 )
 from graphiti_core.utils.maintenance.edge_operations import (
@@ -88,6 +95,9 @@ from graphiti_core.utils.maintenance.edge_operations import (
 )
 from graphiti_core.utils.maintenance.graph_data_operations import (
     EPISODE_WINDOW_LEN,
+    PREVIOUS_EPISODES_TOKEN_BUDGET,
+    fit_episodes_to_token_budget,
+    merge_pending_episodes,
     retrieve_episodes,
 )
 from graphiti_core.utils.maintenance.node_operations import (
@@ -101,6 +111,9 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+# Number of episodes whose extraction may run ahead of resolution in ingest_stream
+DEFAULT_INGEST_PIPELINE_DEPTH = 4
+
 
 class AddEpisodeResults(BaseModel):
     episode: EpisodicNode
@@ -139,6 +152,11 @@ class Graphiti:
         max_coroutines: int | None = None,
         tracer: Tracer | None = None,
         trace_span_prefix: str = 'graphiti',
+        query_embedding_batch_wait_ms: float | None = None,
+        query_embedding_max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        search_cache: SearchCacheConfig | None = None,
+        edge_resolution_batch_size: int | None = None,
+        previous_episodes_token_budget: int | None = PREVIOUS_EPISODES_TOKEN_BUDGET,
     ):
         """
         Initialize a Graphiti instance.
@@ -175,6 +193,22 @@ class Graphiti:
             An OpenTelemetry tracer instance for distributed tracing. If not provided, tracing is disabled (no-op).
         trace_span_prefix : str, optional
             Prefix to prepend to all span names. Defaults to 'graphiti'.
+        query_embedding_batch_wait_ms : float | None, optional
+            If set, search query embeddings requested concurrently within this many milliseconds
+            are sent to the embedder as a single create_batch request. Disabled by default.
+        query_embedding_max_batch_size : int, optional
+            The maximum number of search queries embedded in one batched request.
+        search_cache : SearchCacheConfig | None, optional
+            If set, results of search() and search_() are cached with TTL and LRU eviction and
+            invalidated per group_id whenever this instance writes to that group. Disabled by
+            default.
+        edge_resolution_batch_size : int | None, optional
+            If set, an episode's extracted edges are checked for duplicates and contradictions
+            up to this many per LLM call instead of one call per edge. Disabled by default.
+        previous_episodes_token_budget : int | None, optional
+            The estimated number of tokens of previous episode content given to the extraction
+            and resolution prompts of an episode. Older episodes are truncated or dropped to fit.
+            None passes previous episodes in full.
 
         Returns
         -------
@@ -222,11 +256,27 @@ class Graphiti:
 
         # Set tracer on clients
         self.llm_client.set_tracer(self.tracer)
+        self.driver.set_tracer(self.tracer)
+
+        self.search_cache = SearchCache(search_cache) if search_cache is not None else None
+        self.edge_resolution_batch_size = edge_resolution_batch_size
+        self.previous_episodes_token_budget = previous_episodes_token_budget
+        # Intermediate community summaries, reused by later community builds of unchanged members
+        self.community_summary_cache = CommunitySummaryCache()
+
+        query_embedder = (
+            BatchingEmbedder(
+                self.embedder, query_embedding_max_batch_size, query_embedding_batch_wait_ms
+            )
+            if query_embedding_batch_wait_ms is not None
+            else None
+        )
 
         self.clients = GraphitiClients(
             driver=self.driver,
             llm_client=self.llm_client,
             embedder=self.embedder,
+            query_embedder=query_embedder,
             cross_encoder=self.cross_encoder,
             tracer=self.tracer,
         )
@@ -352,29 +402,7 @@ class Graphiti:
         """
         await self.driver.build_indices_and_constraints(delete_existing)
 
-    async def _extract_and_resolve_nodes(
-        self,
-        episode: EpisodicNode,
-        previous_episodes: list[EpisodicNode],
-        entity_types: dict[str, type[BaseModel]] | None,
-        excluded_entity_types: list[str] | None,
-    ) -> tuple[list[EntityNode], dict[str, str], list[tuple[EntityNode, EntityNode]]]:
-        """Extract nodes from episode and resolve against existing graph."""
-        extracted_nodes = await extract_nodes(
-            self.clients, episode, previous_episodes, entity_types, excluded_entity_types
-        )
-
-        nodes, uuid_map, duplicates = await resolve_extracted_nodes(
-            self.clients,
-            extracted_nodes,
-            episode,
-            previous_episodes,
-            entity_types,
-        )
-
-        return nodes, uuid_map, duplicates
-
-    async def _extract_and_resolve_edges(
+    async def _extract_edges_stage(
         self,
         episode: EpisodicNode,
         extracted_nodes: list[EntityNode],
@@ -382,11 +410,9 @@ class Graphiti:
         edge_type_map: dict[tuple[str, str], list[str]],
         group_id: str,
         edge_types: dict[str, type[BaseModel]] | None,
-        nodes: list[EntityNode],
-        uuid_map: dict[str, str],
-    ) -> tuple[list[EntityEdge], list[EntityEdge]]:
-        """Extract edges from episode and resolve against existing graph."""
-        extracted_edges = await extract_edges(
+    ) -> list[EntityEdge]:
+        """Extract edges from episode. Only depends on the episode and its context."""
+        return await extract_edges(
             self.clients,
             episode,
             extracted_nodes,
@@ -396,6 +422,16 @@ class Graphiti:
             edge_types,
         )
 
+    async def _resolve_edges_stage(
+        self,
+        episode: EpisodicNode,
+        extracted_edges: list[EntityEdge],
+        edge_type_map: dict[tuple[str, str], list[str]],
+        edge_types: dict[str, type[BaseModel]] | None,
+        nodes: list[EntityNode],
+        uuid_map: dict[str, str],
+    ) -> tuple[list[EntityEdge], list[EntityEdge]]:
+        """Resolve extracted edges against existing graph."""
         edges = resolve_edge_pointers(extracted_edges, uuid_map)
 
         resolved_edges, invalidated_edges = await resolve_extracted_edges(
@@ -405,6 +441,7 @@ class Graphiti:
             nodes,
             edge_types or {},
             edge_type_map,
+            self.edge_resolution_batch_size,
         )
 
         return resolved_edges, invalidated_edges
@@ -431,6 +468,8 @@ class Graphiti:
             entity_edges,
             self.embedder,
         )
+        self.clients.entity_indexes.add_nodes(nodes)
+        self._invalidate_search_cache([episode.group_id])
 
         return episodic_edges, episode
 
@@ -560,6 +599,7 @@ class Graphiti:
                     final_hydrated_nodes,
                     edge_types or {},
                     edge_type_map,
+                    self.edge_resolution_batch_size,
                 )
                 for episode in episodes
             ]
@@ -675,7 +715,8 @@ class Graphiti:
         It is recommended to run this method as a background process, such as in a queue.
         It's important that each episode is added sequentially and awaited before adding
         the next one. For web applications, consider using FastAPI's background tasks
-        or a dedicated task queue like Celery for this purpose.
+        or a dedicated task queue like Celery for this purpose. To ingest a sequence of
+        episodes for one group with higher throughput, use `ingest_stream`.
 
         Example using FastAPI background tasks:
             @app.post("/add_episode")
@@ -713,6 +754,10 @@ class Graphiti:
                     if previous_episode_uuids is None
                     else await EpisodicNode.get_by_uuids(self.driver, previous_episode_uuids)
                 )
+                # Assembled once and shared by every prompt of this episode
+                previous_episodes = fit_episodes_to_token_budget(
+                    previous_episodes, self.previous_episodes_token_budget
+                )
 
                 # Get or create episode
                 episode = (
@@ -737,55 +782,29 @@ class Graphiti:
                     else {('Entity', 'Entity'): []}
                 )
 
-                # Extract and resolve nodes
-                extracted_nodes = await extract_nodes(
-                    self.clients, episode, previous_episodes, entity_types, excluded_entity_types
-                )
-
-                nodes, uuid_map, _ = await resolve_extracted_nodes(
-                    self.clients,
-                    extracted_nodes,
+                # Extract nodes and edges
+                extracted_nodes, extracted_edges = await self._extract_episode_stage(
                     episode,
                     previous_episodes,
                     entity_types,
+                    excluded_entity_types,
+                    edge_types,
+                    edge_type_map or edge_type_map_default,
                 )
 
-                # Extract and resolve edges in parallel with attribute extraction
-                resolved_edges, invalidated_edges = await self._extract_and_resolve_edges(
+                # Resolve against the graph, extract attributes and save
+                result, invalidated_edges = await self._resolve_episode_stage(
                     episode,
-                    extracted_nodes,
                     previous_episodes,
-                    edge_type_map or edge_type_map_default,
-                    group_id,
+                    extracted_nodes,
+                    extracted_edges,
+                    entity_types,
                     edge_types,
-                    nodes,
-                    uuid_map,
-                )
-
-                # Extract node attributes
-                hydrated_nodes = await extract_attributes_from_nodes(
-                    self.clients, nodes, episode, previous_episodes, entity_types
-                )
-
-                entity_edges = resolved_edges + invalidated_edges
-
-                # Process and save episode data
-                episodic_edges, episode = await self._process_episode_data(
-                    episode, hydrated_nodes, entity_edges, now
+                    edge_type_map or edge_type_map_default,
+                    update_communities,
+                    now,
                 )
 
-                # Update communities if requested
-                communities = []
-                community_edges = []
-                if update_communities:
-                    communities, community_edges = await semaphore_gather(
-                        *[
-                            update_community(self.driver, self.llm_client, self.embedder, node)
-                            for node in nodes
-                        ],
-                        max_coroutines=self.max_coroutines,
-                    )
-
                 end = time()
 
                 # Add span attributes
@@ -795,28 +814,21 @@ class Graphiti:
                         'episode.source': source.value,
                         'episode.reference_time': reference_time.isoformat(),
                         'group_id': group_id,
-                        'node.count': len(hydrated_nodes),
-                        'edge.count': len(entity_edges),
+                        'node.count': len(result.nodes),
+                        'edge.count': len(result.edges),
                         'edge.invalidated_count': len(invalidated_edges),
                         'previous_episodes.count': len(previous_episodes),
                         'entity_types.count': len(entity_types) if entity_types else 0,
                         'edge_types.count': len(edge_types) if edge_types else 0,
                         'update_communities': update_communities,
-                        'communities.count': len(communities) if update_communities else 0,
+                        'communities.count': len(result.communities),
                         'duration_ms': (end - start) * 1000,
                     }
                 )
 
                 logger.info(f'Completed add_episode in {(end - start) * 1000} ms')
 
-                return AddEpisodeResults(
-                    episode=episode,
-                    episodic_edges=episodic_edges,
-                    nodes=hydrated_nodes,
-                    edges=entity_edges,
-                    communities=communities,
-                    community_edges=community_edges,
-                )
+                return result
 
             except Exception as e:
                 span.set_status('error', str(e))
@@ -919,7 +931,17 @@ class Graphiti:
                 )
 
                 # Get previous episode context for each episode
-                episode_context = await retrieve_previous_episodes_bulk(self.driver, episodes)
+                episode_context = [
+                    (
+                        episode,
+                        fit_episodes_to_token_budget(
+                            previous_episodes, self.previous_episodes_token_budget
+                        ),
+                    )
+                    for episode, previous_episodes in await retrieve_previous_episodes_bulk(
+                        self.driver, episodes
+                    )
+                ]
 
                 # Extract and dedupe nodes and edges
                 (
@@ -981,6 +1003,8 @@ class Graphiti:
                     resolved_edges + invalidated_edges,
                     self.embedder,
                 )
+                self.clients.entity_indexes.add_nodes(final_hydrated_nodes)
+                self._invalidate_search_cache([group_id])
 
                 end = time()
 
@@ -1010,9 +1034,293 @@ class Graphiti:
                 bulk_span.record_exception(e)
                 raise e
 
+    async def _extract_episode_stage(
+        self,
+        episode: EpisodicNode,
+        previous_episodes: list[EpisodicNode],
+        entity_types: dict[str, type[BaseModel]] | None,
+        excluded_entity_types: list[str] | None,
+        edge_types: dict[str, type[BaseModel]] | None,
+        edge_type_map: dict[tuple[str, str], list[str]],
+    ) -> tuple[list[EntityNode], list[EntityEdge]]:
+        """Run LLM extraction for an episode without touching resolved state."""
+        extracted_nodes = await extract_nodes(
+            self.clients, episode, previous_episodes, entity_types, excluded_entity_types
+        )
+        extracted_edges = await self._extract_edges_stage(
+            episode,
+            extracted_nodes,
+            previous_episodes,
+            edge_type_map,
+            episode.group_id,
+            edge_types,
+        )
+
+        return extracted_nodes, extracted_edges
+
+    async def _resolve_episode_stage(
+        self,
+        episode: EpisodicNode,
+        previous_episodes: list[EpisodicNode],
+        extracted_nodes: list[EntityNode],
+        extracted_edges: list[EntityEdge],
+        entity_types: dict[str, type[BaseModel]] | None,
+        edge_types: dict[str, type[BaseModel]] | None,
+        edge_type_map: dict[tuple[str, str], list[str]],
+        update_communities: bool,
+        now: datetime,
+    ) -> tuple[AddEpisodeResults, list[EntityEdge]]:
+        """
+        Resolve extracted data against the graph and persist it. Must run in episode order.
+
+        Returns the episode results together with the edges invalidated by this episode.
+        """
+        nodes, uuid_map, _ = await resolve_extracted_nodes(
+            self.clients,
+            extracted_nodes,
+            episode,
+            previous_episodes,
+            entity_types,
+        )
+
+        resolved_edges, invalidated_edges = await self._resolve_edges_stage(
+            episode, extracted_edges, edge_type_map, edge_types, nodes, uuid_map
+        )
+
+        hydrated_nodes = await extract_attributes_from_nodes(
+            self.clients, nodes, episode, previous_episodes, entity_types
+        )
+
+        entity_edges = resolved_edges + invalidated_edges
+
+        episodic_edges, episode = await self._process_episode_data(
+            episode, hydrated_nodes, entity_edges, now
+        )
+
+        communities = []
+        community_edges = []
+        if update_communities:
+            communities, community_edges = await semaphore_gather(
+                *[
+                    update_community(self.driver, self.llm_client, self.embedder, node)
+                    for node in nodes
+                ],
+                max_coroutines=self.max_coroutines,
+            )
+
+        return (
+            AddEpisodeResults(
+                episode=episode,
+                episodic_edges=episodic_edges,
+                nodes=hydrated_nodes,
+                edges=entity_edges,
+                communities=communities,
+                community_edges=community_edges,
+            ),
+            invalidated_edges,
+        )
+
+    async def ingest_stream(
+        self,
+        episodes: AsyncIterable[RawEpisode],
+        group_id: str | None = None,
+        update_communities: bool = False,
+        entity_types: dict[str, type[BaseModel]] | None = None,
+        excluded_entity_types: list[str] | None = None,
+        edge_types: dict[str, type[BaseModel]] | None = None,
+        edge_type_map: dict[tuple[str, str], list[str]] | None = None,
+        pipeline_depth: int = DEFAULT_INGEST_PIPELINE_DEPTH,
+    ) -> AsyncIterator[AddEpisodeResults]:
+        """
+        Process a stream of episodes with pipelined extraction and update the graph.
+
+        This method produces the same graph as awaiting `add_episode` for each episode in
+        order, but overlaps the LLM-bound extraction of upcoming episodes with the resolution
+        and persistence of the current one.
+
+        Parameters
+        ----------
+        episodes : AsyncIterable[RawEpisode]
+            The episodes to process, in the order they should be applied to the graph.
+        group_id : str | None
+            An id for the graph partition the episodes are a part of.
+        update_communities : bool
+            Optional. Whether to update communities with new node information
+        entity_types : dict[str, BaseModel] | None
+            Optional. Dictionary mapping entity type names to their Pydantic model definitions.
+        excluded_entity_types : list[str] | None
+            Optional. List of entity type names to exclude from the graph.
+        edge_types : dict[str, BaseModel] | None
+            Optional. Dictionary mapping edge type names to their Pydantic model definitions.
+        edge_type_map : dict[tuple[str, str], list[str]] | None
+            Optional. Mapping of (source, target) entity types to allowed edge types.
+        pipeline_depth : int
+            Optional. The maximum number of episodes extracted ahead of resolution.
+
+        Returns
+        -------
+        AsyncIterator[AddEpisodeResults]
+            The results for each episode, yielded in input order once the episode is saved.
+
+        Notes
+        -----
+        Extraction (node and edge extraction) only depends on the episode and its previous
+        episodes, so it runs concurrently for up to `pipeline_depth` episodes. Episodes that
+        are still in flight are merged into the previous episode context of later episodes.
+
+        Resolution (node dedupe, edge dedupe and invalidation, attribute extraction and saving)
+        reads and writes the graph, so it runs strictly one episode at a time in input order.
+        This preserves the ordering guarantees `add_episode` relies on for dedupe and
+        invalidation within the group.
+
+        Episodes are only pulled from the input as results are consumed. If the consumer stops
+        iterating, extraction tasks that are still running are cancelled.
+
+        Example:
+            async for result in graphiti.ingest_stream(episode_source(), group_id='user-1'):
+                logger.info(f'Saved episode {result.episode.uuid}')
+        """
+        if pipeline_depth < 1:
+            raise ValueError('pipeline_depth must be at least 1')
+
+        validate_entity_types(entity_types)
+        validate_excluded_entity_types(excluded_entity_types, entity_types)
+
+        if group_id is None:
+            # if group_id is None, use the default group id by the provider
+            group_id = get_default_group_id(self.driver.provider)
+        else:
+            validate_group_id(group_id)
+            if group_id != self.driver._database:
+                # if group_id is provided, use it as the database name
+                self.driver = self.driver.clone(database=group_id)
+                self.clients.driver = self.driver
+
+        edge_type_map_default = (
+            {('Entity', 'Entity'): list(edge_types.keys())}
+            if edge_types is not None
+            else {('Entity', 'Entity'): []}
+        )
+        resolved_edge_type_map = edge_type_map or edge_type_map_default
+
+        pending: deque[
+            tuple[
+                EpisodicNode,
+                asyncio.Task[tuple[list[EpisodicNode], list[EntityNode], list[EntityEdge]]],
+            ]
+        ] = deque()
+        # Episodes that were handed to the pipeline but may not be saved yet
+        recent_episodes: list[EpisodicNode] = []
+
+        async def extract(
+            episode: EpisodicNode, pending_episodes: list[EpisodicNode]
+        ) -> tuple[list[EpisodicNode], list[EntityNode], list[EntityEdge]]:
+            previous_episodes = await self.retrieve_episodes(
+                episode.valid_at,
+                last_n=RELEVANT_SCHEMA_LIMIT,
+                group_ids=[episode.group_id],
+                source=episode.source,
+            )
+            previous_episodes = merge_pending_episodes(
+                previous_episodes,
+                pending_episodes,
+                episode.valid_at,
+                last_n=RELEVANT_SCHEMA_LIMIT,
+                source=episode.source,
+            )
+            previous_episodes = fit_episodes_to_token_budget(
+                previous_episodes, self.previous_episodes_token_budget
+            )
+
+            extracted_nodes, extracted_edges = await self._extract_episode_stage(
+                episode,
+                previous_episodes,
+                entity_types,
+                excluded_entity_types,
+                edge_types,
+                resolved_edge_type_map,
+            )
+
+            return previous_episodes, extracted_nodes, extracted_edges
+
+        async def resolve_next() -> AddEpisodeResults:
+            episode, extraction = pending.popleft()
+            previous_episodes, extracted_nodes, extracted_edges = await extraction
+
+            with self.tracer.start_span('ingest_stream.episode') as span:
+                try:
+                    start = time()
+                    result, invalidated_edges = await self._resolve_episode_stage(
+                        episode,
+                        previous_episodes,
+                        extracted_nodes,
+                        extracted_edges,
+                        entity_types,
+                        edge_types,
+                        resolved_edge_type_map,
+                        update_communities,
+                        utc_now(),
+                    )
+                    end = time()
+
+                    span.add_attributes(
+                        {
+                            'episode.uuid': episode.uuid,
+                            'episode.source': episode.source.value,
+                            'group_id': episode.group_id,
+                            'node.count': len(result.nodes),
+                            'edge.count': len(result.edges),
+                            'edge.invalidated_count': len(invalidated_edges),
+                            'pipeline.pending_count': len(pending),
+                            'duration_ms': (end - start) * 1000,
+                        }
+                    )
+                    logger.info(f'Completed ingest_stream episode in {(end - start) * 1000} ms')
+
+                    return result
+                except Exception as e:
+                    span.set_status('error', str(e))
+                    span.record_exception(e)
+                    raise e
+
+        try:
+            async for raw_episode in episodes:
+                episode = (
+                    await EpisodicNode.get_by_uuid(self.driver, raw_episode.uuid)
+                    if raw_episode.uuid is not None
+                    else EpisodicNode(
+                        name=raw_episode.name,
+                        group_id=group_id,
+                        labels=[],
+                        source=raw_episode.source,
+                        content=raw_episode.content,
+                        source_description=raw_episode.source_description,
+                        created_at=utc_now(),
+                        valid_at=raw_episode.reference_time,
+                    )
+                )
+
+                extraction = asyncio.create_task(extract(episode, list(recent_episodes)))
+                pending.append((episode, extraction))
+                recent_episodes = (recent_episodes + [episode])[-RELEVANT_SCHEMA_LIMIT:]
+
+                if len(pending) >= pipeline_depth:
+                    yield await resolve_next()
+
+            while pending:
+                yield await resolve_next()
+        finally:
+            for _, extraction in pending:
+                extraction.cancel()
+            # Retrieve the outcome of every task so failed or cancelled extractions are not leaked
+            await asyncio.gather(*(extraction for _, extraction in pending), return_exceptions=True)
+
     @handle_multiple_group_ids
     async def build_communities(
-        self, group_ids: list[str] | None = None, driver: GraphDriver | None = None
+        self,
+        group_ids: list[str] | None = None,
+        driver: GraphDriver | None = None,
+        incremental: bool = False,
     ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
         """
         Use a community clustering algorithm to find communities of nodes. Create community nodes summarising
@@ -1020,16 +1328,25 @@ class Graphiti:
         ----------
         group_ids : list[str] | None
             Optional. Create communities only for the listed group_ids. If blank the entire graph will be used.
+        incremental : bool
+            Optional. Keep the existing communities and only re-cluster entities touched since their
+            membership was last written, re-summarizing communities whose membership changed
+            substantially. Returns only the communities and memberships that were written.
         """
         if driver is None:
             driver = self.clients.driver
 
-        # Clear existing communities
-        await remove_communities(driver)
+        if incremental:
+            community_nodes, community_edges = await update_communities_incrementally(
+                driver, self.llm_client, group_ids, summary_cache=self.community_summary_cache
+            )
+        else:
+            # Clear existing communities
+            await remove_communities(driver)
 
-        community_nodes, community_edges = await build_communities(
-            driver, self.llm_client, group_ids
-        )
+            community_nodes, community_edges = await build_communities(
+                driver, self.llm_client, group_ids, self.community_summary_cache
+            )
 
         await semaphore_gather(
             *[node.generate_name_embedding(self.embedder) for node in community_nodes],
@@ -1044,6 +1361,11 @@ class Graphiti:
             *[edge.save(driver) for edge in community_edges],
             max_coroutines=self.max_coroutines,
         )
+        # A full rebuild clears every group, so cached results for all groups are stale
+        if incremental and group_ids is not None:
+            self._invalidate_search_cache(group_ids)
+        elif self.search_cache is not None:
+            self.search_cache.clear()
 
         return community_nodes, community_edges
 
@@ -1096,14 +1418,13 @@ class Graphiti:
         search_config.limit = num_results
 
         edges = (
-            await search(
-                self.clients,
+            await self._cached_search(
                 query,
                 group_ids,
                 search_config,
                 search_filter if search_filter is not None else SearchFilters(),
-                driver=driver,
                 center_node_uuid=center_node_uuid,
+                driver=driver,
             )
         ).edges
 
@@ -1141,8 +1462,7 @@ class Graphiti:
         For different config recipes refer to search/search_config_recipes.
         """
 
-        return await search(
-            self.clients,
+        return await self._cached_search(
             query,
             group_ids,
             config,
@@ -1152,6 +1472,60 @@ class Graphiti:
             driver=driver,
         )
 
+    async def _cached_search(
+        self,
+        query: str,
+        group_ids: list[str] | None,
+        config: SearchConfig,
+        search_filter: SearchFilters,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        driver: GraphDriver | None = None,
+    ) -> SearchResults:
+        if self.search_cache is None:
+            return await search(
+                self.clients,
+                query,
+                group_ids,
+                config,
+                search_filter,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                driver=driver,
+            )
+
+        key = SearchCache.make_key(
+            query,
+            config,
+            search_filter,
+            group_ids,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            getattr(driver or self.clients.driver, '_database', None),
+        )
+        cached = self.search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        generation = self.search_cache.generation
+        results = await search(
+            self.clients,
+            query,
+            group_ids,
+            config,
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            driver=driver,
+        )
+        self.search_cache.set(key, group_ids, results, generation)
+
+        return results
+
+    def _invalidate_search_cache(self, group_ids: list[str]):
+        if self.search_cache is not None:
+            self.search_cache.invalidate_groups(group_ids)
+
     async def get_nodes_and_edges_by_episode(self, episode_uuids: list[str]) -> SearchResults:
         episodes = await EpisodicNode.get_by_uuids(self.driver, episode_uuids)
 
@@ -1230,6 +1604,10 @@ class Graphiti:
         await create_entity_node_embeddings(self.embedder, nodes)
 
         await add_nodes_and_edges_bulk(self.driver, [], [], nodes, edges, self.embedder)
+        self.clients.entity_indexes.add_nodes(nodes)
+        self._invalidate_search_cache(
+            [node.group_id for node in nodes] + [edge.group_id for edge in edges]
+        )
         return AddTripletResults(edges=edges, nodes=nodes)
 
     async def remove_episode(self, episode_uuid: str):
@@ -1259,5 +1637,7 @@ class Graphiti:
 
         await Edge.delete_by_uuids(self.driver, [edge.uuid for edge in edges_to_delete])
         await Node.delete_by_uuids(self.driver, [node.uuid for node in nodes_to_delete])
+        self.clients.entity_indexes.remove_nodes(node.uuid for node in nodes_to_delete)
 
         await episode.delete(self.driver)
+        self._invalidate_search_cache([episode.group_id])
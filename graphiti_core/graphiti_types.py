@@ -14,7 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from pydantic import BaseModel, ConfigDict
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from graphiti_core.cross_encoder import CrossEncoderClient
 from graphiti_core.driver.driver import GraphDriver
@@ -22,12 +24,29 @@ from graphiti_core.embedder import EmbedderClient
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.tracer import Tracer
 
+if TYPE_CHECKING:
+    from graphiti_core.utils.maintenance.dedup_helpers import EntityIndexStore
+
 
 class GraphitiClients(BaseModel):
     driver: GraphDriver
     llm_client: LLMClient
     embedder: EmbedderClient
+    # Optional embedder used for search queries, e.g. a BatchingEmbedder wrapping `embedder`
+    query_embedder: EmbedderClient | None = None
     cross_encoder: CrossEncoderClient
     tracer: Tracer
 
+    _entity_indexes: 'EntityIndexStore | None' = PrivateAttr(default=None)
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @property
+    def entity_indexes(self) -> 'EntityIndexStore':
+        """Per-group entity name indexes reused by entity dedupe across episodes."""
+        if self._entity_indexes is None:
+            # imported lazily because the maintenance package depends on this module
+            from graphiti_core.utils.maintenance.dedup_helpers import EntityIndexStore
+
+            self._entity_indexes = EntityIndexStore()
+        return self._entity_indexes
@@ -30,12 +30,13 @@ EPISODIC_EDGE_SAVE = """
 def get_episodic_edge_save_bulk_query(provider: GraphProvider) -> str:
     if provider == GraphProvider.KUZU:
         return """
-            MATCH (episode:Episodic {uuid: $source_node_uuid})
-            MATCH (node:Entity {uuid: $target_node_uuid})
-            MERGE (episode)-[e:MENTIONS {uuid: $uuid}]->(node)
+            UNWIND $episodic_edges AS edge
+            MATCH (episode:Episodic {uuid: edge.source_node_uuid})
+            MATCH (node:Entity {uuid: edge.target_node_uuid})
+            MERGE (episode)-[e:MENTIONS {uuid: edge.uuid}]->(node)
             SET
-                e.group_id = $group_id,
-                e.created_at = $created_at
+                e.group_id = edge.group_id,
+                e.created_at = CAST(edge.created_at AS TIMESTAMP)
             RETURN e.uuid AS uuid
         """
 
@@ -146,21 +147,24 @@ def get_entity_edge_save_bulk_query(provider: GraphProvider, has_aoss: bool = Fa
                 RETURN edge.uuid AS uuid
             """
         case GraphProvider.KUZU:
+            # Kuzu infers STRING for struct fields that are null in every row, so list and
+            # nullable fields are cast explicitly
             return """
-                MATCH (source:Entity {uuid: $source_node_uuid})
-                MATCH (target:Entity {uuid: $target_node_uuid})
-                MERGE (source)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: $uuid})-[:RELATES_TO]->(target)
+                UNWIND $entity_edges AS edge
+                MATCH (source:Entity {uuid: edge.source_node_uuid})
+                MATCH (target:Entity {uuid: edge.target_node_uuid})
+                MERGE (source)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: edge.uuid})-[:RELATES_TO]->(target)
                 SET
-                    e.group_id = $group_id,
-                    e.created_at = $created_at,
-                    e.name = $name,
-                    e.fact = $fact,
-                    e.fact_embedding = $fact_embedding,
-                    e.episodes = $episodes,
-                    e.expired_at = $expired_at,
-                    e.valid_at = $valid_at,
-                    e.invalid_at = $invalid_at,
-                    e.attributes = $attributes
+                    e.group_id = edge.group_id,
+                    e.created_at = CAST(edge.created_at AS TIMESTAMP),
+                    e.name = edge.name,
+                    e.fact = edge.fact,
+                    e.fact_embedding = CAST(edge.fact_embedding AS FLOAT[]),
+                    e.episodes = CAST(edge.episodes AS STRING[]),
+                    e.expired_at = CAST(edge.expired_at AS TIMESTAMP),
+                    e.valid_at = CAST(edge.valid_at AS TIMESTAMP),
+                    e.invalid_at = CAST(edge.invalid_at AS TIMESTAMP),
+                    e.attributes = edge.attributes
                 RETURN e.uuid AS uuid
             """
         case _:
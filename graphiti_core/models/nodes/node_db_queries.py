@@ -70,17 +70,20 @@ def get_episode_node_save_bulk_query(provider: GraphProvider) -> str:
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.KUZU:
+            # Kuzu infers STRING for struct fields that are null in every row, so list and
+            # nullable fields are cast explicitly
             return """
-                MERGE (n:Episodic {uuid: $uuid})
+                UNWIND $episodes AS episode
+                MERGE (n:Episodic {uuid: episode.uuid})
                 SET
-                    n.name = $name,
-                    n.group_id = $group_id,
-                    n.created_at = $created_at,
-                    n.source = $source,
-                    n.source_description = $source_description,
-                    n.content = $content,
-                    n.valid_at = $valid_at,
-                    n.entity_edges = $entity_edges
+                    n.name = episode.name,
+                    n.group_id = episode.group_id,
+                    n.created_at = CAST(episode.created_at AS TIMESTAMP),
+                    n.source = episode.source,
+                    n.source_description = episode.source_description,
+                    n.content = episode.content,
+                    n.valid_at = CAST(episode.valid_at AS TIMESTAMP),
+                    n.entity_edges = CAST(episode.entity_edges AS STRING[])
                 RETURN n.uuid AS uuid
             """
         case GraphProvider.FALKORDB:
@@ -222,15 +225,16 @@ def get_entity_node_save_bulk_query(
             return queries
         case GraphProvider.KUZU:
             return """
-                MERGE (n:Entity {uuid: $uuid})
+                UNWIND $nodes AS node
+                MERGE (n:Entity {uuid: node.uuid})
                 SET
-                    n.name = $name,
-                    n.group_id = $group_id,
-                    n.labels = $labels,
-                    n.created_at = $created_at,
-                    n.name_embedding = $name_embedding,
-                    n.summary = $summary,
-                    n.attributes = $attributes
+                    n.name = node.name,
+                    n.group_id = node.group_id,
+                    n.labels = CAST(node.labels AS STRING[]),
+                    n.created_at = CAST(node.created_at AS TIMESTAMP),
+                    n.name_embedding = CAST(node.name_embedding AS FLOAT[]),
+                    n.summary = node.summary,
+                    n.attributes = node.attributes
                 RETURN n.uuid AS uuid
             """
         case _:  # Neo4j
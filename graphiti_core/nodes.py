@@ -17,6 +17,7 @@ limitations under the License.
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from enum import Enum
 from time import time
@@ -24,7 +25,7 @@ from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
-from typing_extensions import LiteralString
+from typing_extensions import LiteralString, Self
 
 from graphiti_core.driver.driver import (
     GraphDriver,
@@ -47,6 +48,8 @@ from graphiti_core.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 1000
+
 
 class EpisodeType(Enum):
     """
@@ -147,6 +150,9 @@ class Node(BaseModel, ABC):
                         uuid=self.uuid,
                     )
 
+        if driver.vector_indexes is not None:
+            driver.vector_indexes.remove([self.uuid])
+
         logger.debug(f'Deleted Node: {self.uuid}')
 
     def __hash__(self):
@@ -213,6 +219,9 @@ class Node(BaseModel, ABC):
                         group_id=group_id,
                     )
 
+        if driver.vector_indexes is not None:
+            driver.vector_indexes.remove_groups([group_id])
+
     @classmethod
     async def delete_by_uuids(cls, driver: GraphDriver, uuids: list[str], batch_size: int = 100):
         if driver.graph_operations_interface:
@@ -285,12 +294,49 @@ class Node(BaseModel, ABC):
                         batch_size=batch_size,
                     )
 
+        if driver.vector_indexes is not None:
+            driver.vector_indexes.remove(uuids)
+
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str): ...
 
     @classmethod
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]): ...
 
+    @classmethod
+    async def get_by_group_ids(
+        cls,
+        driver: GraphDriver,
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[Self]: ...
+
+    @classmethod
+    async def iter_by_group_ids(
+        cls,
+        driver: GraphDriver,
+        group_ids: list[str],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        **kwargs: Any,
+    ) -> AsyncIterator[list[Self]]:
+        """
+        Yield the nodes of the given groups in pages of at most page_size, walking
+        get_by_group_ids with a uuid cursor so only one page is held in memory at a time.
+
+        Extra keyword arguments such as with_embeddings are passed to get_by_group_ids.
+        """
+        uuid_cursor: str | None = None
+        while True:
+            page = await cls.get_by_group_ids(
+                driver, group_ids, limit=page_size, uuid_cursor=uuid_cursor, **kwargs
+            )
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            uuid_cursor = page[-1].uuid
+
 
 class EpisodicNode(Node):
     source: EpisodeType = Field(description='source type')
@@ -503,6 +549,9 @@ class EntityNode(Node):
                 entity_data=entity_data,
             )
 
+        if driver.vector_indexes is not None:
+            driver.vector_indexes.add_nodes([self])
+
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
         return result
@@ -34,6 +34,27 @@ class EdgeDuplicate(BaseModel):
     fact_type: str = Field(..., description='One of the provided fact types or DEFAULT')
 
 
+class EdgeResolution(BaseModel):
+    id: int = Field(..., description='id of the NEW FACT being resolved')
+    duplicate_facts: list[int] = Field(
+        ...,
+        description="idx values of EXISTING FACTS from this new fact's duplicate_candidates that are duplicates of it. Empty list if none.",
+    )
+    contradicted_facts: list[int] = Field(
+        ...,
+        description="idx values of EXISTING FACTS from this new fact's invalidation_candidates that it contradicts. Empty list if none.",
+    )
+    fact_type: str = Field(
+        ..., description='One of the fact types listed for this new fact, or DEFAULT'
+    )
+
+
+class EdgeResolutions(BaseModel):
+    edge_resolutions: list[EdgeResolution] = Field(
+        ..., description='One resolution for each NEW FACT'
+    )
+
+
 class UniqueFact(BaseModel):
     uuid: str = Field(..., description='unique identifier of the fact')
     fact: str = Field(..., description='fact of a unique edge')
@@ -47,12 +68,14 @@ class Prompt(Protocol):
     edge: PromptVersion
     edge_list: PromptVersion
     resolve_edge: PromptVersion
+    resolve_edges: PromptVersion
 
 
 class Versions(TypedDict):
     edge: PromptFunction
     edge_list: PromptFunction
     resolve_edge: PromptFunction
+    resolve_edges: PromptFunction
 
 
 def edge(context: dict[str, Any]) -> list[Message]:
@@ -171,4 +194,63 @@ def resolve_edge(context: dict[str, Any]) -> list[Message]:
     ]
 
 
-versions: Versions = {'edge': edge, 'edge_list': edge_list, 'resolve_edge': resolve_edge}
+def resolve_edges(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that de-duplicates facts from fact lists and determines which existing '
+            'facts are contradicted by new facts.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Task:
+        You will receive a list of NEW FACTS and a shared list of EXISTING FACTS indexed by 'idx'.
+        Each new fact has an 'id' and lists the EXISTING FACTS it should be compared against:
+        'duplicate_candidates' and 'invalidation_candidates' hold idx values into EXISTING FACTS.
+        Resolve every new fact independently and return one resolution per new fact with its id.
+
+        1. DUPLICATE DETECTION:
+           - If the new fact represents identical factual information as any of its duplicate_candidates, return those idx values in duplicate_facts.
+           - Facts with similar information that contain key differences should NOT be marked as duplicates.
+           - If no duplicates, return an empty list for duplicate_facts.
+
+        2. FACT TYPE CLASSIFICATION:
+           - Given the FACT TYPES named in the new fact's fact_types, determine if the new fact should be classified as one of these types.
+           - Return the fact type as fact_type or DEFAULT if the new fact is not one of its fact types.
+
+        3. CONTRADICTION DETECTION:
+           - Based on the new fact's invalidation_candidates, determine which facts the new fact contradicts.
+           - If no contradictions, return an empty list for contradicted_facts.
+
+        IMPORTANT:
+        - duplicate_facts: Use ONLY idx values from that new fact's duplicate_candidates
+        - contradicted_facts: Use ONLY idx values from that new fact's invalidation_candidates
+        - Do not compare new facts with each other
+
+        Guidelines:
+        1. Some facts may be very similar but will have key differences, particularly around numeric values in the facts.
+            Do not mark these facts as duplicates.
+
+        <FACT TYPES>
+        {to_prompt_json(context['edge_types'])}
+        </FACT TYPES>
+
+        <EXISTING FACTS>
+        {to_prompt_json(context['existing_edges'])}
+        </EXISTING FACTS>
+
+        <NEW FACTS>
+        {to_prompt_json(context['new_edges'])}
+        </NEW FACTS>
+        """,
+        ),
+    ]
+
+
+versions: Versions = {
+    'edge': edge,
+    'edge_list': edge_list,
+    'resolve_edge': resolve_edge,
+    'resolve_edges': resolve_edges,
+}
@@ -36,12 +36,14 @@ class SummaryDescription(BaseModel):
 
 class Prompt(Protocol):
     summarize_pair: PromptVersion
+    summarize_summaries: PromptVersion
     summarize_context: PromptVersion
     summary_description: PromptVersion
 
 
 class Versions(TypedDict):
     summarize_pair: PromptFunction
+    summarize_summaries: PromptFunction
     summarize_context: PromptFunction
     summary_description: PromptFunction
 
@@ -66,6 +68,26 @@ def summarize_pair(context: dict[str, Any]) -> list[Message]:
     ]
 
 
+def summarize_summaries(context: dict[str, Any]) -> list[Message]:
+    return [
+        Message(
+            role='system',
+            content='You are a helpful assistant that combines summaries.',
+        ),
+        Message(
+            role='user',
+            content=f"""
+        Synthesize the information from the following summaries into a single succinct summary.
+
+        IMPORTANT: Keep the summary concise and to the point. SUMMARIES MUST BE LESS THAN 250 CHARACTERS.
+
+        Summaries:
+        {to_prompt_json(context['node_summaries'])}
+        """,
+        ),
+    ]
+
+
 def summarize_context(context: dict[str, Any]) -> list[Message]:
     return [
         Message(
@@ -126,6 +148,7 @@ def summary_description(context: dict[str, Any]) -> list[Message]:
 
 versions: Versions = {
     'summarize_pair': summarize_pair,
+    'summarize_summaries': summarize_summaries,
     'summarize_context': summarize_context,
     'summary_description': summary_description,
 }
@@ -48,7 +48,9 @@ from graphiti_core.search.search_utils import (
     community_similarity_search,
     edge_bfs_search,
     edge_fulltext_search,
+    edge_fulltext_search_many,
     edge_similarity_search,
+    edge_similarity_search_many,
     episode_fulltext_search,
     episode_mentions_reranker,
     get_embeddings_for_communities,
@@ -58,7 +60,9 @@ from graphiti_core.search.search_utils import (
     node_bfs_search,
     node_distance_reranker,
     node_fulltext_search,
+    node_fulltext_search_many,
     node_similarity_search,
+    node_similarity_search_many,
     rrf,
 )
 
@@ -79,7 +83,7 @@ async def search(
     start = time()
 
     driver = driver or clients.driver
-    embedder = clients.embedder
+    embedder = clients.query_embedder or clients.embedder
     cross_encoder = clients.cross_encoder
 
     if query.strip() == '':
@@ -183,6 +187,214 @@ async def search(
     return results
 
 
+def _is_batchable_config(config: SearchConfig) -> bool:
+    if config.episode_config is not None or config.community_config is not None:
+        return False
+
+    batchable_edge_methods = {EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity}
+    if config.edge_config is not None and (
+        config.edge_config.reranker != EdgeReranker.rrf
+        or not set(config.edge_config.search_methods) <= batchable_edge_methods
+    ):
+        return False
+
+    batchable_node_methods = {NodeSearchMethod.bm25, NodeSearchMethod.cosine_similarity}
+    return config.node_config is None or (
+        config.node_config.reranker == NodeReranker.rrf
+        and set(config.node_config.search_methods) <= batchable_node_methods
+    )
+
+
+async def search_many(
+    clients: GraphitiClients,
+    queries: list[str],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters | list[SearchFilters],
+    query_vectors: list[list[float]] | None = None,
+    driver: GraphDriver | None = None,
+) -> list[SearchResults]:
+    """Run the same search for several queries, returning one SearchResults per query.
+
+    Hybrid fulltext/similarity searches reranked with RRF run as one UNWIND query per search
+    method and filter instead of one query per search string. Queries embed in a single
+    create_batch call. Other configurations fall back to concurrent search() calls.
+
+    ``search_filter`` is either shared by all queries or given per query. Per-query filters
+    that differ only in ``edge_uuids`` still share one database query.
+    """
+    driver = driver or clients.driver
+    search_filters = (
+        search_filter if isinstance(search_filter, list) else [search_filter] * len(queries)
+    )
+    if len(search_filters) != len(queries):
+        raise ValueError('search_filter must be a single filter or one filter per query')
+
+    if not queries:
+        return []
+
+    if not _is_batchable_config(config):
+        return list(
+            await semaphore_gather(
+                *[
+                    search(
+                        clients,
+                        query,
+                        group_ids,
+                        config,
+                        query_filter,
+                        query_vector=query_vectors[i] if query_vectors is not None else None,
+                        driver=driver,
+                    )
+                    for i, (query, query_filter) in enumerate(
+                        zip(queries, search_filters, strict=True)
+                    )
+                ]
+            )
+        )
+
+    start = time()
+
+    active_indices = [i for i, query in enumerate(queries) if query.strip() != '']
+    uses_vectors = (
+        config.edge_config is not None
+        and EdgeSearchMethod.cosine_similarity in config.edge_config.search_methods
+    ) or (
+        config.node_config is not None
+        and NodeSearchMethod.cosine_similarity in config.node_config.search_methods
+    )
+    if query_vectors is None and uses_vectors and active_indices:
+        embedder = clients.query_embedder or clients.embedder
+        embeddings = await embedder.create_batch(
+            [queries[i].replace('\n', ' ') for i in active_indices]
+        )
+        query_vectors = [[] for _ in queries]
+        for i, embedding in zip(active_indices, embeddings, strict=True):
+            query_vectors[i] = embedding
+
+    # if group_ids is empty, set it to None
+    group_ids = group_ids if group_ids and group_ids != [''] else None
+
+    # queries whose filters differ only in edge_uuids share one database query
+    batches: dict[str, list[int]] = defaultdict(list)
+    for i in active_indices:
+        shared_filter = search_filters[i].model_copy(update={'edge_uuids': None})
+        batches[shared_filter.model_dump_json()].append(i)
+
+    results = [SearchResults() for _ in queries]
+    batch_results = await semaphore_gather(
+        *[
+            _search_batch(
+                driver,
+                [queries[i] for i in indices],
+                [query_vectors[i] for i in indices] if query_vectors is not None else None,
+                [search_filters[i] for i in indices],
+                group_ids,
+                config,
+            )
+            for indices in batches.values()
+        ]
+    )
+    for indices, batch in zip(batches.values(), batch_results, strict=True):
+        for i, result in zip(indices, batch, strict=True):
+            results[i] = result
+
+    latency = (time() - start) * 1000
+
+    logger.debug(f'search_many returned context for {len(queries)} queries in {latency} ms')
+
+    return results
+
+
+async def _search_batch(
+    driver: GraphDriver,
+    queries: list[str],
+    query_vectors: list[list[float]] | None,
+    search_filters: list[SearchFilters],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+) -> list[SearchResults]:
+    search_filter = search_filters[0].model_copy(update={'edge_uuids': None})
+    edge_uuids: list[list[str] | None] | None = (
+        [query_filter.edge_uuids for query_filter in search_filters]
+        if any(query_filter.edge_uuids is not None for query_filter in search_filters)
+        else None
+    )
+    limit = config.limit
+
+    edge_tasks = []
+    if config.edge_config is not None:
+        if EdgeSearchMethod.bm25 in config.edge_config.search_methods:
+            edge_tasks.append(
+                edge_fulltext_search_many(
+                    driver, queries, search_filter, group_ids, 2 * limit, edge_uuids
+                )
+            )
+        if EdgeSearchMethod.cosine_similarity in config.edge_config.search_methods:
+            assert query_vectors is not None
+            edge_tasks.append(
+                edge_similarity_search_many(
+                    driver,
+                    query_vectors,
+                    search_filter,
+                    group_ids,
+                    2 * limit,
+                    config.edge_config.sim_min_score,
+                    edge_uuids,
+                )
+            )
+
+    node_tasks = []
+    if config.node_config is not None:
+        if NodeSearchMethod.bm25 in config.node_config.search_methods:
+            node_tasks.append(
+                node_fulltext_search_many(driver, queries, search_filter, group_ids, 2 * limit)
+            )
+        if NodeSearchMethod.cosine_similarity in config.node_config.search_methods:
+            assert query_vectors is not None
+            node_tasks.append(
+                node_similarity_search_many(
+                    driver,
+                    query_vectors,
+                    search_filter,
+                    group_ids,
+                    2 * limit,
+                    config.node_config.sim_min_score,
+                )
+            )
+
+    method_results = await semaphore_gather(*edge_tasks, *node_tasks)
+    edge_method_results: list[list[list[EntityEdge]]] = list(method_results[: len(edge_tasks)])
+    node_method_results: list[list[list[EntityNode]]] = list(method_results[len(edge_tasks) :])
+
+    results: list[SearchResults] = []
+    for i in range(len(queries)):
+        edge_results = [method_result[i] for method_result in edge_method_results]
+        edge_uuid_map = {edge.uuid: edge for result in edge_results for edge in result}
+        reranked_edge_uuids, edge_scores = rrf(
+            [[edge.uuid for edge in result] for result in edge_results],
+            min_score=config.reranker_min_score,
+        )
+
+        node_results = [method_result[i] for method_result in node_method_results]
+        node_uuid_map = {node.uuid: node for result in node_results for node in result}
+        reranked_node_uuids, node_scores = rrf(
+            [[node.uuid for node in result] for result in node_results],
+            min_score=config.reranker_min_score,
+        )
+
+        results.append(
+            SearchResults(
+                edges=[edge_uuid_map[uuid] for uuid in reranked_edge_uuids][:limit],
+                edge_reranker_scores=edge_scores[:limit],
+                nodes=[node_uuid_map[uuid] for uuid in reranked_node_uuids][:limit],
+                node_reranker_scores=node_scores[:limit],
+            )
+        )
+
+    return results
+
+
 async def edge_search(
     driver: GraphDriver,
     cross_encoder: CrossEncoderClient,
@@ -218,7 +430,8 @@ async def edge_search(
                 config.sim_min_score,
             )
         )
-    if EdgeSearchMethod.bfs in config.search_methods:
+
+    if EdgeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is not None:
         search_tasks.append(
             edge_bfs_search(
                 driver,
@@ -236,7 +449,10 @@ async def edge_search(
         search_results = list(await semaphore_gather(*search_tasks))
 
     if EdgeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
-        source_node_uuids = [edge.source_node_uuid for result in search_results for edge in result]
+        # Expand once from the union of every method's results rather than once per method
+        source_node_uuids = list(
+            dict.fromkeys(edge.source_node_uuid for result in search_results for edge in result)
+        )
         search_results.append(
             await edge_bfs_search(
                 driver,
@@ -265,6 +481,7 @@ async def edge_search(
             search_result_uuids_and_vectors,
             config.mmr_lambda,
             reranker_min_score,
+            limit,
         )
     elif config.reranker == EdgeReranker.cross_encoder:
         fact_to_uuid_map = {edge.fact: edge.uuid for edge in list(edge_uuid_map.values())[:limit]}
@@ -339,7 +556,8 @@ async def node_search(
                 config.sim_min_score,
             )
         )
-    if NodeSearchMethod.bfs in config.search_methods:
+
+    if NodeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is not None:
         search_tasks.append(
             node_bfs_search(
                 driver,
@@ -357,7 +575,10 @@ async def node_search(
         search_results = list(await semaphore_gather(*search_tasks))
 
     if NodeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
-        origin_node_uuids = [node.uuid for result in search_results for node in result]
+        # Expand once from the union of every method's results rather than once per method
+        origin_node_uuids = list(
+            dict.fromkeys(node.uuid for result in search_results for node in result)
+        )
         search_results.append(
             await node_bfs_search(
                 driver,
@@ -386,6 +607,7 @@ async def node_search(
             search_result_uuids_and_vectors,
             config.mmr_lambda,
             reranker_min_score,
+            limit,
         )
     elif config.reranker == NodeReranker.cross_encoder:
         name_to_uuid_map = {node.name: node.uuid for node in list(node_uuid_map.values())}
@@ -504,7 +726,11 @@ async def community_search(
         )
 
         reranked_uuids, community_scores = maximal_marginal_relevance(
-            query_vector, search_result_uuids_and_vectors, config.mmr_lambda, reranker_min_score
+            query_vector,
+            search_result_uuids_and_vectors,
+            config.mmr_lambda,
+            reranker_min_score,
+            limit,
         )
     elif config.reranker == CommunityReranker.cross_encoder:
         name_to_uuid_map = {node.name: node.uuid for result in search_results for node in result}
@@ -0,0 +1,178 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from time import monotonic
+
+from pydantic import BaseModel
+
+from graphiti_core.search.search_config import SearchConfig, SearchResults
+from graphiti_core.search.search_filters import SearchFilters
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_CACHE_SIZE = 1000
+DEFAULT_SEARCH_CACHE_TTL = 60.0
+
+# Bucket for searches that were not restricted to specific groups; any write invalidates them
+_ALL_GROUPS = '*'
+
+
+class SearchCacheConfig(BaseModel):
+    max_size: int = DEFAULT_SEARCH_CACHE_SIZE
+    ttl: float | None = DEFAULT_SEARCH_CACHE_TTL
+
+
+class SearchCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _SearchCacheEntry(BaseModel):
+    stored_at: float
+    groups: list[str]
+    results: SearchResults
+
+
+class SearchCache:
+    """
+    In-memory LRU cache of search results with TTL expiry and per-group invalidation.
+
+    Entries are keyed on the whitespace-normalized query text, the search config and filters,
+    the group ids, the center and BFS origin nodes, and the database searched. Writes call
+    invalidate_groups() so cached results never outlive a change to the groups they cover.
+    Results are copied on the way in and out, so callers may mutate what they get back.
+    """
+
+    def __init__(self, config: SearchCacheConfig | None = None):
+        if config is None:
+            config = SearchCacheConfig()
+
+        self.config = config
+        self.stats = SearchCacheStats()
+        self._entries: OrderedDict[str, _SearchCacheEntry] = OrderedDict()
+        self._keys_by_group: dict[str, set[str]] = {}
+        # Bumped on every invalidation so searches that overlapped a write are not stored
+        self.generation = 0
+
+    @staticmethod
+    def make_key(
+        query: str,
+        config: SearchConfig,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        database: str | None = None,
+    ) -> str:
+        key = json.dumps(
+            [
+                ' '.join(query.split()),
+                config.model_dump(mode='json'),
+                search_filter.model_dump(mode='json'),
+                sorted(group_ids) if group_ids else None,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                database,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> SearchResults | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self.config.ttl is None or monotonic() - entry.stored_at < self.config.ttl:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry.results.model_copy(deep=True)
+            self._remove(key)
+            self.stats.evictions += 1
+
+        self.stats.misses += 1
+        return None
+
+    def set(
+        self,
+        key: str,
+        group_ids: list[str] | None,
+        results: SearchResults,
+        generation: int | None = None,
+    ):
+        """
+        Store results for key. If generation is given and an invalidation has happened since it
+        was read, the results may predate a write and are dropped.
+        """
+        if generation is not None and generation != self.generation:
+            return
+
+        groups = sorted(set(group_ids)) if group_ids else [_ALL_GROUPS]
+        self._remove(key)
+        self._entries[key] = _SearchCacheEntry(
+            stored_at=monotonic(), groups=groups, results=results.model_copy(deep=True)
+        )
+        for group_id in groups:
+            self._keys_by_group.setdefault(group_id, set()).add(key)
+
+        while len(self._entries) > self.config.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def invalidate_groups(self, group_ids: Iterable[str | None]):
+        """Drop cached results for the given groups and for searches across all groups."""
+        self.generation += 1
+
+        keys: set[str] = set(self._keys_by_group.get(_ALL_GROUPS, ()))
+        for group_id in set(group_ids):
+            if group_id is not None:
+                keys.update(self._keys_by_group.get(group_id, ()))
+
+        for key in keys:
+            self._remove(key)
+        self.stats.invalidations += len(keys)
+
+        if keys:
+            logger.debug(f'Invalidated {len(keys)} cached search results')
+
+    def clear(self):
+        self.generation += 1
+        self._entries.clear()
+        self._keys_by_group.clear()
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for group_id in entry.groups:
+            keys = self._keys_by_group.get(group_id)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_group[group_id]
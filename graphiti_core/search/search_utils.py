@@ -35,7 +35,6 @@ from graphiti_core.graph_queries import (
 )
 from graphiti_core.helpers import (
     lucene_sanitize,
-    normalize_l2,
     semaphore_gather,
 )
 from graphiti_core.models.edges.edge_db_queries import get_entity_edge_return_query
@@ -65,6 +64,12 @@ DEFAULT_MIN_SCORE = 0.6
 DEFAULT_MMR_LAMBDA = 0.5
 MAX_SEARCH_DEPTH = 3
 MAX_QUERY_LENGTH = 128
+# Each extra BFS hop multiplies a result's score by this factor
+BFS_DEPTH_DECAY = 0.5
+# Upper bound on the nodes expanded per BFS level, which keeps hub nodes from exploding a search
+BFS_MAX_FRONTIER_SIZE = 1000
+# Growth of the vector index candidate set when search filters reject too many candidates
+CANDIDATE_WIDENING_FACTOR = 4
 
 
 def calculate_cosine_similarity(vector1: list[float], vector2: list[float]) -> float:
@@ -81,6 +86,104 @@ def calculate_cosine_similarity(vector1: list[float], vector2: list[float]) -> f
     return dot_product / (norm_vector1 * norm_vector2)
 
 
+def parse_embedding_strings(embeddings: list[str | None], dim: int) -> tuple[NDArray, NDArray]:
+    """
+    Parses comma-separated embeddings into a single (n, dim) float matrix.
+
+    Returns the matrix together with the indices of the input rows it contains. Empty rows and
+    rows whose dimension does not match `dim` are skipped.
+    """
+    rows: list[str] = []
+    row_indices: list[int] = []
+    for i, embedding in enumerate(embeddings):
+        if embedding and embedding.count(',') + 1 == dim:
+            rows.append(embedding)
+            row_indices.append(i)
+
+    if len(rows) == 0:
+        return np.empty((0, dim)), np.empty(0, dtype=np.intp)
+
+    values = np.array(','.join(rows).split(','), dtype=np.float64)
+
+    return values.reshape(len(rows), dim), np.array(row_indices, dtype=np.intp)
+
+
+def normalize_rows(matrix: NDArray) -> NDArray:
+    """
+    L2-normalizes every row of a matrix, leaving zero rows untouched.
+    """
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix, dtype=np.float64), where=norms != 0)
+
+
+def calculate_cosine_similarities(query_vector: list[float], matrix: NDArray) -> NDArray:
+    """
+    Calculates the cosine similarity between a vector and every row of a matrix using NumPy.
+    Rows that are zero vectors score 0.
+    """
+    query_array = normalize_rows(np.asarray([query_vector], dtype=np.float64))[0]
+    return normalize_rows(matrix) @ query_array
+
+
+def top_k_scores(scores: NDArray, min_score: float, limit: int | None = None) -> NDArray:
+    """
+    Returns the indices of the scores above min_score, highest first, capped at limit.
+    """
+    candidates = np.flatnonzero(scores > min_score)
+    if limit is not None and 0 < limit < len(candidates):
+        candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+def _score_neptune_embeddings(
+    search_vector: list[float],
+    records: list[Any],
+    min_score: float,
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Score Neptune `id`/`embedding` records against a search vector in a single pass."""
+    matrix, row_indices = parse_embedding_strings(
+        [r['embedding'] for r in records], len(search_vector)
+    )
+    scores = calculate_cosine_similarities(search_vector, matrix)
+
+    return [
+        {'id': records[row_indices[i]]['id'], 'score': float(scores[i])}
+        for i in top_k_scores(scores, min_score, limit)
+    ]
+
+
+def _score_neptune_edge_candidates(
+    edges: list[EntityEdge],
+    records: list[Any],
+    min_score: float,
+) -> list[dict[str, Any]]:
+    """Score Neptune candidate edge records against the embeddings of the edges they were matched for."""
+    query_edges = [edge for edge in edges if edge.fact_embedding]
+    if len(query_edges) == 0 or len(records) == 0:
+        return []
+
+    dim = len(query_edges[0].fact_embedding or [])
+    query_edges = [edge for edge in query_edges if len(edge.fact_embedding or []) == dim]
+    query_indices = {edge.uuid: i for i, edge in enumerate(query_edges)}
+    query_matrix = normalize_rows(np.array([edge.fact_embedding for edge in query_edges]))
+
+    candidates = [r for r in records if r['search_edge_uuid'] in query_indices]
+    matrix, row_indices = parse_embedding_strings([r['source_embedding'] for r in candidates], dim)
+    query_rows = [query_indices[candidates[i]['search_edge_uuid']] for i in row_indices]
+    scores = np.einsum('ij,ij->i', normalize_rows(matrix), query_matrix[query_rows])
+
+    return [
+        {
+            'id': candidates[row_indices[i]]['id'],
+            'score': float(scores[i]),
+            'uuid': candidates[row_indices[i]]['search_edge_uuid'],
+        }
+        for i in np.flatnonzero(scores > min_score)
+    ]
+
+
 def fulltext_query(query: str, group_ids: list[str] | None, driver: GraphDriver):
     if driver.provider == GraphProvider.KUZU:
         # Kuzu only supports simple queries.
@@ -110,6 +213,22 @@ def fulltext_query(query: str, group_ids: list[str] | None, driver: GraphDriver)
     return full_query
 
 
+def _supports_batched_search(driver: GraphDriver) -> bool:
+    # Kuzu cannot pass row variables into FTS calls and Neptune searches through OpenSearch
+    return driver.search_interface is None and driver.provider not in (
+        GraphProvider.KUZU,
+        GraphProvider.NEPTUNE,
+    )
+
+
+def _split_records_by_query(records: list[Any], num_queries: int) -> list[list[Any]]:
+    records_by_query: list[list[Any]] = [[] for _ in range(num_queries)]
+    for record in records:
+        records_by_query[record['query_idx']].append(record)
+
+    return records_by_query
+
+
 async def get_episodes_by_mentions(
     driver: GraphDriver,
     nodes: list[EntityNode],
@@ -208,7 +327,7 @@ async def edge_fulltext_search(
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('edge_name_and_fact', query)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('edge_name_and_fact', query)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             input_ids = []
             for r in res['hits']['hits']:
@@ -304,17 +423,11 @@ async def edge_similarity_search(
             min_score,
         )
 
-    match_query = """
-        MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
-    """
-    if driver.provider == GraphProvider.KUZU:
-        match_query = """
-            MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
-        """
-
     filter_queries, filter_params = edge_search_filter_query_constructor(
         search_filter, driver.provider
     )
+    # Filters other than group_ids can reject most of the index candidates
+    narrowed = bool(filter_queries)
 
     if group_ids is not None:
         filter_queries.append('e.group_id IN $group_ids')
@@ -328,6 +441,56 @@ async def edge_similarity_search(
             filter_params['target_uuid'] = target_node_uuid
             filter_queries.append('m.uuid = $target_uuid')
 
+    # Explicit uuid sets are small enough to score exactly, and their members are rarely
+    # among the nearest candidates of the whole group
+    if (
+        driver.vector_indexes is None
+        or search_filter.edge_uuids is not None
+        or source_node_uuid is not None
+        or target_node_uuid is not None
+    ):
+        return await _edge_similarity_query(
+            driver, search_vector, filter_queries, filter_params, limit, min_score
+        )
+
+    candidate_count = driver.vector_indexes.candidate_count(limit)
+    while True:
+        candidate_uuids = await driver.vector_indexes.search_edges(
+            driver, search_vector, group_ids, limit, candidate_count=candidate_count
+        )
+        if not candidate_uuids:
+            return []
+
+        edges = await _edge_similarity_query(
+            driver,
+            search_vector,
+            filter_queries + ['e.uuid IN $candidate_uuids'],
+            {**filter_params, 'candidate_uuids': candidate_uuids},
+            limit,
+            min_score,
+        )
+        # Widen the candidates until enough pass the filters or the index is exhausted
+        if not narrowed or len(edges) >= limit or len(candidate_uuids) < candidate_count:
+            return edges
+        candidate_count *= CANDIDATE_WIDENING_FACTOR
+
+
+async def _edge_similarity_query(
+    driver: GraphDriver,
+    search_vector: list[float],
+    filter_queries: list[str],
+    filter_params: dict[str, Any],
+    limit: int,
+    min_score: float,
+) -> list[EntityEdge]:
+    match_query = """
+        MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+            MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
+        """
+
     filter_query = ''
     if filter_queries:
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
@@ -356,15 +519,8 @@ async def edge_similarity_search(
         )
 
         if len(resp) > 0:
-            # Calculate Cosine similarity then return the edge ids
-            input_ids = []
-            for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+            # Calculate Cosine similarity then return the top ids
+            input_ids = _score_neptune_embeddings(search_vector, resp, min_score, limit)
 
             # Match the edge ides and return the values
             query = """
@@ -430,18 +586,147 @@ async def edge_similarity_search(
     return edges
 
 
-async def edge_bfs_search(
+async def edge_fulltext_search_many(
     driver: GraphDriver,
-    bfs_origin_node_uuids: list[str] | None,
-    bfs_max_depth: int,
+    queries: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    edge_uuids: list[list[str] | None] | None = None,
+) -> list[list[EntityEdge]]:
+    """Fulltext edge search for several queries in one UNWIND query, returned per query.
+
+    ``edge_uuids`` optionally restricts each query to its own set of edges on top of
+    ``search_filter``.
+    """
+    if not queries:
+        return []
+
+    if not _supports_batched_search(driver):
+        return list(
+            await semaphore_gather(
+                *[
+                    edge_fulltext_search(
+                        driver,
+                        query,
+                        _with_edge_uuids(search_filter, edge_uuids, i),
+                        group_ids,
+                        limit,
+                    )
+                    for i, query in enumerate(queries)
+                ]
+            )
+        )
+
+    query_rows: list[dict[str, Any]] = []
+    for i, query in enumerate(queries):
+        fuzzy_query = fulltext_query(query, group_ids, driver)
+        if fuzzy_query == '':
+            continue
+        query_rows.append(
+            {
+                'idx': i,
+                'query': fuzzy_query,
+                'edge_uuids': edge_uuids[i] if edge_uuids is not None else None,
+            }
+        )
+
+    if not query_rows:
+        return [[] for _ in queries]
+
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('e.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    if edge_uuids is not None:
+        filter_queries.append('(q.edge_uuids IS NULL OR e.uuid IN q.edge_uuids)')
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    query = (
+        """
+        UNWIND $queries AS q
+        """
+        + get_relationships_query(
+            'edge_name_and_fact', limit=limit, provider=driver.provider, query='q.query'
+        )
+        + """
+        YIELD relationship AS rel, score
+        MATCH (n:Entity)-[e:RELATES_TO {uuid: rel.uuid}]->(m:Entity)
+        """
+        + filter_query
+        + """
+        WITH q, e, n, m, score
+        ORDER BY score DESC
+        WITH q, collect({edge: e, source: n, target: m})[..$limit] AS hits
+        UNWIND hits AS hit
+        WITH q, hit.edge AS e, hit.source AS n, hit.target AS m
+        RETURN q.idx AS query_idx,
+        """
+        + get_entity_edge_return_query(driver.provider)
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        queries=query_rows,
+        limit=limit,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_entity_edge_from_record(record, driver.provider) for record in query_records]
+        for query_records in _split_records_by_query(records, len(queries))
+    ]
+
+
+async def edge_similarity_search_many(
+    driver: GraphDriver,
+    search_vectors: list[list[float]],
     search_filter: SearchFilters,
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
-) -> list[EntityEdge]:
-    # vector similarity search over embedded facts
-    if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0:
+    min_score: float = DEFAULT_MIN_SCORE,
+    edge_uuids: list[list[str] | None] | None = None,
+) -> list[list[EntityEdge]]:
+    """Vector edge search for several query vectors in one UNWIND query, returned per query."""
+    if not search_vectors:
         return []
 
+    if not _supports_batched_search(driver):
+        return list(
+            await semaphore_gather(
+                *[
+                    edge_similarity_search(
+                        driver,
+                        search_vector,
+                        None,
+                        None,
+                        _with_edge_uuids(search_filter, edge_uuids, i),
+                        group_ids,
+                        limit,
+                        min_score,
+                    )
+                    for i, search_vector in enumerate(search_vectors)
+                ]
+            )
+        )
+
+    query_rows = [
+        {
+            'idx': i,
+            'search_vector': search_vector,
+            'edge_uuids': edge_uuids[i] if edge_uuids is not None else None,
+        }
+        for i, search_vector in enumerate(search_vectors)
+    ]
+
     filter_queries, filter_params = edge_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -450,106 +735,210 @@ async def edge_bfs_search(
         filter_queries.append('e.group_id IN $group_ids')
         filter_params['group_ids'] = group_ids
 
+    if edge_uuids is not None:
+        filter_queries.append('(q.edge_uuids IS NULL OR e.uuid IN q.edge_uuids)')
+
     filter_query = ''
     if filter_queries:
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
+    query = (
+        """
+        UNWIND $queries AS q
+        MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
+        """
+        + filter_query
+        + """
+        WITH DISTINCT q, e, n, m, """
+        + get_vector_cosine_func_query('e.fact_embedding', 'q.search_vector', driver.provider)
+        + """ AS score
+        WHERE score > $min_score
+        WITH q, e, n, m, score
+        ORDER BY score DESC
+        WITH q, collect({edge: e, source: n, target: m})[..$limit] AS hits
+        UNWIND hits AS hit
+        WITH q, hit.edge AS e, hit.source AS n, hit.target AS m
+        RETURN q.idx AS query_idx,
+        """
+        + get_entity_edge_return_query(driver.provider)
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        queries=query_rows,
+        limit=limit,
+        min_score=min_score,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_entity_edge_from_record(record, driver.provider) for record in query_records]
+        for query_records in _split_records_by_query(records, len(search_vectors))
+    ]
+
+
+def _with_edge_uuids(
+    search_filter: SearchFilters, edge_uuids: list[list[str] | None] | None, idx: int
+) -> SearchFilters:
+    if edge_uuids is None or edge_uuids[idx] is None:
+        return search_filter
+    return search_filter.model_copy(update={'edge_uuids': edge_uuids[idx]})
+
+
+def _bfs_frontier_query(provider: GraphProvider, restrict_groups: bool) -> str:
+    relates_to = (
+        '-[:RELATES_TO]->(:RelatesToNode_)-[:RELATES_TO]->'
+        if provider == GraphProvider.KUZU
+        else '-[:RELATES_TO]->'
+    )
+    # Without explicit group_ids, expansion stays inside each origin's own group
+    group_filter = (
+        'WHERE m.group_id IN $group_ids'
+        if restrict_groups
+        else 'WHERE m.group_id = origin.group_id'
+    )
+
+    return f"""
+        UNWIND $frontier AS frontier_uuid
+        MATCH (origin:Entity {{uuid: frontier_uuid}}){relates_to}(m:Entity)
+        {group_filter}
+        RETURN DISTINCT m.uuid AS uuid
+        LIMIT $frontier_limit
+        UNION
+        UNWIND $frontier AS frontier_uuid
+        MATCH (origin:Episodic {{uuid: frontier_uuid}})-[:MENTIONS]->(m:Entity)
+        {group_filter}
+        RETURN DISTINCT m.uuid AS uuid
+        LIMIT $frontier_limit
+    """
+
+
+async def _bfs_next_frontier(
+    driver: GraphDriver,
+    frontier: list[str],
+    visited: set[str],
+    group_ids: list[str] | None,
+) -> list[str]:
+    """Entity uuids one hop from the frontier that have not been visited yet."""
+    records, _, _ = await driver.execute_query(
+        _bfs_frontier_query(driver.provider, group_ids is not None),
+        frontier=frontier,
+        frontier_limit=BFS_MAX_FRONTIER_SIZE,
+        group_ids=group_ids,
+        routing_='r',
+    )
+    next_frontier = list(
+        dict.fromkeys(record['uuid'] for record in records if record['uuid'] not in visited)
+    )
+    return next_frontier[:BFS_MAX_FRONTIER_SIZE]
+
+
+def bfs_depth_score(depth: int) -> float:
+    """Score of a BFS result found depth hops from its origin; 1.0 for direct neighbors."""
+    return BFS_DEPTH_DECAY ** (depth - 1)
+
+
+async def edge_bfs_search_scored(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    bfs_max_depth: int,
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> tuple[list[EntityEdge], list[float]]:
+    """
+    Level-by-level BFS over RELATES_TO and MENTIONS from the origin nodes.
+
+    Each level runs one query for the facts leaving the current frontier and one for the next
+    frontier. Visited nodes are never expanded twice, frontiers are capped at
+    BFS_MAX_FRONTIER_SIZE, and the search stops as soon as limit facts are found. Facts are
+    returned nearest first with their bfs_depth_score.
+    """
+    if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0 or bfs_max_depth < 1:
+        return [], []
+
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('e.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_queries.append('NOT e.uuid IN $seen_uuids')
+    filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    match_query = """
+        UNWIND $frontier AS frontier_uuid
+        MATCH (n:Entity {uuid: frontier_uuid})-[e:RELATES_TO]->(m:Entity)
+    """
     if driver.provider == GraphProvider.KUZU:
-        # Kuzu stores entity edges twice with an intermediate node, so we need to match them
-        # separately for the correct BFS depth.
-        depth = bfs_max_depth * 2 - 1
-        match_queries = [
-            f"""
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH path = (origin:Entity {{uuid: origin_uuid}})-[:RELATES_TO*1..{depth}]->(:RelatesToNode_)
-            UNWIND nodes(path) AS relNode
-            MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {{uuid: relNode.uuid}})-[:RELATES_TO]->(m:Entity)
-            """,
-        ]
-        if bfs_max_depth > 1:
-            depth = (bfs_max_depth - 1) * 2 - 1
-            match_queries.append(f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH path = (origin:Episodic {{uuid: origin_uuid}})-[:MENTIONS]->(:Entity)-[:RELATES_TO*1..{depth}]->(:RelatesToNode_)
-                UNWIND nodes(path) AS relNode
-                MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {{uuid: relNode.uuid}})-[:RELATES_TO]->(m:Entity)
-            """)
-
-        records = []
-        for match_query in match_queries:
-            sub_records, _, _ = await driver.execute_query(
-                match_query
-                + filter_query
-                + """
-                RETURN DISTINCT
-                """
-                + get_entity_edge_return_query(driver.provider)
-                + """
-                LIMIT $limit
-                """,
-                bfs_origin_node_uuids=bfs_origin_node_uuids,
-                limit=limit,
-                routing_='r',
-                **filter_params,
-            )
-            records.extend(sub_records)
-    else:
-        if driver.provider == GraphProvider.NEPTUNE:
-            query = (
-                f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS *1..{bfs_max_depth}]->(n:Entity)
-                WHERE origin:Entity OR origin:Episodic
-                UNWIND relationships(path) AS rel
-                MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
-                """
-                + filter_query
-                + """
-                RETURN DISTINCT
-                    e.uuid AS uuid,
-                    e.group_id AS group_id,
-                    startNode(e).uuid AS source_node_uuid,
-                    endNode(e).uuid AS target_node_uuid,
-                    e.created_at AS created_at,
-                    e.name AS name,
-                    e.fact AS fact,
-                    split(e.episodes, ',') AS episodes,
-                    e.expired_at AS expired_at,
-                    e.valid_at AS valid_at,
-                    e.invalid_at AS invalid_at,
-                    properties(e) AS attributes
-                LIMIT $limit
-                """
-            )
-        else:
-            query = (
-                f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH path = (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(:Entity)
-                UNWIND relationships(path) AS rel
-                MATCH (n:Entity)-[e:RELATES_TO {{uuid: rel.uuid}}]-(m:Entity)
-                """
-                + filter_query
-                + """
-                RETURN DISTINCT
-                """
-                + get_entity_edge_return_query(driver.provider)
-                + """
-                LIMIT $limit
-                """
-            )
+        match_query = """
+            UNWIND $frontier AS frontier_uuid
+            MATCH (n:Entity {uuid: frontier_uuid})-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
+        """
 
-        records, _, _ = await driver.execute_query(
+    query = (
+        match_query
+        + filter_query
+        + """
+        RETURN DISTINCT
+        """
+        + get_entity_edge_return_query(driver.provider)
+        + """
+        LIMIT $limit
+        """
+    )
+
+    edges: list[EntityEdge] = []
+    scores: list[float] = []
+    seen_uuids: set[str] = set()
+    frontier = list(dict.fromkeys(bfs_origin_node_uuids))
+    visited = set(frontier)
+    for depth in range(1, bfs_max_depth + 1):
+        level_query = driver.execute_query(
             query,
-            bfs_origin_node_uuids=bfs_origin_node_uuids,
-            depth=bfs_max_depth,
-            limit=limit,
+            frontier=frontier,
+            seen_uuids=list(seen_uuids),
+            limit=limit - len(edges),
             routing_='r',
             **filter_params,
         )
+        if depth < bfs_max_depth:
+            (records, _, _), next_frontier = await semaphore_gather(
+                level_query, _bfs_next_frontier(driver, frontier, visited, group_ids)
+            )
+        else:
+            (records, _, _), next_frontier = await level_query, []
 
-    edges = [get_entity_edge_from_record(record, driver.provider) for record in records]
+        for record in records:
+            edge = get_entity_edge_from_record(record, driver.provider)
+            if edge.uuid in seen_uuids:
+                continue
+            seen_uuids.add(edge.uuid)
+            edges.append(edge)
+            scores.append(bfs_depth_score(depth))
+
+        if len(edges) >= limit or not next_frontier:
+            break
+        frontier = next_frontier
+        visited.update(frontier)
 
+    return edges[:limit], scores[:limit]
+
+
+async def edge_bfs_search(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    bfs_max_depth: int,
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[EntityEdge]:
+    edges, _ = await edge_bfs_search_scored(
+        driver, bfs_origin_node_uuids, bfs_max_depth, search_filter, group_ids, limit
+    )
     return edges
 
 
@@ -587,7 +976,7 @@ async def node_fulltext_search(
         yield_query = 'WITH node AS n, score'
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('node_name_and_summary', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('node_name_and_summary', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             input_ids = []
             for r in res['hits']['hits']:
@@ -662,11 +1051,48 @@ async def node_similarity_search(
     filter_queries, filter_params = node_search_filter_query_constructor(
         search_filter, driver.provider
     )
+    # Filters other than group_ids can reject most of the index candidates
+    narrowed = bool(filter_queries)
 
     if group_ids is not None:
         filter_queries.append('n.group_id IN $group_ids')
         filter_params['group_ids'] = group_ids
 
+    if driver.vector_indexes is None:
+        return await _node_similarity_query(
+            driver, search_vector, filter_queries, filter_params, limit, min_score
+        )
+
+    candidate_count = driver.vector_indexes.candidate_count(limit)
+    while True:
+        candidate_uuids = await driver.vector_indexes.search_nodes(
+            driver, search_vector, group_ids, limit, candidate_count=candidate_count
+        )
+        if not candidate_uuids:
+            return []
+
+        nodes = await _node_similarity_query(
+            driver,
+            search_vector,
+            filter_queries + ['n.uuid IN $candidate_uuids'],
+            {**filter_params, 'candidate_uuids': candidate_uuids},
+            limit,
+            min_score,
+        )
+        # Widen the candidates until enough pass the filters or the index is exhausted
+        if not narrowed or len(nodes) >= limit or len(candidate_uuids) < candidate_count:
+            return nodes
+        candidate_count *= CANDIDATE_WIDENING_FACTOR
+
+
+async def _node_similarity_query(
+    driver: GraphDriver,
+    search_vector: list[float],
+    filter_queries: list[str],
+    filter_params: dict[str, Any],
+    limit: int,
+    min_score: float,
+) -> list[EntityNode]:
     filter_query = ''
     if filter_queries:
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
@@ -695,15 +1121,8 @@ async def node_similarity_search(
         )
 
         if len(resp) > 0:
-            # Calculate Cosine similarity then return the edge ids
-            input_ids = []
-            for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+            # Calculate Cosine similarity then return the top ids
+            input_ids = _score_neptune_embeddings(search_vector, resp, min_score, limit)
 
             # Match the edge ides and return the values
             query = (
@@ -764,16 +1183,173 @@ async def node_similarity_search(
     return nodes
 
 
-async def node_bfs_search(
+async def node_fulltext_search_many(
+    driver: GraphDriver,
+    queries: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+) -> list[list[EntityNode]]:
+    """Fulltext node search for several queries in one UNWIND query, returned per query."""
+    if not queries:
+        return []
+
+    if not _supports_batched_search(driver):
+        return list(
+            await semaphore_gather(
+                *[
+                    node_fulltext_search(driver, query, search_filter, group_ids, limit)
+                    for query in queries
+                ]
+            )
+        )
+
+    query_rows: list[dict[str, Any]] = []
+    for i, query in enumerate(queries):
+        fuzzy_query = fulltext_query(query, group_ids, driver)
+        if fuzzy_query != '':
+            query_rows.append({'idx': i, 'query': fuzzy_query})
+
+    if not query_rows:
+        return [[] for _ in queries]
+
+    filter_queries, filter_params = node_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('n.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    query = (
+        """
+        UNWIND $queries AS q
+        """
+        + get_nodes_query('node_name_and_summary', 'q.query', limit=limit, provider=driver.provider)
+        + """
+        YIELD node AS n, score
+        """
+        + filter_query
+        + """
+        WITH q, n, score
+        ORDER BY score DESC
+        WITH q, collect(n)[..$limit] AS hits
+        UNWIND hits AS n
+        RETURN q.idx AS query_idx,
+        """
+        + get_entity_node_return_query(driver.provider)
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        queries=query_rows,
+        limit=limit,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_entity_node_from_record(record, driver.provider) for record in query_records]
+        for query_records in _split_records_by_query(records, len(queries))
+    ]
+
+
+async def node_similarity_search_many(
+    driver: GraphDriver,
+    search_vectors: list[list[float]],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> list[list[EntityNode]]:
+    """Vector node search for several query vectors in one UNWIND query, returned per query."""
+    if not search_vectors:
+        return []
+
+    if not _supports_batched_search(driver):
+        return list(
+            await semaphore_gather(
+                *[
+                    node_similarity_search(
+                        driver, search_vector, search_filter, group_ids, limit, min_score
+                    )
+                    for search_vector in search_vectors
+                ]
+            )
+        )
+
+    query_rows = [
+        {'idx': i, 'search_vector': search_vector} for i, search_vector in enumerate(search_vectors)
+    ]
+
+    filter_queries, filter_params = node_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+
+    if group_ids is not None:
+        filter_queries.append('n.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    query = (
+        """
+        UNWIND $queries AS q
+        MATCH (n:Entity)
+        """
+        + filter_query
+        + """
+        WITH q, n, """
+        + get_vector_cosine_func_query('n.name_embedding', 'q.search_vector', driver.provider)
+        + """ AS score
+        WHERE score > $min_score
+        WITH q, n, score
+        ORDER BY score DESC
+        WITH q, collect(n)[..$limit] AS hits
+        UNWIND hits AS n
+        RETURN q.idx AS query_idx,
+        """
+        + get_entity_node_return_query(driver.provider)
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        queries=query_rows,
+        limit=limit,
+        min_score=min_score,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [
+        [get_entity_node_from_record(record, driver.provider) for record in query_records]
+        for query_records in _split_records_by_query(records, len(search_vectors))
+    ]
+
+
+async def node_bfs_search_scored(
     driver: GraphDriver,
     bfs_origin_node_uuids: list[str] | None,
     search_filter: SearchFilters,
     bfs_max_depth: int,
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
-) -> list[EntityNode]:
+) -> tuple[list[EntityNode], list[float]]:
+    """
+    Level-by-level BFS over RELATES_TO and MENTIONS from the origin nodes.
+
+    Each level expands the deduplicated frontier with one query and hydrates the newly reached
+    entities that match the filters with another. The search stops as soon as limit entities
+    are found. Entities are returned nearest first with their bfs_depth_score.
+    """
     if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0 or bfs_max_depth < 1:
-        return []
+        return [], []
 
     filter_queries, filter_params = node_search_filter_query_constructor(
         search_filter, driver.provider
@@ -781,74 +1357,71 @@ async def node_bfs_search(
 
     if group_ids is not None:
         filter_queries.append('n.group_id IN $group_ids')
-        filter_queries.append('origin.group_id IN $group_ids')
         filter_params['group_ids'] = group_ids
 
     filter_query = ''
     if filter_queries:
         filter_query = ' AND ' + (' AND '.join(filter_queries))
 
-    match_queries = [
-        f"""
-        UNWIND $bfs_origin_node_uuids AS origin_uuid
-        MATCH (origin {{uuid: origin_uuid}})-[:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(n:Entity)
-        WHERE n.group_id = origin.group_id
+    query = (
         """
-    ]
+        MATCH (n:Entity)
+        WHERE n.uuid IN $uuids
+        """
+        + filter_query
+        + """
+        RETURN
+        """
+        + get_entity_node_return_query(driver.provider)
+        + """
+        LIMIT $limit
+        """
+    )
 
-    if driver.provider == GraphProvider.NEPTUNE:
-        match_queries = [
-            f"""
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH (origin {{uuid: origin_uuid}})-[e:RELATES_TO|MENTIONS*1..{bfs_max_depth}]->(n:Entity)
-            WHERE origin:Entity OR origin.Episode
-            AND n.group_id = origin.group_id
-            """
-        ]
+    nodes: list[EntityNode] = []
+    scores: list[float] = []
+    frontier = list(dict.fromkeys(bfs_origin_node_uuids))
+    visited = set(frontier)
+    for depth in range(1, bfs_max_depth + 1):
+        frontier = await _bfs_next_frontier(driver, frontier, visited, group_ids)
+        if not frontier:
+            break
+        visited.update(frontier)
 
-    if driver.provider == GraphProvider.KUZU:
-        depth = bfs_max_depth * 2
-        match_queries = [
-            """
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH (origin:Episodic {uuid: origin_uuid})-[:MENTIONS]->(n:Entity)
-            WHERE n.group_id = origin.group_id
-            """,
-            f"""
-            UNWIND $bfs_origin_node_uuids AS origin_uuid
-            MATCH (origin:Entity {{uuid: origin_uuid}})-[:RELATES_TO*2..{depth}]->(n:Entity)
-            WHERE n.group_id = origin.group_id
-            """,
-        ]
-        if bfs_max_depth > 1:
-            depth = (bfs_max_depth - 1) * 2
-            match_queries.append(f"""
-                UNWIND $bfs_origin_node_uuids AS origin_uuid
-                MATCH (origin:Episodic {{uuid: origin_uuid}})-[:MENTIONS]->(:Entity)-[:RELATES_TO*2..{depth}]->(n:Entity)
-                WHERE n.group_id = origin.group_id
-            """)
-
-    records = []
-    for match_query in match_queries:
-        sub_records, _, _ = await driver.execute_query(
-            match_query
-            + filter_query
-            + """
-            RETURN
-            """
-            + get_entity_node_return_query(driver.provider)
-            + """
-            LIMIT $limit
-            """,
-            bfs_origin_node_uuids=bfs_origin_node_uuids,
-            limit=limit,
+        records, _, _ = await driver.execute_query(
+            query,
+            uuids=frontier,
+            limit=limit - len(nodes),
             routing_='r',
             **filter_params,
         )
-        records.extend(sub_records)
+        # Keep the frontier order so results do not depend on the database's return order
+        level_nodes = {
+            node.uuid: node
+            for node in (get_entity_node_from_record(record, driver.provider) for record in records)
+        }
+        for uuid in frontier:
+            if uuid in level_nodes:
+                nodes.append(level_nodes[uuid])
+                scores.append(bfs_depth_score(depth))
 
-    nodes = [get_entity_node_from_record(record, driver.provider) for record in records]
+        if len(nodes) >= limit:
+            break
 
+    return nodes[:limit], scores[:limit]
+
+
+async def node_bfs_search(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    search_filter: SearchFilters,
+    bfs_max_depth: int,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+) -> list[EntityNode]:
+    nodes, _ = await node_bfs_search_scored(
+        driver, bfs_origin_node_uuids, search_filter, bfs_max_depth, group_ids, limit
+    )
     return nodes
 
 
@@ -876,7 +1449,7 @@ async def episode_fulltext_search(
         filter_params['group_ids'] = group_ids
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('episode_content', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('episode_content', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             input_ids = []
             for r in res['hits']['hits']:
@@ -960,7 +1533,7 @@ async def community_fulltext_search(
         yield_query = 'WITH node AS c, score'
 
     if driver.provider == GraphProvider.NEPTUNE:
-        res = driver.run_aoss_query('community_name', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
+        res = await driver.run_aoss_query('community_name', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
             # Calculate Cosine similarity then return the edge ids
             input_ids = []
@@ -1054,15 +1627,8 @@ async def community_similarity_search(
         )
 
         if len(resp) > 0:
-            # Calculate Cosine similarity then return the edge ids
-            input_ids = []
-            for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+            # Calculate Cosine similarity then return the top ids
+            input_ids = _score_neptune_embeddings(search_vector, resp, min_score, limit)
 
             # Match the edge ides and return the values
             query = """
@@ -1398,13 +1964,7 @@ async def get_relevant_edges(
         )
 
         # Calculate Cosine similarity then return the edge ids
-        input_ids = []
-        for r in resp:
-            score = calculate_cosine_similarity(
-                list(map(float, r['source_embedding'].split(','))), r['target_embedding']
-            )
-            if score > min_score:
-                input_ids.append({'id': r['id'], 'score': score, 'uuid': r['search_edge_uuid']})
+        input_ids = _score_neptune_edge_candidates(edges, resp, min_score)
 
         # Match the edge ides and return the values
         query = """
@@ -1585,13 +2145,7 @@ async def get_edge_invalidation_candidates(
         )
 
         # Calculate Cosine similarity then return the edge ids
-        input_ids = []
-        for r in resp:
-            score = calculate_cosine_similarity(
-                list(map(float, r['source_embedding'].split(','))), r['target_embedding']
-            )
-            if score > min_score:
-                input_ids.append({'id': r['id'], 'score': score, 'uuid': r['search_edge_uuid']})
+        input_ids = _score_neptune_edge_candidates(edges, resp, min_score)
 
         # Match the edge ides and return the values
         query = """
@@ -1748,57 +2302,94 @@ def rrf(
     ]
 
 
+def _entity_neighbors_query(provider: GraphProvider, candidates_only: bool) -> str:
+    relates_to = (
+        '-[:RELATES_TO]-(:RelatesToNode_)-[:RELATES_TO]-'
+        if provider == GraphProvider.KUZU
+        else '-[:RELATES_TO]-'
+    )
+    candidate_filter = 'WHERE m.uuid IN $candidate_uuids' if candidates_only else ''
+    limit = '' if candidates_only else 'LIMIT $frontier_limit'
+
+    return f"""
+        UNWIND $frontier AS frontier_uuid
+        MATCH (n:Entity {{uuid: frontier_uuid}}){relates_to}(m:Entity)
+        {candidate_filter}
+        RETURN DISTINCT m.uuid AS uuid
+        {limit}
+    """
+
+
 async def node_distance_reranker(
     driver: GraphDriver,
     node_uuids: list[str],
     center_node_uuid: str,
     min_score: float = 0,
+    max_depth: int = MAX_SEARCH_DEPTH,
 ) -> tuple[list[str], list[float]]:
-    # filter out node_uuid center node node uuid
-    filtered_uuids = list(filter(lambda node_uuid: node_uuid != center_node_uuid, node_uuids))
-    scores: dict[str, float] = {center_node_uuid: 0.0}
-
-    query = """
-    UNWIND $node_uuids AS node_uuid
-    MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]-(n:Entity {uuid: node_uuid})
-    RETURN 1 AS score, node_uuid AS uuid
     """
-    if driver.provider == GraphProvider.KUZU:
-        query = """
-        UNWIND $node_uuids AS node_uuid
-        MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(n:Entity {uuid: node_uuid})
-        RETURN 1 AS score, node_uuid AS uuid
-        """
+    Rerank nodes by their RELATES_TO hop distance from the center node, scored 1 / distance.
 
-    # Find the shortest path to center node
-    results, header, _ = await driver.execute_query(
-        query,
-        node_uuids=filtered_uuids,
-        center_uuid=center_node_uuid,
-        routing_='r',
+    Distances are found with one BFS from the center, level by level and up to max_depth hops.
+    Each level runs one query for the candidates adjacent to the frontier and one for the next
+    frontier, and the BFS stops once every candidate is placed. Frontiers are capped at
+    BFS_MAX_FRONTIER_SIZE. Candidates that are not reached get a score of 0. Ties keep their
+    input order.
+    """
+    # filter out node_uuid center node node uuid
+    filtered_uuids = list(
+        dict.fromkeys(node_uuid for node_uuid in node_uuids if node_uuid != center_node_uuid)
     )
-    if driver.provider == GraphProvider.FALKORDB:
-        results = [dict(zip(header, row, strict=True)) for row in results]
+    distances: dict[str, int] = {}
+
+    remaining = set(filtered_uuids)
+    frontier = [center_node_uuid]
+    visited = {center_node_uuid}
+    for depth in range(1, max_depth + 1):
+        if not remaining or not frontier:
+            break
+
+        hits_query = driver.execute_query(
+            _entity_neighbors_query(driver.provider, candidates_only=True),
+            frontier=frontier,
+            candidate_uuids=list(remaining),
+            routing_='r',
+        )
+        if depth < max_depth:
+            (hits, _, _), (neighbors, _, _) = await semaphore_gather(
+                hits_query,
+                driver.execute_query(
+                    _entity_neighbors_query(driver.provider, candidates_only=False),
+                    frontier=frontier,
+                    frontier_limit=BFS_MAX_FRONTIER_SIZE,
+                    routing_='r',
+                ),
+            )
+        else:
+            (hits, _, _), neighbors = await hits_query, []
 
-    for result in results:
-        uuid = result['uuid']
-        score = result['score']
-        scores[uuid] = score
+        for record in hits:
+            if record['uuid'] in remaining:
+                distances[record['uuid']] = depth
+                remaining.discard(record['uuid'])
 
-    for uuid in filtered_uuids:
-        if uuid not in scores:
-            scores[uuid] = float('inf')
+        frontier = [record['uuid'] for record in neighbors if record['uuid'] not in visited]
+        visited.update(frontier)
+
+    scores: dict[str, float] = {
+        uuid: 1 / distances[uuid] if uuid in distances else 0.0 for uuid in filtered_uuids
+    }
 
     # rerank on shortest distance
-    filtered_uuids.sort(key=lambda cur_uuid: scores[cur_uuid])
+    filtered_uuids.sort(key=lambda cur_uuid: distances.get(cur_uuid, float('inf')))
 
     # add back in filtered center uuid if it was filtered out
     if center_node_uuid in node_uuids:
-        scores[center_node_uuid] = 0.1
+        scores[center_node_uuid] = 10.0
         filtered_uuids = [center_node_uuid] + filtered_uuids
 
-    return [uuid for uuid in filtered_uuids if (1 / scores[uuid]) >= min_score], [
-        1 / scores[uuid] for uuid in filtered_uuids if (1 / scores[uuid]) >= min_score
+    return [uuid for uuid in filtered_uuids if scores[uuid] >= min_score], [
+        scores[uuid] for uuid in filtered_uuids if scores[uuid] >= min_score
     ]
 
 
@@ -1840,40 +2431,49 @@ def maximal_marginal_relevance(
     candidates: dict[str, list[float]],
     mmr_lambda: float = DEFAULT_MMR_LAMBDA,
     min_score: float = -2.0,
+    limit: int | None = None,
 ) -> tuple[list[str], list[float]]:
-    start = time()
-    query_array = np.array(query_vector)
-    candidate_arrays: dict[str, NDArray] = {}
-    for uuid, embedding in candidates.items():
-        candidate_arrays[uuid] = normalize_l2(embedding)
-
-    uuids: list[str] = list(candidate_arrays.keys())
-
-    similarity_matrix = np.zeros((len(uuids), len(uuids)))
-
-    for i, uuid_1 in enumerate(uuids):
-        for j, uuid_2 in enumerate(uuids[:i]):
-            u = candidate_arrays[uuid_1]
-            v = candidate_arrays[uuid_2]
-            similarity = np.dot(u, v)
-
-            similarity_matrix[i, j] = similarity
-            similarity_matrix[j, i] = similarity
+    """
+    Greedily selects up to `limit` candidates, each time taking the one that maximizes
+    mmr_lambda * relevance - (1 - mmr_lambda) * (max similarity to the already selected items).
 
-    mmr_scores: dict[str, float] = {}
-    for i, uuid in enumerate(uuids):
-        max_sim = np.max(similarity_matrix[i, :])
-        mmr = mmr_lambda * np.dot(query_array, candidate_arrays[uuid]) + (mmr_lambda - 1) * max_sim
-        mmr_scores[uuid] = mmr
+    Candidate similarities are computed with a single matrix product and the max similarity to the
+    selected set is updated incrementally, so selection costs O(limit * n) after the product.
+    """
+    start = time()
+    uuids: list[str] = list(candidates.keys())
+    if len(uuids) == 0:
+        return [], []
 
-    uuids.sort(reverse=True, key=lambda c: mmr_scores[c])
+    candidate_matrix = normalize_rows(
+        np.array([candidates[uuid] for uuid in uuids], dtype=np.float64)
+    )
+    query_array = np.asarray(query_vector, dtype=np.float64)
+
+    relevance = candidate_matrix @ query_array
+    similarity_matrix = candidate_matrix @ candidate_matrix.T
+
+    num_selections = len(uuids) if limit is None else min(max(limit, 0), len(uuids))
+    max_sim = np.zeros(len(uuids))
+    available = np.ones(len(uuids), dtype=bool)
+    selected_uuids: list[str] = []
+    selected_scores: list[float] = []
+    for step in range(num_selections):
+        mmr_scores = mmr_lambda * relevance + (mmr_lambda - 1) * max_sim
+        mmr_scores[~available] = -np.inf
+        i = int(np.argmax(mmr_scores))
+        available[i] = False
+        if step + 1 < num_selections:
+            np.maximum(max_sim, similarity_matrix[:, i], out=max_sim)
+
+        if mmr_scores[i] >= min_score:
+            selected_uuids.append(uuids[i])
+            selected_scores.append(float(mmr_scores[i]))
 
     end = time()
     logger.debug(f'Completed MMR reranking in {(end - start) * 1000} ms')
 
-    return [uuid for uuid in uuids if mmr_scores[uuid] >= min_score], [
-        mmr_scores[uuid] for uuid in uuids if mmr_scores[uuid] >= min_score
-    ]
+    return selected_uuids, selected_scores
 
 
 async def get_embeddings_for_nodes(
@@ -16,7 +16,9 @@ limitations under the License.
 
 import json
 import logging
+import os
 import typing
+from collections import defaultdict
 from datetime import datetime
 
 import numpy as np
@@ -31,7 +33,7 @@ from graphiti_core.driver.driver import (
 from graphiti_core.edges import Edge, EntityEdge, EpisodicEdge, create_entity_edge_embeddings
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.graphiti_types import GraphitiClients
-from graphiti_core.helpers import normalize_l2, semaphore_gather
+from graphiti_core.helpers import semaphore_gather
 from graphiti_core.models.edges.edge_db_queries import (
     get_entity_edge_save_bulk_query,
     get_episodic_edge_save_bulk_query,
@@ -40,10 +42,17 @@ from graphiti_core.models.nodes.node_db_queries import (
     get_entity_node_save_bulk_query,
     get_episode_node_save_bulk_query,
 )
-from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.nodes import (
+    EntityNode,
+    EpisodeType,
+    EpisodicNode,
+    create_entity_node_embeddings,
+)
+from graphiti_core.search.search_utils import normalize_rows
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
 from graphiti_core.utils.maintenance.dedup_helpers import (
     DedupResolutionState,
+    _add_candidates,
     _build_candidate_indexes,
     _normalize_string_exact,
     _resolve_with_similarity,
@@ -64,6 +73,7 @@ from graphiti_core.utils.maintenance.node_operations import (
 logger = logging.getLogger(__name__)
 
 CHUNK_SIZE = 10
+BULK_WRITE_CHUNK_SIZE = int(os.getenv('BULK_WRITE_CHUNK_SIZE', 1000))
 
 
 def _build_directed_uuid_map(pairs: list[tuple[str, str]]) -> dict[str, str]:
@@ -132,20 +142,87 @@ async def add_nodes_and_edges_bulk(
     entity_nodes: list[EntityNode],
     entity_edges: list[EntityEdge],
     embedder: EmbedderClient,
+    chunk_size: int | None = BULK_WRITE_CHUNK_SIZE,
 ):
-    session = driver.session()
-    try:
-        await session.execute_write(
-            add_nodes_and_edges_bulk_tx,
-            episodic_nodes,
-            episodic_edges,
-            entity_nodes,
-            entity_edges,
-            embedder,
-            driver=driver,
-        )
-    finally:
-        await session.close()
+    """Save nodes and edges in write transactions of at most chunk_size items each.
+
+    Missing embeddings are generated in batches before any transaction is opened, so write
+    transactions are never held open across embedding requests. Chunks are written in
+    dependency order (episodes, entities, episodic edges, entity edges); each chunk commits
+    on its own. Pass chunk_size=None to write everything in a single transaction.
+    """
+    await create_entity_node_embeddings(
+        embedder, [node for node in entity_nodes if node.name_embedding is None]
+    )
+    await create_entity_edge_embeddings(
+        embedder, [edge for edge in entity_edges if edge.fact_embedding is None]
+    )
+
+    for chunk in _chunk_bulk_payload(
+        episodic_nodes, episodic_edges, entity_nodes, entity_edges, chunk_size
+    ):
+        session = driver.session()
+        try:
+            await session.execute_write(
+                add_nodes_and_edges_bulk_tx,
+                *chunk,
+                embedder,
+                driver=driver,
+            )
+        finally:
+            await session.close()
+
+    if driver.vector_indexes is not None:
+        driver.vector_indexes.add_nodes(entity_nodes)
+        driver.vector_indexes.add_edges(entity_edges)
+
+
+def _chunk_bulk_payload(
+    episodic_nodes: list[EpisodicNode],
+    episodic_edges: list[EpisodicEdge],
+    entity_nodes: list[EntityNode],
+    entity_edges: list[EntityEdge],
+    chunk_size: int | None,
+) -> list[tuple[list[EpisodicNode], list[EpisodicEdge], list[EntityNode], list[EntityEdge]]]:
+    """Split a bulk write into chunks of at most chunk_size items.
+
+    Items fill chunks in the order they must be written, so nodes always land in the same or an
+    earlier chunk than the edges that reference them.
+    """
+    if chunk_size is None:
+        return [(episodic_nodes, episodic_edges, entity_nodes, entity_edges)]
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+
+    chunks: list[
+        tuple[list[EpisodicNode], list[EpisodicEdge], list[EntityNode], list[EntityEdge]]
+    ] = []
+    chunk: tuple[list[EpisodicNode], list[EpisodicEdge], list[EntityNode], list[EntityEdge]] = (
+        [],
+        [],
+        [],
+        [],
+    )
+    size = 0
+    # (position in the chunk tuple, items) in write order
+    payloads: list[tuple[int, list[Any]]] = [
+        (0, episodic_nodes),
+        (2, entity_nodes),
+        (1, episodic_edges),
+        (3, entity_edges),
+    ]
+    for position, items in payloads:
+        for item in items:
+            if size >= chunk_size:
+                chunks.append(chunk)
+                chunk = ([], [], [], [])
+                size = 0
+            chunk[position].append(item)
+            size += 1
+
+    chunks.append(chunk)
+
+    return chunks
 
 
 async def add_nodes_and_edges_bulk_tx(
@@ -157,6 +234,15 @@ async def add_nodes_and_edges_bulk_tx(
     embedder: EmbedderClient,
     driver: GraphDriver,
 ):
+    # add_nodes_and_edges_bulk embeds before opening the transaction, so this only makes
+    # requests for direct callers that pass nodes or edges without embeddings
+    await create_entity_node_embeddings(
+        embedder, [node for node in entity_nodes if node.name_embedding is None]
+    )
+    await create_entity_edge_embeddings(
+        embedder, [edge for edge in entity_edges if edge.fact_embedding is None]
+    )
+
     episodes = [dict(episode) for episode in episodic_nodes]
     for episode in episodes:
         episode['source'] = str(episode['source'].value)
@@ -165,9 +251,6 @@ async def add_nodes_and_edges_bulk_tx(
     nodes = []
 
     for node in entity_nodes:
-        if node.name_embedding is None:
-            await node.generate_name_embedding(embedder)
-
         entity_data: dict[str, Any] = {
             'uuid': node.uuid,
             'name': node.name,
@@ -188,8 +271,6 @@ async def add_nodes_and_edges_bulk_tx(
 
     edges = []
     for edge in entity_edges:
-        if edge.fact_embedding is None:
-            await edge.generate_embedding(embedder)
         edge_data: dict[str, Any] = {
             'uuid': edge.uuid,
             'source_node_uuid': edge.source_node_uuid,
@@ -221,34 +302,25 @@ async def add_nodes_and_edges_bulk_tx(
         )
         await driver.graph_operations_interface.edge_save_bulk(None, driver, tx, edges)
 
-    elif driver.provider == GraphProvider.KUZU:
-        # FIXME: Kuzu's UNWIND does not currently support STRUCT[] type properly, so we insert the data one by one instead for now.
-        episode_query = get_episode_node_save_bulk_query(driver.provider)
-        for episode in episodes:
-            await tx.run(episode_query, **episode)
-        entity_node_query = get_entity_node_save_bulk_query(driver.provider, nodes)
-        for node in nodes:
-            await tx.run(entity_node_query, **node)
-        entity_edge_query = get_entity_edge_save_bulk_query(driver.provider)
-        for edge in edges:
-            await tx.run(entity_edge_query, **edge)
-        episodic_edge_query = get_episodic_edge_save_bulk_query(driver.provider)
-        for edge in episodic_edges:
-            await tx.run(episodic_edge_query, **edge.model_dump())
     else:
-        await tx.run(get_episode_node_save_bulk_query(driver.provider), episodes=episodes)
-        await tx.run(
-            get_entity_node_save_bulk_query(driver.provider, nodes),
-            nodes=nodes,
-        )
-        await tx.run(
-            get_episodic_edge_save_bulk_query(driver.provider),
-            episodic_edges=[edge.model_dump() for edge in episodic_edges],
-        )
-        await tx.run(
-            get_entity_edge_save_bulk_query(driver.provider),
-            entity_edges=edges,
-        )
+        # Kuzu cannot bind an empty list parameter, so empty payloads are skipped
+        if episodes:
+            await tx.run(get_episode_node_save_bulk_query(driver.provider), episodes=episodes)
+        if nodes:
+            await tx.run(
+                get_entity_node_save_bulk_query(driver.provider, nodes),
+                nodes=nodes,
+            )
+        if episodic_edges:
+            await tx.run(
+                get_episodic_edge_save_bulk_query(driver.provider),
+                episodic_edges=[edge.model_dump() for edge in episodic_edges],
+            )
+        if edges:
+            await tx.run(
+                get_entity_edge_save_bulk_query(driver.provider),
+                entity_edges=edges,
+            )
 
 
 async def extract_nodes_and_edges_bulk(
@@ -324,33 +396,22 @@ async def dedupe_nodes_bulk(
         duplicate_pairs.extend((source.uuid, target.uuid) for source, target in duplicates)
 
     canonical_nodes: dict[str, EntityNode] = {}
+    # Incrementally maintained index over the canonical pool, so each node is hashed once
+    indexes = _build_candidate_indexes([])
     for _, resolved_nodes in episode_resolutions:
         for node in resolved_nodes:
-            # NOTE: this loop is O(n^2) in the number of nodes inside the batch because we rebuild
-            # the MinHash index for the accumulated canonical pool each time. The LRU-backed
-            # shingle cache keeps the constant factors low for typical batch sizes (≤ CHUNK_SIZE),
-            # but if batches grow significantly we should switch to an incremental index or chunked
-            # processing.
             if not canonical_nodes:
                 canonical_nodes[node.uuid] = node
+                _add_candidates(indexes, [node])
                 continue
 
-            existing_candidates = list(canonical_nodes.values())
-            normalized = _normalize_string_exact(node.name)
-            exact_match = next(
-                (
-                    candidate
-                    for candidate in existing_candidates
-                    if _normalize_string_exact(candidate.name) == normalized
-                ),
-                None,
-            )
-            if exact_match is not None:
+            exact_matches = indexes.normalized_existing.get(_normalize_string_exact(node.name))
+            if exact_matches:
+                exact_match = exact_matches[0]
                 if exact_match.uuid != node.uuid:
                     duplicate_pairs.append((node.uuid, exact_match.uuid))
                 continue
 
-            indexes = _build_candidate_indexes(existing_candidates)
             state = DedupResolutionState(
                 resolved_nodes=[None],
                 uuid_map={},
@@ -361,10 +422,13 @@ async def dedupe_nodes_bulk(
             resolved = state.resolved_nodes[0]
             if resolved is None:
                 canonical_nodes[node.uuid] = node
+                _add_candidates(indexes, [node])
                 continue
 
             canonical_uuid = resolved.uuid
-            canonical_nodes.setdefault(canonical_uuid, resolved)
+            if canonical_uuid not in canonical_nodes:
+                canonical_nodes[canonical_uuid] = resolved
+                _add_candidates(indexes, [resolved])
             if canonical_uuid != node.uuid:
                 duplicate_pairs.append((node.uuid, canonical_uuid))
 
@@ -399,6 +463,46 @@ async def dedupe_nodes_bulk(
     return nodes_by_episode, compressed_map
 
 
+def _find_edge_dedupe_candidates(
+    edges: list[EntityEdge], min_score: float
+) -> dict[str, list[EntityEdge]]:
+    """Find dedupe candidates among edges that share the same source and target nodes.
+
+    Two edges are candidates for each other when their facts share a word (a cheap stand-in
+    for BM25 that casts a wider net) or when their fact embeddings have a cosine similarity of
+    at least min_score. Both checks run as one matrix product over the group.
+    """
+    if len(edges) == 1:
+        return {edges[0].uuid: []}
+
+    # Word overlap: binary edge x vocabulary matrix, overlap where the product is non-zero
+    vocabulary: dict[str, int] = {}
+    word_ids = [
+        [vocabulary.setdefault(word, len(vocabulary)) for word in set(edge.fact.lower().split())]
+        for edge in edges
+    ]
+    words = np.zeros((len(edges), max(len(vocabulary), 1)), dtype=np.float32)
+    for i, ids in enumerate(word_ids):
+        words[i, ids] = 1.0
+    matches = (words @ words.T) > 0
+
+    dim = next((len(edge.fact_embedding) for edge in edges if edge.fact_embedding), 0)
+    if dim:
+        embeddings = np.zeros((len(edges), dim), dtype=np.float64)
+        for i, edge in enumerate(edges):
+            if edge.fact_embedding and len(edge.fact_embedding) == dim:
+                embeddings[i] = edge.fact_embedding
+        normalized = normalize_rows(embeddings)
+        matches |= (normalized @ normalized.T) >= min_score
+
+    uuids = np.array([edge.uuid for edge in edges])
+    matches &= uuids[:, None] != uuids[None, :]
+
+    return {
+        edge.uuid: [edges[j] for j in np.flatnonzero(matches[i])] for i, edge in enumerate(edges)
+    }
+
+
 async def dedupe_edges_bulk(
     clients: GraphitiClients,
     extracted_edges: list[list[EntityEdge]],
@@ -410,48 +514,27 @@ async def dedupe_edges_bulk(
     embedder = clients.embedder
     min_score = 0.6
 
-    # generate embeddings
-    await semaphore_gather(
-        *[create_entity_edge_embeddings(embedder, edges) for edges in extracted_edges]
+    # generate embeddings for all episodes in one batch
+    await create_entity_edge_embeddings(
+        embedder, [edge for edges in extracted_edges for edge in edges]
     )
 
-    # Find similar results
-    dedupe_tuples: list[tuple[EpisodicNode, EntityEdge, list[EntityEdge]]] = []
-    for i, edges_i in enumerate(extracted_edges):
-        existing_edges: list[EntityEdge] = []
-        for edges_j in extracted_edges:
-            existing_edges += edges_j
-
-        for edge in edges_i:
-            candidates: list[EntityEdge] = []
-            for existing_edge in existing_edges:
-                # Skip self-comparison
-                if edge.uuid == existing_edge.uuid:
-                    continue
-                # Approximate BM25 by checking for word overlaps (this is faster than creating many in-memory indices)
-                # This approach will cast a wider net than BM25, which is ideal for this use case
-                if (
-                    edge.source_node_uuid != existing_edge.source_node_uuid
-                    or edge.target_node_uuid != existing_edge.target_node_uuid
-                ):
-                    continue
-
-                edge_words = set(edge.fact.lower().split())
-                existing_edge_words = set(existing_edge.fact.lower().split())
-                has_overlap = not edge_words.isdisjoint(existing_edge_words)
-                if has_overlap:
-                    candidates.append(existing_edge)
-                    continue
-
-                # Check for semantic similarity even if there is no overlap
-                similarity = np.dot(
-                    normalize_l2(edge.fact_embedding or []),
-                    normalize_l2(existing_edge.fact_embedding or []),
-                )
-                if similarity >= min_score:
-                    candidates.append(existing_edge)
+    # Only edges between the same pair of nodes can be duplicates, so candidates are found
+    # within each (source, target) group
+    edges_by_endpoints: dict[tuple[str, str], list[EntityEdge]] = defaultdict(list)
+    for edges in extracted_edges:
+        for edge in edges:
+            edges_by_endpoints[(edge.source_node_uuid, edge.target_node_uuid)].append(edge)
 
-            dedupe_tuples.append((episode_tuples[i][0], edge, candidates))
+    candidates_by_uuid: dict[str, list[EntityEdge]] = {}
+    for group_edges in edges_by_endpoints.values():
+        candidates_by_uuid.update(_find_edge_dedupe_candidates(group_edges, min_score))
+
+    dedupe_tuples: list[tuple[EpisodicNode, EntityEdge, list[EntityEdge]]] = [
+        (episode_tuples[i][0], edge, candidates_by_uuid[edge.uuid])
+        for i, edges in enumerate(extracted_edges)
+        for edge in edges
+    ]
 
     bulk_edge_resolutions: list[
         tuple[EntityEdge, EntityEdge, list[EntityEdge]]
@@ -1,12 +1,15 @@
 import asyncio
+import hashlib
 import logging
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict
 
+import numpy as np
 from pydantic import BaseModel
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.edges import CommunityEdge
 from graphiti_core.embedder import EmbedderClient
+from graphiti_core.embedder.batching import chunk_inputs
 from graphiti_core.helpers import semaphore_gather
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.models.nodes.node_db_queries import COMMUNITY_NODE_RETURN
@@ -15,8 +18,20 @@ from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.summarize_nodes import Summary, SummaryDescription
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.edge_operations import build_community_edges
+from graphiti_core.utils.maintenance.graph_projection import (
+    GraphProjection,
+    get_graph_projection,
+    label_propagation_csr,
+)
+from graphiti_core.utils.text_utils import MAX_SUMMARY_CHARS, truncate_at_sentence
 
 MAX_COMMUNITY_BUILD_CONCURRENCY = 10
+# Fraction of a community's members that must join or leave before its summary is regenerated
+COMMUNITY_RESUMMARIZE_THRESHOLD = 0.2
+# Summaries combined per LLM call, and the estimated input tokens allowed per call
+COMMUNITY_SUMMARY_FAN_IN = 8
+COMMUNITY_SUMMARY_TOKEN_BUDGET = 2000
+DEFAULT_SUMMARY_CACHE_SIZE = 10_000
 
 logger = logging.getLogger(__name__)
 
@@ -26,51 +41,68 @@ class Neighbor(BaseModel):
     edge_count: int
 
 
+class CommunitySummaryCache:
+    """
+    LRU cache of intermediate community summaries.
+
+    Keys cover the uuids and summaries of the members a summary was reduced from, so a subtree
+    is reused across builds only while the same members still have the same summaries.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_SUMMARY_CACHE_SIZE):
+        self.max_size = max_size
+        self._summaries: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    @staticmethod
+    def make_key(members: list[EntityNode]) -> str:
+        key = '\n'.join(sorted(f'{member.uuid}:{member.summary}' for member in members))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        summary = self._summaries.get(key)
+        if summary is not None:
+            self._summaries.move_to_end(key)
+        return summary
+
+    def set(self, key: str, summary: str):
+        self._summaries[key] = summary
+        self._summaries.move_to_end(key)
+        while len(self._summaries) > self.max_size:
+            self._summaries.popitem(last=False)
+
+
+async def get_entity_group_ids(driver: GraphDriver) -> list[str]:
+    group_id_values, _, _ = await driver.execute_query(
+        """
+        MATCH (n:Entity)
+        WHERE n.group_id IS NOT NULL
+        RETURN
+            collect(DISTINCT n.group_id) AS group_ids
+        """
+    )
+
+    return group_id_values[0]['group_ids'] if group_id_values else []
+
+
 async def get_community_clusters(
     driver: GraphDriver, group_ids: list[str] | None
 ) -> list[list[EntityNode]]:
     community_clusters: list[list[EntityNode]] = []
 
     if group_ids is None:
-        group_id_values, _, _ = await driver.execute_query(
-            """
-            MATCH (n:Entity)
-            WHERE n.group_id IS NOT NULL
-            RETURN
-                collect(DISTINCT n.group_id) AS group_ids
-            """
-        )
-
-        group_ids = group_id_values[0]['group_ids'] if group_id_values else []
+        group_ids = await get_entity_group_ids(driver)
 
     for group_id in group_ids:
-        projection: dict[str, list[Neighbor]] = {}
-        nodes = await EntityNode.get_by_group_ids(driver, [group_id])
-        for node in nodes:
-            match_query = """
-                MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[e:RELATES_TO]-(m: Entity {group_id: $group_id})
-            """
-            if driver.provider == GraphProvider.KUZU:
-                match_query = """
-                MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m: Entity {group_id: $group_id})
-                """
-            records, _, _ = await driver.execute_query(
-                match_query
-                + """
-                WITH count(e) AS count, m.uuid AS uuid
-                RETURN
-                    uuid,
-                    count
-                """,
-                uuid=node.uuid,
-                group_id=group_id,
-            )
+        projection = await get_graph_projection(driver, group_id)
+        labels = label_propagation_csr(projection)
 
-            projection[node.uuid] = [
-                Neighbor(node_uuid=record['uuid'], edge_count=record['count']) for record in records
-            ]
-
-        cluster_uuids = label_propagation(projection)
+        cluster_map: dict[int, list[str]] = defaultdict(list)
+        for uuid, label in zip(projection.uuids, labels.tolist(), strict=True):
+            cluster_map[label].append(uuid)
+        cluster_uuids = list(cluster_map.values())
 
         community_clusters.extend(
             list(
@@ -89,46 +121,57 @@ def label_propagation(projection: dict[str, list[Neighbor]]) -> list[list[str]]:
     # 2. Each node will take on the community of the plurality of its neighbors
     # 3. Ties are broken by going to the largest community
     # 4. Continue until no communities change during propagation
+    # The rounds run on a CSR projection in label_propagation_csr.
 
-    community_map = {uuid: i for i, uuid in enumerate(projection.keys())}
-
-    while True:
-        no_change = True
-        new_community_map: dict[str, int] = {}
+    uuids = list(projection.keys())
+    labels = label_propagation_csr(_neighbor_projection_to_csr(uuids, projection))
 
-        for uuid, neighbors in projection.items():
-            curr_community = community_map[uuid]
-
-            community_candidates: dict[int, int] = defaultdict(int)
-            for neighbor in neighbors:
-                community_candidates[community_map[neighbor.node_uuid]] += neighbor.edge_count
-            community_lst = [
-                (count, community) for community, count in community_candidates.items()
-            ]
+    community_cluster_map = defaultdict(list)
+    for uuid, community in zip(uuids, labels.tolist(), strict=True):
+        community_cluster_map[community].append(uuid)
 
-            community_lst.sort(reverse=True)
-            candidate_rank, community_candidate = community_lst[0] if community_lst else (0, -1)
-            if community_candidate != -1 and candidate_rank > 1:
-                new_community = community_candidate
-            else:
-                new_community = max(community_candidate, curr_community)
+    clusters = [cluster for cluster in community_cluster_map.values()]
+    return clusters
 
-            new_community_map[uuid] = new_community
 
-            if new_community != curr_community:
-                no_change = False
+def propagate_labels(
+    projection: dict[str, list[Neighbor]], community_map: dict[str, int]
+) -> dict[str, int]:
+    """
+    Run label propagation from the starting labels in community_map until no label changes.
 
-        if no_change:
-            break
+    Only the nodes in the projection are relabeled. Neighbors outside the projection keep their
+    label from community_map, which lets a subgraph be re-clustered against a fixed boundary.
+    Returns the final labels of the projection's nodes.
+    """
+    uuids = list(projection.keys())
+    uuids.extend(
+        sorted(
+            {neighbor.node_uuid for neighbors in projection.values() for neighbor in neighbors}
+            - projection.keys()
+        )
+    )
+    fixed = np.arange(len(uuids)) >= len(projection)
+    labels = label_propagation_csr(
+        _neighbor_projection_to_csr(uuids, projection),
+        np.array([community_map[uuid] for uuid in uuids], dtype=np.int64),
+        fixed,
+    )
 
-        community_map = new_community_map
+    return {uuid: int(labels[i]) for i, uuid in enumerate(projection)}
 
-    community_cluster_map = defaultdict(list)
-    for uuid, community in community_map.items():
-        community_cluster_map[community].append(uuid)
 
-    clusters = [cluster for cluster in community_cluster_map.values()]
-    return clusters
+def _neighbor_projection_to_csr(
+    uuids: list[str], projection: dict[str, list[Neighbor]]
+) -> GraphProjection:
+    return GraphProjection.from_edges(
+        uuids,
+        (
+            (uuid, neighbor.node_uuid, neighbor.edge_count)
+            for uuid, neighbors in projection.items()
+            for neighbor in neighbors
+        ),
+    )
 
 
 async def summarize_pair(llm_client: LLMClient, summary_pair: tuple[str, str]) -> str:
@@ -164,33 +207,90 @@ async def generate_summary_description(llm_client: LLMClient, summary: str) -> s
     return description
 
 
-async def build_community(
-    llm_client: LLMClient, community_cluster: list[EntityNode]
-) -> tuple[CommunityNode, list[CommunityEdge]]:
-    summaries = [entity.summary for entity in community_cluster]
-    length = len(summaries)
-    while length > 1:
-        odd_one_out: str | None = None
-        if length % 2 == 1:
-            odd_one_out = summaries.pop()
-            length -= 1
-        new_summaries: list[str] = list(
-            await semaphore_gather(
-                *[
-                    summarize_pair(llm_client, (str(left_summary), str(right_summary)))
-                    for left_summary, right_summary in zip(
-                        summaries[: int(length / 2)], summaries[int(length / 2) :], strict=False
-                    )
-                ]
-            )
-        )
-        if odd_one_out is not None:
-            new_summaries.append(odd_one_out)
-        summaries = new_summaries
-        length = len(summaries)
+async def summarize_summaries(llm_client: LLMClient, summaries: list[str]) -> str:
+    context = {
+        'node_summaries': [{'summary': summary} for summary in summaries],
+    }
+
+    llm_response = await llm_client.generate_response(
+        prompt_library.summarize_nodes.summarize_summaries(context),
+        response_model=Summary,
+        prompt_name='summarize_nodes.summarize_summaries',
+    )
+
+    return truncate_at_sentence(llm_response.get('summary', ''), MAX_SUMMARY_CHARS)
+
+
+async def summarize_community(
+    llm_client: LLMClient,
+    community_cluster: list[EntityNode],
+    fan_in: int = COMMUNITY_SUMMARY_FAN_IN,
+    token_budget: int = COMMUNITY_SUMMARY_TOKEN_BUDGET,
+    summary_cache: CommunitySummaryCache | None = None,
+) -> tuple[str, str]:
+    """
+    Reduce the member summaries of a cluster to one summary and return it with its name.
+
+    Summaries are combined up to fan_in at a time, with each call's input kept within
+    token_budget, in rounds until one summary is left. A single-member cluster needs no
+    reduction. Intermediate summaries are looked up in and stored to summary_cache if given.
+    """
+    if fan_in < 2:
+        raise ValueError('fan_in must be at least 2')
+
+    # Each entry is the summary of a subtree and the members it was reduced from
+    level: list[tuple[str, list[EntityNode]]] = [
+        (truncate_at_sentence(entity.summary, MAX_SUMMARY_CHARS), [entity])
+        for entity in sorted(community_cluster, key=lambda entity: entity.uuid)
+    ]
+
+    async def reduce_batch(
+        batch: list[tuple[str, list[EntityNode]]],
+    ) -> tuple[str, list[EntityNode]]:
+        if len(batch) == 1:
+            return batch[0]
+
+        members = [member for _, batch_members in batch for member in batch_members]
+        key = CommunitySummaryCache.make_key(members)
+        cached = summary_cache.get(key) if summary_cache is not None else None
+        if cached is not None:
+            return cached, members
 
-    summary = summaries[0]
+        summary = await summarize_summaries(llm_client, [summary for summary, _ in batch])
+        if summary_cache is not None:
+            summary_cache.set(key, summary)
+
+        return summary, members
+
+    while len(level) > 1:
+        summaries = [summary for summary, _ in level]
+        chunks = chunk_inputs(summaries, fan_in, token_budget)
+        if all(len(chunk) == 1 for chunk in chunks):
+            # Every summary exceeds half the budget; fall back to fan-in alone so rounds progress
+            chunks = chunk_inputs(summaries, fan_in)
+
+        batches: list[list[tuple[str, list[EntityNode]]]] = []
+        offset = 0
+        for chunk in chunks:
+            batches.append(level[offset : offset + len(chunk)])
+            offset += len(chunk)
+
+        level = list(await semaphore_gather(*[reduce_batch(batch) for batch in batches]))
+
+    summary = level[0][0]
     name = await generate_summary_description(llm_client, summary)
+
+    return summary, name
+
+
+async def build_community(
+    llm_client: LLMClient,
+    community_cluster: list[EntityNode],
+    summary_cache: CommunitySummaryCache | None = None,
+) -> tuple[CommunityNode, list[CommunityEdge]]:
+    summary, name = await summarize_community(
+        llm_client, community_cluster, summary_cache=summary_cache
+    )
     now = utc_now()
     community_node = CommunityNode(
         name=name,
@@ -210,6 +310,7 @@ async def build_communities(
     driver: GraphDriver,
     llm_client: LLMClient,
     group_ids: list[str] | None,
+    summary_cache: CommunitySummaryCache | None = None,
 ) -> tuple[list[CommunityNode], list[CommunityEdge]]:
     community_clusters = await get_community_clusters(driver, group_ids)
 
@@ -217,7 +318,7 @@ async def build_communities(
 
     async def limited_build_community(cluster):
         async with semaphore:
-            return await build_community(llm_client, cluster)
+            return await build_community(llm_client, cluster, summary_cache)
 
     communities: list[tuple[CommunityNode, list[CommunityEdge]]] = list(
         await semaphore_gather(
@@ -234,6 +335,281 @@ async def build_communities(
     return community_nodes, community_edges
 
 
+async def get_neighbor_projection(
+    driver: GraphDriver, group_id: str, uuids: list[str]
+) -> dict[str, list[Neighbor]]:
+    """Return the same-group neighbors and edge counts of the given entities in one query."""
+    projection: dict[str, list[Neighbor]] = {uuid: [] for uuid in uuids}
+    if not uuids:
+        return projection
+
+    match_query = """
+        MATCH (n:Entity {group_id: $group_id})-[e:RELATES_TO]-(m:Entity {group_id: $group_id})
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+        MATCH (n:Entity {group_id: $group_id})-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m:Entity {group_id: $group_id})
+        """
+    records, _, _ = await driver.execute_query(
+        match_query
+        + """
+        WHERE n.uuid IN $uuids AND m.uuid <> n.uuid
+        WITH n.uuid AS source_uuid, m.uuid AS uuid, count(e) AS count
+        RETURN
+            source_uuid,
+            uuid,
+            count
+        """,
+        uuids=uuids,
+        group_id=group_id,
+        routing_='r',
+    )
+
+    for record in records:
+        projection[record['source_uuid']].append(
+            Neighbor(node_uuid=record['uuid'], edge_count=record['count'])
+        )
+
+    return projection
+
+
+async def get_stale_community_members(driver: GraphDriver, group_id: str) -> set[str]:
+    """Return the entities that gained an edge after their community membership was written."""
+    match_query = """
+        MATCH (c:Community)-[r:HAS_MEMBER]->(n:Entity {group_id: $group_id})-[e:RELATES_TO]-(m:Entity)
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+        MATCH (c:Community)-[r:HAS_MEMBER]->(n:Entity {group_id: $group_id})-[:RELATES_TO]-(e:RelatesToNode_)-[:RELATES_TO]-(m:Entity)
+        """
+    records, _, _ = await driver.execute_query(
+        match_query
+        + """
+        WHERE e.created_at > r.created_at
+        RETURN DISTINCT n.uuid AS uuid
+        """,
+        group_id=group_id,
+        routing_='r',
+    )
+
+    return {record['uuid'] for record in records}
+
+
+async def update_communities_incrementally(
+    driver: GraphDriver,
+    llm_client: LLMClient,
+    group_ids: list[str] | None,
+    resummarize_threshold: float = COMMUNITY_RESUMMARIZE_THRESHOLD,
+    summary_cache: CommunitySummaryCache | None = None,
+) -> tuple[list[CommunityNode], list[CommunityEdge]]:
+    """
+    Update the persisted communities of each group instead of rebuilding them.
+
+    Entities without a community, or with an edge newer than their HAS_MEMBER edge, are touched.
+    Label propagation re-runs over the touched entities and their neighbors, seeded with the
+    current assignments, while every other entity keeps its community. Communities whose
+    membership changed by more than resummarize_threshold are re-summarized, new clusters get
+    new communities and emptied communities are deleted. Groups without any communities are
+    built from scratch.
+
+    Stale HAS_MEMBER edges and empty communities are deleted here, once a group's summaries have
+    all succeeded. The returned community nodes (new or re-summarized) and membership edges still
+    need to be embedded and saved.
+    """
+    if group_ids is None:
+        group_ids = await get_entity_group_ids(driver)
+
+    community_nodes: list[CommunityNode] = []
+    community_edges: list[CommunityEdge] = []
+    for group_id in group_ids:
+        nodes, edges = await update_group_communities(
+            driver, llm_client, group_id, resummarize_threshold, summary_cache
+        )
+        community_nodes.extend(nodes)
+        community_edges.extend(edges)
+
+    return community_nodes, community_edges
+
+
+async def update_group_communities(
+    driver: GraphDriver,
+    llm_client: LLMClient,
+    group_id: str,
+    resummarize_threshold: float = COMMUNITY_RESUMMARIZE_THRESHOLD,
+    summary_cache: CommunitySummaryCache | None = None,
+) -> tuple[list[CommunityNode], list[CommunityEdge]]:
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (n:Entity {group_id: $group_id})
+        OPTIONAL MATCH (c:Community)-[r:HAS_MEMBER]->(n)
+        RETURN
+            n.uuid AS uuid,
+            c.uuid AS community_uuid,
+            r.uuid AS edge_uuid
+        """,
+        group_id=group_id,
+        routing_='r',
+    )
+
+    membership: dict[str, str] = {}
+    membership_edge_uuids: dict[str, list[str]] = defaultdict(list)
+    for record in records:
+        if record['community_uuid'] is None:
+            continue
+        membership.setdefault(record['uuid'], record['community_uuid'])
+        membership_edge_uuids[record['uuid']].append(record['edge_uuid'])
+
+    if not membership:
+        return await build_communities(driver, llm_client, [group_id], summary_cache)
+
+    touched = {record['uuid'] for record in records if record['uuid'] not in membership}
+    touched |= await get_stale_community_members(driver, group_id)
+    if not touched:
+        return [], []
+
+    # Re-cluster the touched entities together with their direct neighbors
+    projection = await get_neighbor_projection(driver, group_id, sorted(touched))
+    neighbor_uuids = {
+        neighbor.node_uuid for neighbors in projection.values() for neighbor in neighbors
+    }
+    projection.update(
+        await get_neighbor_projection(driver, group_id, sorted(neighbor_uuids - projection.keys()))
+    )
+
+    boundary_uuids = {
+        neighbor.node_uuid for neighbors in projection.values() for neighbor in neighbors
+    }
+    community_sizes = Counter(membership.values())
+    # Label propagation breaks ties towards the larger label. Unassigned entities take the lowest
+    # labels and communities are ordered by size, so a weak tie joins an entity to the larger
+    # existing community instead of pulling members out of it.
+    unassigned_uuids = sorted((projection.keys() | boundary_uuids) - membership.keys())
+    community_uuids = sorted(community_sizes, key=lambda uuid: (community_sizes[uuid], uuid))
+    community_labels = {uuid: len(unassigned_uuids) + i for i, uuid in enumerate(community_uuids)}
+    label_communities = {label: uuid for uuid, label in community_labels.items()}
+    community_map: dict[str, int] = {uuid: i for i, uuid in enumerate(unassigned_uuids)}
+    for uuid in projection.keys() | boundary_uuids:
+        if uuid in membership:
+            community_map[uuid] = community_labels[membership[uuid]]
+
+    new_labels = propagate_labels(projection, community_map)
+
+    joined: dict[str, set[str]] = defaultdict(set)
+    left: dict[str, set[str]] = defaultdict(set)
+    new_clusters: dict[int, list[str]] = defaultdict(list)
+    for uuid, label in new_labels.items():
+        old_community = membership.get(uuid)
+        new_community = label_communities.get(label)
+        if new_community is None:
+            new_clusters[label].append(uuid)
+        if new_community == old_community:
+            continue
+        if old_community is not None:
+            left[old_community].add(uuid)
+        if new_community is not None:
+            joined[new_community].add(uuid)
+
+    members: dict[str, list[str]] = defaultdict(list)
+    for uuid, community_uuid in membership.items():
+        members[community_uuid].append(uuid)
+
+    emptied_uuids: list[str] = []
+    resummarized_members: dict[str, list[str]] = {}
+    for community_uuid in sorted(joined.keys() | left.keys()):
+        size = community_sizes[community_uuid]
+        changes = len(joined[community_uuid]) + len(left[community_uuid])
+        if size - len(left[community_uuid]) + len(joined[community_uuid]) == 0:
+            emptied_uuids.append(community_uuid)
+        elif changes / size > resummarize_threshold:
+            resummarized_members[community_uuid] = [
+                uuid for uuid in members[community_uuid] if uuid not in left[community_uuid]
+            ] + sorted(joined[community_uuid])
+
+    logger.debug(
+        f'Community update for group {group_id}: {len(new_labels)} entities re-clustered, '
+        f'{len(new_clusters)} new, {len(resummarized_members)} re-summarized, '
+        f'{len(emptied_uuids)} removed'
+    )
+
+    entity_uuids = set(new_labels.keys())
+    for uuids in resummarized_members.values():
+        entity_uuids.update(uuids)
+    entities: dict[str, EntityNode] = {
+        entity.uuid: entity
+        for entity in await EntityNode.get_by_uuids(driver, sorted(entity_uuids))
+    }
+    communities: dict[str, CommunityNode] = {
+        community.uuid: community
+        for community in await CommunityNode.get_by_uuids(
+            driver, sorted(resummarized_members.keys())
+        )
+    }
+
+    semaphore = asyncio.Semaphore(MAX_COMMUNITY_BUILD_CONCURRENCY)
+
+    async def limited_build_community(cluster: list[EntityNode]):
+        async with semaphore:
+            return await build_community(llm_client, cluster, summary_cache)
+
+    async def limited_resummarize(community: CommunityNode, cluster: list[EntityNode]):
+        async with semaphore:
+            community.summary, community.name = await summarize_community(
+                llm_client, cluster, summary_cache=summary_cache
+            )
+            return community
+
+    built, resummarized = await semaphore_gather(
+        semaphore_gather(
+            *[
+                limited_build_community([entities[uuid] for uuid in cluster if uuid in entities])
+                for cluster in new_clusters.values()
+                if any(uuid in entities for uuid in cluster)
+            ]
+        ),
+        semaphore_gather(
+            *[
+                limited_resummarize(
+                    communities[community_uuid],
+                    [entities[uuid] for uuid in cluster if uuid in entities],
+                )
+                for community_uuid, cluster in resummarized_members.items()
+                if community_uuid in communities
+            ]
+        ),
+    )
+
+    # Only drop the old memberships once every summary succeeded, so a failed LLM call leaves the
+    # group's communities as they were. The rewritten memberships also mark the entities fresh.
+    stale_edge_uuids = [
+        edge_uuid for uuid in new_labels for edge_uuid in membership_edge_uuids.get(uuid, [])
+    ]
+    if stale_edge_uuids:
+        await CommunityEdge.delete_by_uuids(driver, stale_edge_uuids)
+    if emptied_uuids:
+        await CommunityNode.delete_by_uuids(driver, emptied_uuids)
+
+    community_nodes: list[CommunityNode] = list(resummarized)
+    community_edges: list[CommunityEdge] = []
+    for community_node, edges in built:
+        community_nodes.append(community_node)
+        community_edges.extend(edges)
+
+    now = utc_now()
+    for uuid, label in new_labels.items():
+        if label not in label_communities or uuid not in entities:
+            continue
+        community_edges.append(
+            CommunityEdge(
+                source_node_uuid=label_communities[label],
+                target_node_uuid=uuid,
+                created_at=now,
+                group_id=group_id,
+            )
+        )
+
+    return community_nodes, community_edges
+
+
 async def remove_communities(driver: GraphDriver):
     await driver.execute_query(
         """
@@ -16,15 +16,19 @@ limitations under the License.
 
 from __future__ import annotations
 
+import asyncio
 import math
 import re
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from functools import lru_cache
 from hashlib import blake2b
 from typing import TYPE_CHECKING
 
+import numpy as np
+from numpy.typing import NDArray
+
 if TYPE_CHECKING:
     from graphiti_core.nodes import EntityNode
 
@@ -34,6 +38,16 @@ _MIN_TOKEN_COUNT = 2
 _FUZZY_JACCARD_THRESHOLD = 0.9
 _MINHASH_PERMUTATIONS = 32
 _MINHASH_BAND_SIZE = 4
+_MINHASH_SEED = 42
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_INDEXED_GROUPS = 128
+_MAX_INDEXED_NODES_PER_GROUP = 100_000
+
+# Universal hash permutations h(x) = (a * x + b) mod p applied to 32-bit base shingle hashes.
+# a and b stay below 2**32 so a * x + b never overflows uint64.
+_permutation_rng = np.random.default_rng(_MINHASH_SEED)
+_PERMUTATION_A = _permutation_rng.integers(1, 1 << 32, size=_MINHASH_PERMUTATIONS, dtype=np.uint64)
+_PERMUTATION_B = _permutation_rng.integers(0, 1 << 32, size=_MINHASH_PERMUTATIONS, dtype=np.uint64)
 
 
 def _normalize_string_exact(name: str) -> str:
@@ -94,24 +108,39 @@ def _shingles(normalized_name: str) -> set[str]:
     return {cleaned[i : i + 3] for i in range(len(cleaned) - 2)}
 
 
-def _hash_shingle(shingle: str, seed: int) -> int:
-    """Generate a deterministic 64-bit hash for a shingle given the permutation seed."""
-    digest = blake2b(f'{seed}:{shingle}'.encode(), digest_size=8)
+def _hash_shingle(shingle: str) -> int:
+    """Generate a deterministic 32-bit base hash for a shingle."""
+    digest = blake2b(shingle.encode(), digest_size=4)
     return int.from_bytes(digest.digest(), 'big')
 
 
+def _minhash_signatures(shingle_sets: list[set[str]]) -> NDArray[np.uint64]:
+    """Compute MinHash signatures for many shingle sets at once.
+
+    Every shingle is hashed once; the permutations are applied to all base hashes in a
+    single broadcast and reduced per set with ``np.minimum.reduceat``. Empty sets must be
+    filtered out by the caller.
+    """
+    if not shingle_sets:
+        return np.empty((0, _MINHASH_PERMUTATIONS), dtype=np.uint64)
+
+    base_hashes = np.fromiter(
+        (_hash_shingle(shingle) for shingles in shingle_sets for shingle in shingles),
+        dtype=np.uint64,
+    )
+    permuted = (np.outer(base_hashes, _PERMUTATION_A) + _PERMUTATION_B) % _MERSENNE_PRIME
+    offsets = np.cumsum([0] + [len(shingles) for shingles in shingle_sets[:-1]])
+
+    return np.minimum.reduceat(permuted, offsets, axis=0)
+
+
 def _minhash_signature(shingles: Iterable[str]) -> tuple[int, ...]:
     """Compute the MinHash signature for the shingle set across predefined permutations."""
-    if not shingles:
+    shingle_set = set(shingles)
+    if not shingle_set:
         return tuple()
 
-    seeds = range(_MINHASH_PERMUTATIONS)
-    signature: list[int] = []
-    for seed in seeds:
-        min_hash = min(_hash_shingle(shingle, seed) for shingle in shingles)
-        signature.append(min_hash)
-
-    return tuple(signature)
+    return tuple(int(value) for value in _minhash_signatures([shingle_set])[0])
 
 
 def _lsh_bands(signature: Iterable[int]) -> list[tuple[int, ...]]:
@@ -146,6 +175,215 @@ def _cached_shingles(name: str) -> set[str]:
     return _shingles(name)
 
 
+class LSHIndex:
+    """Incrementally updatable MinHash LSH index over entity names.
+
+    Signatures and bucket memberships are computed once per node and kept until the node is
+    removed or renamed, so the index can be reused across dedupe runs.
+    """
+
+    def __init__(self) -> None:
+        self.buckets: defaultdict[tuple[int, tuple[int, ...]], set[str]] = defaultdict(set)
+        self.names_by_uuid: dict[str, str] = {}
+        self.shingles_by_uuid: dict[str, set[str]] = {}
+        self._bands_by_uuid: dict[str, list[tuple[int, ...]]] = {}
+
+    def __contains__(self, uuid: object) -> bool:
+        return uuid in self.names_by_uuid
+
+    def __len__(self) -> int:
+        return len(self.names_by_uuid)
+
+    def add(self, nodes: Iterable[EntityNode]) -> None:
+        """Index new or renamed nodes, computing their signatures in one vectorized pass."""
+        pending: dict[str, tuple[str, set[str]]] = {}
+        for node in nodes:
+            if self.names_by_uuid.get(node.uuid) == node.name:
+                continue
+            self.remove(node.uuid)
+            pending[node.uuid] = (node.name, _cached_shingles(_normalize_name_for_fuzzy(node.name)))
+
+        hashed = [(uuid, name, shingles) for uuid, (name, shingles) in pending.items() if shingles]
+        signatures = _minhash_signatures([shingles for _, _, shingles in hashed])
+        bands_by_uuid = {
+            uuid: _lsh_bands(int(value) for value in signature)
+            for (uuid, _, _), signature in zip(hashed, signatures, strict=True)
+        }
+
+        for uuid, (name, shingles) in pending.items():
+            bands = bands_by_uuid.get(uuid, [])
+            self.names_by_uuid[uuid] = name
+            self.shingles_by_uuid[uuid] = shingles
+            self._bands_by_uuid[uuid] = bands
+            for band_index, band in enumerate(bands):
+                self.buckets[(band_index, band)].add(uuid)
+
+    def remove(self, uuid: str) -> None:
+        if uuid not in self.names_by_uuid:
+            return
+
+        for band_index, band in enumerate(self._bands_by_uuid.pop(uuid)):
+            bucket = self.buckets.get((band_index, band))
+            if bucket is not None:
+                bucket.discard(uuid)
+                if not bucket:
+                    del self.buckets[(band_index, band)]
+        del self.names_by_uuid[uuid]
+        del self.shingles_by_uuid[uuid]
+
+    def query(self, shingles: set[str]) -> set[str]:
+        """Return the uuids sharing at least one LSH band with the shingle set."""
+        candidate_ids: set[str] = set()
+        for band_index, band in enumerate(_lsh_bands(_minhash_signature(shingles))):
+            candidate_ids.update(self.buckets.get((band_index, band), ()))
+
+        return candidate_ids
+
+
+class EntityNameIndex:
+    """Warm index of a group's entity names used to resolve repeats without graph searches.
+
+    Maps exact-normalized names to uuids and keeps an LSH index over the same nodes for fuzzy
+    matches. The index is only trusted once ``complete`` is set, i.e. after every entity of the
+    group has been loaded; a partial index could report a unique match that is not unique.
+    """
+
+    def __init__(self) -> None:
+        self.uuids_by_name: defaultdict[str, set[str]] = defaultdict(set)
+        self.names_by_uuid: dict[str, str] = {}
+        self.lsh_index = LSHIndex()
+        self.loaded = False
+        self.complete = False
+        self.lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self.names_by_uuid)
+
+    def add(self, nodes: Iterable[EntityNode]) -> None:
+        node_list = [
+            node
+            for node in nodes
+            if self.names_by_uuid.get(node.uuid) != _normalize_string_exact(node.name)
+        ]
+        for node in node_list:
+            self._discard_name(node.uuid)
+            normalized = _normalize_string_exact(node.name)
+            self.names_by_uuid[node.uuid] = normalized
+            self.uuids_by_name[normalized].add(node.uuid)
+
+        self.lsh_index.add(node_list)
+
+    def remove(self, uuids: Iterable[str]) -> None:
+        for uuid in uuids:
+            self._discard_name(uuid)
+            self.lsh_index.remove(uuid)
+
+    def clear(self) -> None:
+        self.uuids_by_name.clear()
+        self.names_by_uuid.clear()
+        self.lsh_index = LSHIndex()
+        self.complete = False
+
+    def _discard_name(self, uuid: str) -> None:
+        normalized = self.names_by_uuid.pop(uuid, None)
+        if normalized is None:
+            return
+        bucket = self.uuids_by_name[normalized]
+        bucket.discard(uuid)
+        if not bucket:
+            del self.uuids_by_name[normalized]
+
+    def candidate_lsh_index(self, candidates: list[EntityNode]) -> LSHIndex:
+        """Return the LSH index a dedupe run should hash its candidates into.
+
+        The warm index is reused only when it is complete and already holds every candidate under
+        its current name, so the run reads it without writing to it. Otherwise the run gets a
+        fresh index; the warm index only changes through the save, delete and load paths.
+        """
+        if self.complete and all(
+            self.lsh_index.names_by_uuid.get(candidate.uuid) == candidate.name
+            for candidate in candidates
+        ):
+            return self.lsh_index
+        return LSHIndex()
+
+    def match(self, name: str) -> str | None:
+        """Return the uuid of the single existing entity this name resolves to, if any.
+
+        Applies the same guardrails as :func:`_resolve_with_similarity`: low-entropy names and
+        ambiguous exact matches are left for the search and LLM passes.
+        """
+        normalized_fuzzy = _normalize_name_for_fuzzy(name)
+        if not self.complete or not _has_high_entropy(normalized_fuzzy):
+            return None
+
+        exact_matches = self.uuids_by_name.get(_normalize_string_exact(name), set())
+        if len(exact_matches) == 1:
+            return next(iter(exact_matches))
+        if len(exact_matches) > 1:
+            return None
+
+        shingles = _cached_shingles(normalized_fuzzy)
+        best_uuid: str | None = None
+        best_score = 0.0
+        for candidate_id in sorted(self.lsh_index.query(shingles)):
+            score = _jaccard_similarity(shingles, self.lsh_index.shingles_by_uuid[candidate_id])
+            if score > best_score:
+                best_score = score
+                best_uuid = candidate_id
+
+        return best_uuid if best_score >= _FUZZY_JACCARD_THRESHOLD else None
+
+
+class EntityIndexStore:
+    """Per-group entity name indexes that persist across episodes.
+
+    Bounded to the most recently used groups. Saves and deletes made through Graphiti are
+    applied with :meth:`add_nodes` and :meth:`remove_nodes`; groups without an index are
+    skipped because their index reads the graph when first used.
+    """
+
+    def __init__(
+        self,
+        max_groups: int = _MAX_INDEXED_GROUPS,
+        max_nodes_per_group: int = _MAX_INDEXED_NODES_PER_GROUP,
+    ) -> None:
+        self.max_groups = max_groups
+        self.max_nodes_per_group = max_nodes_per_group
+        self._indexes: OrderedDict[str, EntityNameIndex] = OrderedDict()
+
+    def get(self, group_id: str) -> EntityNameIndex:
+        index = self._indexes.get(group_id)
+        if index is None:
+            index = EntityNameIndex()
+            self._indexes[group_id] = index
+            while len(self._indexes) > self.max_groups:
+                self._indexes.popitem(last=False)
+        self._indexes.move_to_end(group_id)
+
+        return index
+
+    def add_nodes(self, nodes: Iterable[EntityNode]) -> None:
+        nodes_by_group: defaultdict[str, list[EntityNode]] = defaultdict(list)
+        for node in nodes:
+            nodes_by_group[node.group_id].append(node)
+
+        for group_id, group_nodes in nodes_by_group.items():
+            index = self._indexes.get(group_id)
+            # saves made while a load is in flight are applied too, since the load may have
+            # already paged past them
+            if index is not None and (index.complete or not index.loaded):
+                index.add(group_nodes)
+
+    def remove_nodes(self, uuids: Iterable[str]) -> None:
+        uuid_list = list(uuids)
+        for index in self._indexes.values():
+            index.remove(uuid_list)
+
+    def clear(self) -> None:
+        self._indexes.clear()
+
+
 @dataclass
 class DedupCandidateIndexes:
     """Precomputed lookup structures that drive entity deduplication heuristics."""
@@ -153,8 +391,7 @@ class DedupCandidateIndexes:
     existing_nodes: list[EntityNode]
     nodes_by_uuid: dict[str, EntityNode]
     normalized_existing: defaultdict[str, list[EntityNode]]
-    shingles_by_candidate: dict[str, set[str]]
-    lsh_buckets: defaultdict[tuple[int, tuple[int, ...]], list[str]]
+    lsh_index: LSHIndex
 
 
 @dataclass
@@ -167,32 +404,33 @@ class DedupResolutionState:
     duplicate_pairs: list[tuple[EntityNode, EntityNode]] = field(default_factory=list)
 
 
-def _build_candidate_indexes(existing_nodes: list[EntityNode]) -> DedupCandidateIndexes:
-    """Precompute exact and fuzzy lookup structures once per dedupe run."""
-    normalized_existing: defaultdict[str, list[EntityNode]] = defaultdict(list)
-    nodes_by_uuid: dict[str, EntityNode] = {}
-    shingles_by_candidate: dict[str, set[str]] = {}
-    lsh_buckets: defaultdict[tuple[int, tuple[int, ...]], list[str]] = defaultdict(list)
+def _build_candidate_indexes(
+    existing_nodes: list[EntityNode], lsh_index: LSHIndex | None = None
+) -> DedupCandidateIndexes:
+    """Precompute exact and fuzzy lookup structures once per dedupe run.
 
-    for candidate in existing_nodes:
-        normalized = _normalize_string_exact(candidate.name)
-        normalized_existing[normalized].append(candidate)
-        nodes_by_uuid[candidate.uuid] = candidate
+    When a persistent ``lsh_index`` is passed, only candidates it has not seen yet are hashed.
+    Lookups are still restricted to ``existing_nodes``.
+    """
+    indexes = DedupCandidateIndexes(
+        existing_nodes=[],
+        nodes_by_uuid={},
+        normalized_existing=defaultdict(list),
+        lsh_index=lsh_index if lsh_index is not None else LSHIndex(),
+    )
+    _add_candidates(indexes, existing_nodes)
 
-        shingles = _cached_shingles(_normalize_name_for_fuzzy(candidate.name))
-        shingles_by_candidate[candidate.uuid] = shingles
+    return indexes
 
-        signature = _minhash_signature(shingles)
-        for band_index, band in enumerate(_lsh_bands(signature)):
-            lsh_buckets[(band_index, band)].append(candidate.uuid)
 
-    return DedupCandidateIndexes(
-        existing_nodes=existing_nodes,
-        nodes_by_uuid=nodes_by_uuid,
-        normalized_existing=normalized_existing,
-        shingles_by_candidate=shingles_by_candidate,
-        lsh_buckets=lsh_buckets,
-    )
+def _add_candidates(indexes: DedupCandidateIndexes, candidates: list[EntityNode]) -> None:
+    """Incrementally add candidates to existing dedupe indexes."""
+    for candidate in candidates:
+        indexes.existing_nodes.append(candidate)
+        indexes.normalized_existing[_normalize_string_exact(candidate.name)].append(candidate)
+        indexes.nodes_by_uuid[candidate.uuid] = candidate
+
+    indexes.lsh_index.add(candidates)
 
 
 def _resolve_with_similarity(
@@ -222,15 +460,14 @@ def _resolve_with_similarity(
             continue
 
         shingles = _cached_shingles(normalized_fuzzy)
-        signature = _minhash_signature(shingles)
-        candidate_ids: set[str] = set()
-        for band_index, band in enumerate(_lsh_bands(signature)):
-            candidate_ids.update(indexes.lsh_buckets.get((band_index, band), []))
+        candidate_ids = indexes.lsh_index.query(shingles)
 
         best_candidate: EntityNode | None = None
         best_score = 0.0
-        for candidate_id in candidate_ids:
-            candidate_shingles = indexes.shingles_by_candidate.get(candidate_id, set())
+        for candidate_id in sorted(candidate_ids):
+            if candidate_id not in indexes.nodes_by_uuid:
+                continue
+            candidate_shingles = indexes.lsh_index.shingles_by_uuid.get(candidate_id, set())
             score = _jaccard_similarity(shingles, candidate_shingles)
             if score > best_score:
                 best_score = score
@@ -249,6 +486,9 @@ def _resolve_with_similarity(
 __all__ = [
     'DedupCandidateIndexes',
     'DedupResolutionState',
+    'EntityIndexStore',
+    'EntityNameIndex',
+    'LSHIndex',
     '_normalize_string_exact',
     '_normalize_name_for_fuzzy',
     '_has_high_entropy',
@@ -258,5 +498,6 @@ __all__ = [
     '_cached_shingles',
     '_FUZZY_JACCARD_THRESHOLD',
     '_build_candidate_indexes',
+    '_add_candidates',
     '_resolve_with_similarity',
 ]
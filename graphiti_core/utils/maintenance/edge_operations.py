@@ -28,22 +28,24 @@ from graphiti_core.edges import (
     EpisodicEdge,
     create_entity_edge_embeddings,
 )
+from graphiti_core.embedder.batching import chunk_inputs
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import MAX_REFLEXION_ITERATIONS, semaphore_gather
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.llm_client.config import ModelSize
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.prompts import prompt_library
-from graphiti_core.prompts.dedupe_edges import EdgeDuplicate
+from graphiti_core.prompts.dedupe_edges import EdgeDuplicate, EdgeResolutions
 from graphiti_core.prompts.extract_edges import ExtractedEdges, MissingFacts
-from graphiti_core.search.search import search
-from graphiti_core.search.search_config import SearchResults
+from graphiti_core.search.search import search_many
 from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
 from graphiti_core.utils.datetime_utils import ensure_utc, utc_now
 from graphiti_core.utils.maintenance.dedup_helpers import _normalize_string_exact
 
 DEFAULT_EDGE_NAME = 'RELATES_TO'
+# Estimated tokens of new and candidate facts sent in one batched edge resolution call
+EDGE_RESOLUTION_TOKEN_BUDGET = 8000
 
 logger = logging.getLogger(__name__)
 
@@ -245,7 +247,14 @@ async def resolve_extracted_edges(
     entities: list[EntityNode],
     edge_types: dict[str, type[BaseModel]],
     edge_type_map: dict[tuple[str, str], list[str]],
+    batch_size: int | None = None,
 ) -> tuple[list[EntityEdge], list[EntityEdge]]:
+    """
+    Resolve extracted edges against the graph, returning the resolved and invalidated edges.
+
+    By default every edge is resolved with its own LLM call. If batch_size is set, edges are
+    resolved together, up to batch_size per call and within EDGE_RESOLUTION_TOKEN_BUDGET.
+    """
     # Fast path: deduplicate exact matches within the extracted edges before parallel processing
     seen: dict[tuple[str, str, str], EntityEdge] = {}
     deduplicated_edges: list[EntityEdge] = []
@@ -274,34 +283,36 @@ async def resolve_extracted_edges(
         ]
     )
 
-    related_edges_results: list[SearchResults] = await semaphore_gather(
-        *[
-            search(
-                clients,
-                extracted_edge.fact,
-                group_ids=[extracted_edge.group_id],
-                config=EDGE_HYBRID_SEARCH_RRF,
-                search_filter=SearchFilters(edge_uuids=[edge.uuid for edge in valid_edges]),
-            )
-            for extracted_edge, valid_edges in zip(extracted_edges, valid_edges_list, strict=True)
-        ]
+    # facts are already embedded, so both searches reuse the fact embeddings as query vectors
+    fact_embeddings: list[list[float]] | None = (
+        [edge.fact_embedding for edge in extracted_edges if edge.fact_embedding is not None]
+        if all(edge.fact_embedding is not None for edge in extracted_edges)
+        else None
+    )
+    related_edges_results, edge_invalidation_candidate_results = await semaphore_gather(
+        search_many(
+            clients,
+            [extracted_edge.fact for extracted_edge in extracted_edges],
+            group_ids=[episode.group_id],
+            config=EDGE_HYBRID_SEARCH_RRF,
+            search_filter=[
+                SearchFilters(edge_uuids=[edge.uuid for edge in valid_edges])
+                for valid_edges in valid_edges_list
+            ],
+            query_vectors=fact_embeddings,
+        ),
+        search_many(
+            clients,
+            [extracted_edge.fact for extracted_edge in extracted_edges],
+            group_ids=[episode.group_id],
+            config=EDGE_HYBRID_SEARCH_RRF,
+            search_filter=SearchFilters(),
+            query_vectors=fact_embeddings,
+        ),
     )
 
     related_edges_lists: list[list[EntityEdge]] = [result.edges for result in related_edges_results]
 
-    edge_invalidation_candidate_results: list[SearchResults] = await semaphore_gather(
-        *[
-            search(
-                clients,
-                extracted_edge.fact,
-                group_ids=[extracted_edge.group_id],
-                config=EDGE_HYBRID_SEARCH_RRF,
-                search_filter=SearchFilters(),
-            )
-            for extracted_edge in extracted_edges
-        ]
-    )
-
     edge_invalidation_candidates: list[list[EntityEdge]] = [
         result.edges for result in edge_invalidation_candidate_results
     ]
@@ -361,28 +372,41 @@ async def resolve_extracted_edges(
             extracted_edge.name = DEFAULT_EDGE_NAME
 
     # resolve edges with related edges in the graph and find invalidation candidates
-    results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]] = list(
-        await semaphore_gather(
-            *[
-                resolve_extracted_edge(
-                    llm_client,
-                    extracted_edge,
-                    related_edges,
-                    existing_edges,
-                    episode,
-                    extracted_edge_types,
-                    custom_type_names,
-                )
-                for extracted_edge, related_edges, existing_edges, extracted_edge_types in zip(
-                    extracted_edges,
-                    related_edges_lists,
-                    edge_invalidation_candidates,
-                    edge_types_lst,
-                    strict=True,
-                )
-            ]
+    results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]
+    if batch_size is not None:
+        results = await resolve_extracted_edges_in_batches(
+            llm_client,
+            extracted_edges,
+            related_edges_lists,
+            edge_invalidation_candidates,
+            episode,
+            edge_types_lst,
+            custom_type_names,
+            batch_size,
+        )
+    else:
+        results = list(
+            await semaphore_gather(
+                *[
+                    resolve_extracted_edge(
+                        llm_client,
+                        extracted_edge,
+                        related_edges,
+                        existing_edges,
+                        episode,
+                        extracted_edge_types,
+                        custom_type_names,
+                    )
+                    for extracted_edge, related_edges, existing_edges, extracted_edge_types in zip(
+                        extracted_edges,
+                        related_edges_lists,
+                        edge_invalidation_candidates,
+                        edge_types_lst,
+                        strict=True,
+                    )
+                ]
+            )
         )
-    )
 
     resolved_edges: list[EntityEdge] = []
     invalidated_edges: list[EntityEdge] = []
@@ -476,21 +500,11 @@ async def resolve_extracted_edge(
     tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]
         The resolved edge, any duplicates, and edges to invalidate.
     """
-    if len(related_edges) == 0 and len(existing_edges) == 0:
-        return extracted_edge, [], []
-
-    # Fast path: if the fact text and endpoints already exist verbatim, reuse the matching edge.
-    normalized_fact = _normalize_string_exact(extracted_edge.fact)
-    for edge in related_edges:
-        if (
-            edge.source_node_uuid == extracted_edge.source_node_uuid
-            and edge.target_node_uuid == extracted_edge.target_node_uuid
-            and _normalize_string_exact(edge.fact) == normalized_fact
-        ):
-            resolved = edge
-            if episode is not None and episode.uuid not in resolved.episodes:
-                resolved.episodes.append(episode.uuid)
-            return resolved, [], []
+    fast_path_result = _resolve_edge_without_llm(
+        extracted_edge, related_edges, existing_edges, episode
+    )
+    if fast_path_result is not None:
+        return fast_path_result
 
     start = time()
 
@@ -536,6 +550,63 @@ async def resolve_extracted_edge(
         prompt_name='dedupe_edges.resolve_edge',
     )
     response_object = EdgeDuplicate(**llm_response)
+
+    result = await _apply_edge_resolution(
+        llm_client,
+        extracted_edge,
+        related_edges,
+        existing_edges,
+        episode,
+        response_object,
+        edge_type_candidates,
+        custom_edge_type_names,
+    )
+
+    end = time()
+    logger.debug(
+        f'Resolved Edge: {extracted_edge.name} is {result[0].name}, in {(end - start) * 1000} ms'
+    )
+
+    return result
+
+
+def _resolve_edge_without_llm(
+    extracted_edge: EntityEdge,
+    related_edges: list[EntityEdge],
+    existing_edges: list[EntityEdge],
+    episode: EpisodicNode,
+) -> tuple[EntityEdge, list[EntityEdge], list[EntityEdge]] | None:
+    """Resolve an edge that needs no LLM call, or return None if it does."""
+    if len(related_edges) == 0 and len(existing_edges) == 0:
+        return extracted_edge, [], []
+
+    # Fast path: if the fact text and endpoints already exist verbatim, reuse the matching edge.
+    normalized_fact = _normalize_string_exact(extracted_edge.fact)
+    for edge in related_edges:
+        if (
+            edge.source_node_uuid == extracted_edge.source_node_uuid
+            and edge.target_node_uuid == extracted_edge.target_node_uuid
+            and _normalize_string_exact(edge.fact) == normalized_fact
+        ):
+            resolved = edge
+            if episode is not None and episode.uuid not in resolved.episodes:
+                resolved.episodes.append(episode.uuid)
+            return resolved, [], []
+
+    return None
+
+
+async def _apply_edge_resolution(
+    llm_client: LLMClient,
+    extracted_edge: EntityEdge,
+    related_edges: list[EntityEdge],
+    existing_edges: list[EntityEdge],
+    episode: EpisodicNode,
+    response_object: EdgeDuplicate,
+    edge_type_candidates: dict[str, type[BaseModel]] | None = None,
+    custom_edge_type_names: set[str] | None = None,
+) -> tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]:
+    """Apply the LLM's duplicate, contradiction and fact type verdicts to an extracted edge."""
     duplicate_facts = response_object.duplicate_facts
 
     # Validate duplicate_facts are in valid range for EXISTING FACTS
@@ -612,11 +683,6 @@ async def resolve_extracted_edge(
         resolved_edge.name = fact_type
         resolved_edge.attributes = {}
 
-    end = time()
-    logger.debug(
-        f'Resolved Edge: {extracted_edge.name} is {resolved_edge.name}, in {(end - start) * 1000} ms'
-    )
-
     now = utc_now()
 
     if resolved_edge.invalid_at and not resolved_edge.expired_at:
@@ -647,6 +713,205 @@ async def resolve_extracted_edge(
     return resolved_edge, invalidated_edges, duplicate_edges
 
 
+async def resolve_extracted_edges_in_batches(
+    llm_client: LLMClient,
+    extracted_edges: list[EntityEdge],
+    related_edges_lists: list[list[EntityEdge]],
+    existing_edges_lists: list[list[EntityEdge]],
+    episode: EpisodicNode,
+    edge_types_lst: list[dict[str, type[BaseModel]]],
+    custom_edge_type_names: set[str],
+    batch_size: int,
+    token_budget: int = EDGE_RESOLUTION_TOKEN_BUDGET,
+) -> list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]]:
+    """
+    Resolve extracted edges with one LLM call per batch instead of one per edge.
+
+    Edges that need no LLM call are resolved first. The rest are grouped into batches of at
+    most batch_size edges whose facts and candidate facts fit within token_budget. Candidate
+    facts shared by several edges in a batch are sent once. Verdicts are mapped back to each
+    edge by id and applied exactly as in resolve_extracted_edge. Edges the LLM leaves out of
+    its response fall back to resolve_extracted_edge.
+    """
+    results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]] | None] = [
+        _resolve_edge_without_llm(extracted_edge, related_edges, existing_edges, episode)
+        for extracted_edge, related_edges, existing_edges in zip(
+            extracted_edges, related_edges_lists, existing_edges_lists, strict=True
+        )
+    ]
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    chunks = chunk_inputs(
+        [
+            '\n'.join(
+                [extracted_edges[i].fact]
+                + [edge.fact for edge in related_edges_lists[i]]
+                + [edge.fact for edge in existing_edges_lists[i]]
+            )
+            for i in pending
+        ],
+        batch_size,
+        token_budget,
+    )
+    batches: list[list[int]] = []
+    offset = 0
+    for chunk in chunks:
+        batches.append(pending[offset : offset + len(chunk)])
+        offset += len(chunk)
+
+    batch_responses: list[dict[int, EdgeDuplicate]] = await semaphore_gather(
+        *[
+            _resolve_edge_batch(
+                llm_client,
+                [
+                    (
+                        extracted_edges[i],
+                        related_edges_lists[i],
+                        existing_edges_lists[i],
+                        edge_types_lst[i],
+                    )
+                    for i in batch
+                ],
+            )
+            for batch in batches
+        ]
+    )
+    responses: dict[int, EdgeDuplicate] = {
+        batch[position]: response
+        for batch, batch_response in zip(batches, batch_responses, strict=True)
+        for position, response in batch_response.items()
+    }
+
+    missing = [i for i in pending if i not in responses]
+    if missing:
+        logger.warning(f'Batched edge resolution left out {len(missing)} edges, resolving singly')
+
+    async def resolve_pending(i: int) -> tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]:
+        response = responses.get(i)
+        if response is None:
+            return await resolve_extracted_edge(
+                llm_client,
+                extracted_edges[i],
+                related_edges_lists[i],
+                existing_edges_lists[i],
+                episode,
+                edge_types_lst[i],
+                custom_edge_type_names,
+            )
+        return await _apply_edge_resolution(
+            llm_client,
+            extracted_edges[i],
+            related_edges_lists[i],
+            existing_edges_lists[i],
+            episode,
+            response,
+            edge_types_lst[i],
+            custom_edge_type_names,
+        )
+
+    for i, result in zip(
+        pending, await semaphore_gather(*[resolve_pending(i) for i in pending]), strict=True
+    ):
+        results[i] = result
+
+    logger.debug(
+        f'Resolved {len(pending)} edges in {len(batches)} batched LLM calls, '
+        f'{len(extracted_edges) - len(pending)} without the LLM'
+    )
+
+    return [result for result in results if result is not None]
+
+
+async def _resolve_edge_batch(
+    llm_client: LLMClient,
+    batch: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge], dict[str, type[BaseModel]]]],
+) -> dict[int, EdgeDuplicate]:
+    """
+    Send a batch of edges in one resolve_edges call and return each edge's verdict, keyed by its
+    position in the batch, with idx values translated into its own candidate lists.
+    """
+    existing_facts: list[dict] = []
+    fact_indexes: dict[str, int] = {}
+
+    def fact_index(edge: EntityEdge) -> int:
+        index = fact_indexes.get(edge.uuid)
+        if index is None:
+            index = fact_indexes[edge.uuid] = len(existing_facts)
+            existing_facts.append({'idx': index, 'fact': edge.fact})
+        return index
+
+    new_edges_context: list[dict] = []
+    edge_types_context: dict[str, str | None] = {}
+    for position, (extracted_edge, related_edges, existing_edges, edge_types) in enumerate(batch):
+        new_edges_context.append(
+            {
+                'id': position,
+                'fact': extracted_edge.fact,
+                'duplicate_candidates': [fact_index(edge) for edge in related_edges],
+                'invalidation_candidates': [fact_index(edge) for edge in existing_edges],
+                'fact_types': list(edge_types),
+            }
+        )
+        for type_name, type_model in edge_types.items():
+            edge_types_context[type_name] = type_model.__doc__
+
+    context = {
+        'existing_edges': existing_facts,
+        'new_edges': new_edges_context,
+        'edge_types': [
+            {'fact_type_name': type_name, 'fact_type_description': description}
+            for type_name, description in edge_types_context.items()
+        ],
+    }
+
+    llm_response = await llm_client.generate_response(
+        prompt_library.dedupe_edges.resolve_edges(context),
+        response_model=EdgeResolutions,
+        model_size=ModelSize.small,
+        prompt_name='dedupe_edges.resolve_edges',
+    )
+
+    responses: dict[int, EdgeDuplicate] = {}
+    for resolution in EdgeResolutions(**llm_response).edge_resolutions:
+        if not 0 <= resolution.id < len(batch) or resolution.id in responses:
+            logger.warning(f'LLM returned invalid or repeated edge resolution id {resolution.id}')
+            continue
+
+        _, related_edges, existing_edges, _ = batch[resolution.id]
+        # idx values in the shared list map back to positions in this edge's candidate lists
+        related_positions: dict[int, int] = {}
+        for i, edge in enumerate(related_edges):
+            related_positions.setdefault(fact_indexes[edge.uuid], i)
+        existing_positions: dict[int, int] = {}
+        for i, edge in enumerate(existing_edges):
+            existing_positions.setdefault(fact_indexes[edge.uuid], i)
+
+        invalid_idx = [
+            idx for idx in resolution.duplicate_facts if idx not in related_positions
+        ] + [idx for idx in resolution.contradicted_facts if idx not in existing_positions]
+        if invalid_idx:
+            logger.warning(
+                f'LLM returned idx values {invalid_idx} outside the candidates of new fact '
+                f'{resolution.id}'
+            )
+
+        responses[resolution.id] = EdgeDuplicate(
+            duplicate_facts=[
+                related_positions[idx]
+                for idx in resolution.duplicate_facts
+                if idx in related_positions
+            ],
+            contradicted_facts=[
+                existing_positions[idx]
+                for idx in resolution.contradicted_facts
+                if idx in existing_positions
+            ],
+            fact_type=resolution.fact_type,
+        )
+
+    return responses
+
+
 async def filter_existing_duplicate_of_edges(
     driver: GraphDriver, duplicates_node_tuples: list[tuple[EntityNode, EntityNode]]
 ) -> list[tuple[EntityNode, EntityNode]]:
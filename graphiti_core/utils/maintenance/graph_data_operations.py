@@ -20,13 +20,19 @@ from datetime import datetime
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.embedder.batching import CHARS_PER_TOKEN, estimate_tokens
 from graphiti_core.models.nodes.node_db_queries import (
     EPISODIC_NODE_RETURN,
     EPISODIC_NODE_RETURN_NEPTUNE,
 )
 from graphiti_core.nodes import EpisodeType, EpisodicNode, get_episodic_node_from_record
+from graphiti_core.utils.text_utils import truncate_at_sentence
 
 EPISODE_WINDOW_LEN = 3
+# Estimated tokens of previous episode content included in each extraction prompt
+PREVIOUS_EPISODES_TOKEN_BUDGET = 4000
+# Episodes that would have to be cut below this many tokens are dropped instead
+MIN_TRUNCATED_EPISODE_TOKENS = 50
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +63,12 @@ async def clear_data(driver: GraphDriver, group_ids: list[str] | None = None):
         else:
             await session.execute_write(delete_group_ids)
 
+    if driver.vector_indexes is not None:
+        if group_ids is None:
+            driver.vector_indexes.clear()
+        else:
+            driver.vector_indexes.remove_groups(group_ids)
+
 
 async def retrieve_episodes(
     driver: GraphDriver,
@@ -118,3 +130,81 @@ async def retrieve_episodes(
 
     episodes = [get_episodic_node_from_record(record) for record in result]
     return list(reversed(episodes))  # Return in chronological order
+
+
+def merge_pending_episodes(
+    previous_episodes: list[EpisodicNode],
+    pending_episodes: list[EpisodicNode],
+    reference_time: datetime,
+    last_n: int = EPISODE_WINDOW_LEN,
+    source: EpisodeType | None = None,
+) -> list[EpisodicNode]:
+    """
+    Merge episodes that have not been persisted yet into a retrieved episode window.
+
+    Args:
+        previous_episodes (list[EpisodicNode]): Episodes retrieved from the graph, in chronological order.
+        pending_episodes (list[EpisodicNode]): Episodes that are still being processed and may not have
+                                               been saved yet.
+        reference_time (datetime): Only episodes with a valid_at timestamp less than or equal to this
+                                   reference_time are kept, mirroring `retrieve_episodes`.
+        last_n (int, optional): The number of most recent episodes to keep.
+        source (EpisodeType, optional): Only keep pending episodes of this source type.
+
+    Returns:
+        list[EpisodicNode]: The last n episodes in chronological order, without duplicates.
+    """
+    merged: dict[str, EpisodicNode] = {episode.uuid: episode for episode in previous_episodes}
+    for episode in pending_episodes:
+        if episode.valid_at > reference_time:
+            continue
+        if source is not None and episode.source != source:
+            continue
+        merged.setdefault(episode.uuid, episode)
+
+    episodes = sorted(merged.values(), key=lambda episode: episode.valid_at)
+    return episodes[-last_n:] if last_n > 0 else []
+
+
+def fit_episodes_to_token_budget(
+    previous_episodes: list[EpisodicNode],
+    token_budget: int | None = PREVIOUS_EPISODES_TOKEN_BUDGET,
+) -> list[EpisodicNode]:
+    """
+    Bound the previous episode context passed to extraction prompts.
+
+    Episodes are taken newest first while their estimated tokens fit in token_budget. The first
+    episode that does not fit is truncated at a sentence boundary to the remaining budget, and it
+    and all older episodes are dropped if less than MIN_TRUNCATED_EPISODE_TOKENS remain.
+    Truncated episodes are copies, so the given episodes are never modified.
+
+    Args:
+        previous_episodes (list[EpisodicNode]): Episodes in chronological order.
+        token_budget (int, optional): Estimated tokens of content to keep. None keeps everything.
+
+    Returns:
+        list[EpisodicNode]: The episodes that fit, in chronological order.
+    """
+    if token_budget is None:
+        return previous_episodes
+
+    remaining = token_budget
+    fitted: list[EpisodicNode] = []
+    for episode in reversed(previous_episodes):
+        tokens = estimate_tokens(episode.content)
+        if tokens <= remaining:
+            fitted.append(episode)
+            remaining -= tokens
+            continue
+
+        if remaining >= MIN_TRUNCATED_EPISODE_TOKENS:
+            content = truncate_at_sentence(episode.content, remaining * CHARS_PER_TOKEN)
+            fitted.append(episode.model_copy(update={'content': content}))
+
+        logger.debug(
+            f'Kept {len(fitted)} of {len(previous_episodes)} previous episodes within '
+            f'{token_budget} tokens'
+        )
+        break
+
+    return list(reversed(fitted))
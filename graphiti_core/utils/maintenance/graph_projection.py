@@ -0,0 +1,228 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import logging
+from collections.abc import Iterable
+
+import numpy as np
+from numpy.typing import NDArray
+from typing_extensions import LiteralString, Self
+
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+
+logger = logging.getLogger(__name__)
+
+PROJECTION_PAGE_SIZE = 5000
+# Synchronous label propagation can oscillate between two labelings forever
+LABEL_PROPAGATION_MAX_ITERATIONS = 100
+
+
+class GraphProjection:
+    """
+    Weighted adjacency of a set of nodes in compressed sparse row (CSR) form.
+
+    Node i is uuids[i]. Its neighbors are indices[indptr[i]:indptr[i + 1]], with the matching
+    edge weights in weights. Duplicate entries are summed when the projection is built.
+    """
+
+    def __init__(
+        self,
+        uuids: list[str],
+        sources: NDArray[np.int64],
+        targets: NDArray[np.int64],
+        weights: NDArray[np.float64],
+    ):
+        self.uuids = uuids
+        self.index = {uuid: i for i, uuid in enumerate(uuids)}
+
+        size = len(uuids)
+        keys, inverse = np.unique(
+            sources.astype(np.int64) * size + targets.astype(np.int64), return_inverse=True
+        )
+        self.weights: NDArray[np.float64] = np.bincount(
+            inverse.ravel(), weights=weights, minlength=len(keys)
+        ).astype(np.float64)
+        self.indices: NDArray[np.int64] = keys % size if size else keys
+        self.indptr: NDArray[np.int64] = np.zeros(size + 1, dtype=np.int64)
+        if size:
+            np.cumsum(np.bincount(keys // size, minlength=size), out=self.indptr[1:])
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    @classmethod
+    def from_edges(cls, uuids: list[str], edges: Iterable[tuple[str, str, float]]) -> Self:
+        """Build a projection from (source uuid, target uuid, weight) entries, taken as given."""
+        index = {uuid: i for i, uuid in enumerate(uuids)}
+        sources: list[int] = []
+        targets: list[int] = []
+        weights: list[float] = []
+        for source_uuid, target_uuid, weight in edges:
+            sources.append(index[source_uuid])
+            targets.append(index[target_uuid])
+            weights.append(weight)
+
+        return cls(
+            uuids,
+            np.array(sources, dtype=np.int64),
+            np.array(targets, dtype=np.int64),
+            np.array(weights, dtype=np.float64),
+        )
+
+
+async def get_graph_projection(
+    driver: GraphDriver, group_id: str, page_size: int = PROJECTION_PAGE_SIZE
+) -> GraphProjection:
+    """
+    Load the undirected RELATES_TO adjacency of a group's entities, weighted by edge count.
+
+    Entities are paged by uuid cursor and each page returns the outgoing edge counts of its
+    entities, so the whole group is read in len(group) / page_size queries. Entities without
+    edges are included, self-loops are dropped and each edge is stored in both directions.
+    """
+    if driver.provider == GraphProvider.KUZU:
+        edge_query: LiteralString = """
+            OPTIONAL MATCH (n)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity {group_id: $group_id})
+        """
+    else:
+        edge_query = """
+            OPTIONAL MATCH (n)-[e:RELATES_TO]->(m:Entity {group_id: $group_id})
+        """
+
+    index: dict[str, int] = {}
+    uuids: list[str] = []
+
+    def node_index(uuid: str) -> int:
+        i = index.get(uuid)
+        if i is None:
+            i = index[uuid] = len(uuids)
+            uuids.append(uuid)
+        return i
+
+    sources: list[int] = []
+    targets: list[int] = []
+    weights: list[int] = []
+    uuid_cursor: str | None = None
+    while True:
+        cursor_query: LiteralString = 'WHERE n.uuid > $uuid' if uuid_cursor else ''
+        records, _, _ = await driver.execute_query(
+            """
+            MATCH (n:Entity {group_id: $group_id})
+            """
+            + cursor_query
+            + """
+            WITH n
+            ORDER BY n.uuid
+            LIMIT $limit
+            """
+            + edge_query
+            + """
+            WITH n.uuid AS source_uuid, m.uuid AS target_uuid, count(e) AS count
+            RETURN
+                source_uuid,
+                target_uuid,
+                count
+            """,
+            group_id=group_id,
+            uuid=uuid_cursor,
+            limit=page_size,
+            routing_='r',
+        )
+
+        page_uuids: set[str] = set()
+        for record in records:
+            source_uuid = record['source_uuid']
+            page_uuids.add(source_uuid)
+            source = node_index(source_uuid)
+            target_uuid = record['target_uuid']
+            if target_uuid is None or target_uuid == source_uuid or not record['count']:
+                continue
+            sources.append(source)
+            targets.append(node_index(target_uuid))
+            weights.append(record['count'])
+
+        if len(page_uuids) < page_size:
+            break
+        uuid_cursor = max(page_uuids)
+
+    logger.debug(
+        f'Loaded projection for group {group_id}: {len(uuids)} entities, {len(sources)} edges'
+    )
+
+    source_array = np.array(sources, dtype=np.int64)
+    target_array = np.array(targets, dtype=np.int64)
+    weight_array = np.array(weights, dtype=np.float64)
+    return GraphProjection(
+        uuids,
+        np.concatenate([source_array, target_array]),
+        np.concatenate([target_array, source_array]),
+        np.concatenate([weight_array, weight_array]),
+    )
+
+
+def label_propagation_csr(
+    projection: GraphProjection,
+    labels: NDArray[np.int64] | None = None,
+    fixed: NDArray[np.bool_] | None = None,
+    max_iterations: int = LABEL_PROPAGATION_MAX_ITERATIONS,
+) -> NDArray[np.int64]:
+    """
+    Label propagation over a CSR projection, vectorized with NumPy.
+
+    Every round, each node takes the label with the largest total edge weight among its
+    neighbors, with ties going to the larger label. A winning weight of 1 or less only replaces
+    the node's label if that label is larger. Labels update synchronously until none change.
+    Nodes start in their own community unless labels are given, and nodes marked in fixed
+    keep their label throughout. Stops after max_iterations rounds if labels keep oscillating.
+    """
+    size = len(projection)
+    if labels is None:
+        labels = np.arange(size, dtype=np.int64)
+    else:
+        labels = labels.astype(np.int64, copy=True)
+
+    if projection.indices.size == 0:
+        return labels
+
+    rows = np.repeat(np.arange(size, dtype=np.int64), np.diff(projection.indptr))
+    for _ in range(max_iterations):
+        neighbor_labels = labels[projection.indices]
+        span = int(labels.max()) + 1
+        keys, inverse = np.unique(rows * span + neighbor_labels, return_inverse=True)
+        totals = np.bincount(inverse.ravel(), weights=projection.weights, minlength=len(keys))
+        key_rows = keys // span
+        key_labels = keys % span
+
+        # Last entry per row after sorting by (row, total, label) is the winning label
+        order = np.lexsort((key_labels, totals, key_rows))
+        sorted_rows = key_rows[order]
+        winners = order[np.append(sorted_rows[1:] != sorted_rows[:-1], True)]
+
+        candidate = np.full(size, -1, dtype=np.int64)
+        rank = np.zeros(size, dtype=np.float64)
+        candidate[key_rows[winners]] = key_labels[winners]
+        rank[key_rows[winners]] = totals[winners]
+
+        new_labels = np.where(rank > 1, candidate, np.maximum(candidate, labels))
+        if fixed is not None:
+            new_labels = np.where(fixed, labels, new_labels)
+
+        if np.array_equal(new_labels, labels):
+            return labels
+        labels = new_labels
+
+    logger.warning(f'Label propagation did not converge after {max_iterations} iterations')
+    return labels
@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 import logging
+from collections import defaultdict
 from collections.abc import Awaitable, Callable
 from time import time
 from typing import Any
@@ -39,7 +40,7 @@ from graphiti_core.prompts.extract_nodes import (
     ExtractedEntity,
     MissedEntities,
 )
-from graphiti_core.search.search import search
+from graphiti_core.search.search import search_many
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.search.search_config_recipes import NODE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
@@ -47,6 +48,7 @@ from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.dedup_helpers import (
     DedupCandidateIndexes,
     DedupResolutionState,
+    EntityNameIndex,
     _build_candidate_indexes,
     _resolve_with_similarity,
 )
@@ -59,6 +61,8 @@ logger = logging.getLogger(__name__)
 
 NodeSummaryFilter = Callable[[EntityNode], Awaitable[bool]]
 
+ENTITY_INDEX_PAGE_SIZE = 5000
+
 
 async def extract_nodes_reflexion(
     llm_client: LLMClient,
@@ -214,20 +218,29 @@ async def _collect_candidate_nodes(
     existing_nodes_override: list[EntityNode] | None,
 ) -> list[EntityNode]:
     """Search per extracted name and return unique candidates with overrides honored in order."""
-    search_results: list[SearchResults] = await semaphore_gather(
+    nodes_by_group: dict[str, list[EntityNode]] = defaultdict(list)
+    for node in extracted_nodes:
+        nodes_by_group[node.group_id].append(node)
+
+    search_results: list[list[SearchResults]] = await semaphore_gather(
         *[
-            search(
-                clients=clients,
-                query=node.name,
-                group_ids=[node.group_id],
-                search_filter=SearchFilters(),
+            search_many(
+                clients,
+                [node.name for node in group_nodes],
+                group_ids=[group_id],
                 config=NODE_HYBRID_SEARCH_RRF,
+                search_filter=SearchFilters(),
             )
-            for node in extracted_nodes
+            for group_id, group_nodes in nodes_by_group.items()
         ]
     )
 
-    candidate_nodes: list[EntityNode] = [node for result in search_results for node in result.nodes]
+    candidate_nodes: list[EntityNode] = [
+        node
+        for group_results in search_results
+        for result in group_results
+        for node in result.nodes
+    ]
 
     if existing_nodes_override is not None:
         candidate_nodes.extend(existing_nodes_override)
@@ -243,6 +256,72 @@ async def _collect_candidate_nodes(
     return ordered_candidates
 
 
+async def _load_entity_name_index(
+    clients: GraphitiClients, group_id: str, index: EntityNameIndex
+) -> None:
+    """Page every entity of a group into its name index on first use.
+
+    Groups larger than the store's per-group cap are left unindexed and always resolved
+    through search.
+    """
+    async with index.lock:
+        if index.loaded:
+            return
+
+        max_nodes = clients.entity_indexes.max_nodes_per_group
+        async for page in EntityNode.iter_by_group_ids(
+            clients.driver, [group_id], page_size=ENTITY_INDEX_PAGE_SIZE
+        ):
+            index.add(page)
+            if len(index) > max_nodes:
+                logger.debug(
+                    'Group %s has more than %d entities; skipping entity name index',
+                    group_id,
+                    max_nodes,
+                )
+                index.clear()
+                index.loaded = True
+                return
+
+        index.loaded = True
+        index.complete = True
+
+
+async def _resolve_with_entity_index(
+    clients: GraphitiClients,
+    extracted_nodes: list[EntityNode],
+    index: EntityNameIndex,
+) -> dict[int, EntityNode]:
+    """Resolve extracted nodes whose names match exactly one indexed entity.
+
+    Returns the matched existing node by position in ``extracted_nodes``. Index entries whose
+    node no longer exists are dropped and their extracted nodes left for the search pass.
+    """
+    matched_uuids: dict[int, str] = {}
+    for idx, node in enumerate(extracted_nodes):
+        matched_uuid = index.match(node.name)
+        if matched_uuid is not None:
+            matched_uuids[idx] = matched_uuid
+
+    if not matched_uuids:
+        return {}
+
+    existing_nodes: list[EntityNode] = await EntityNode.get_by_uuids(
+        clients.driver, list(set(matched_uuids.values()))
+    )
+    existing_by_uuid = {node.uuid: node for node in existing_nodes}
+
+    stale_uuids = set(matched_uuids.values()) - existing_by_uuid.keys()
+    if stale_uuids:
+        index.remove(stale_uuids)
+
+    return {
+        idx: existing_by_uuid[uuid]
+        for idx, uuid in matched_uuids.items()
+        if uuid in existing_by_uuid
+    }
+
+
 async def _resolve_with_llm(
     llm_client: LLMClient,
     extracted_nodes: list[EntityNode],
@@ -400,28 +479,55 @@ async def resolve_extracted_nodes(
     entity_types: dict[str, type[BaseModel]] | None = None,
     existing_nodes_override: list[EntityNode] | None = None,
 ) -> tuple[list[EntityNode], dict[str, str], list[tuple[EntityNode, EntityNode]]]:
-    """Search for existing nodes, resolve deterministic matches, then escalate holdouts to the LLM dedupe prompt."""
+    """Search for existing nodes, resolve deterministic matches, then escalate holdouts to the LLM dedupe prompt.
+
+    Names that match exactly one entity in the group's warm name index are resolved before any
+    search is issued, unless the caller supplies ``existing_nodes_override``.
+    """
     llm_client = clients.llm_client
     driver = clients.driver
-    existing_nodes = await _collect_candidate_nodes(
-        clients,
-        extracted_nodes,
-        existing_nodes_override,
+    if not extracted_nodes:
+        return [], {}, []
+
+    group_id = episode.group_id if episode is not None else extracted_nodes[0].group_id
+    entity_index = clients.entity_indexes.get(group_id)
+
+    index_resolved: dict[int, EntityNode] = {}
+    if existing_nodes_override is None:
+        await _load_entity_name_index(clients, group_id, entity_index)
+        index_resolved = await _resolve_with_entity_index(clients, extracted_nodes, entity_index)
+
+    pending_indices = [idx for idx in range(len(extracted_nodes)) if idx not in index_resolved]
+    pending_nodes = [extracted_nodes[idx] for idx in pending_indices]
+
+    existing_nodes = (
+        await _collect_candidate_nodes(
+            clients,
+            pending_nodes,
+            existing_nodes_override,
+        )
+        if pending_nodes
+        else []
     )
 
-    indexes: DedupCandidateIndexes = _build_candidate_indexes(existing_nodes)
+    indexes: DedupCandidateIndexes = _build_candidate_indexes(
+        existing_nodes,
+        entity_index.candidate_lsh_index(existing_nodes)
+        if existing_nodes_override is None
+        else None,
+    )
 
     state = DedupResolutionState(
-        resolved_nodes=[None] * len(extracted_nodes),
+        resolved_nodes=[None] * len(pending_nodes),
         uuid_map={},
         unresolved_indices=[],
     )
 
-    _resolve_with_similarity(extracted_nodes, indexes, state)
+    _resolve_with_similarity(pending_nodes, indexes, state)
 
     await _resolve_with_llm(
         llm_client,
-        extracted_nodes,
+        pending_nodes,
         indexes,
         state,
         episode,
@@ -429,14 +535,25 @@ async def resolve_extracted_nodes(
         entity_types,
     )
 
-    for idx, node in enumerate(extracted_nodes):
-        if state.resolved_nodes[idx] is None:
-            state.resolved_nodes[idx] = node
-            state.uuid_map[node.uuid] = node.uuid
+    resolved_nodes: list[EntityNode | None] = [None] * len(extracted_nodes)
+    for idx, existing_node in index_resolved.items():
+        extracted_node = extracted_nodes[idx]
+        resolved_nodes[idx] = existing_node
+        state.uuid_map[extracted_node.uuid] = existing_node.uuid
+        if existing_node.uuid != extracted_node.uuid:
+            state.duplicate_pairs.append((extracted_node, existing_node))
+
+    for pending_idx, idx in enumerate(pending_indices):
+        resolved_node = state.resolved_nodes[pending_idx]
+        if resolved_node is None:
+            resolved_node = extracted_nodes[idx]
+            state.uuid_map[resolved_node.uuid] = resolved_node.uuid
+        resolved_nodes[idx] = resolved_node
 
     logger.debug(
-        'Resolved nodes: %s',
-        [(node.name, node.uuid) for node in state.resolved_nodes if node is not None],
+        'Resolved nodes: %s (%d from entity name index)',
+        [(node.name, node.uuid) for node in resolved_nodes if node is not None],
+        len(index_resolved),
     )
 
     new_node_duplicates: list[
@@ -444,7 +561,7 @@ async def resolve_extracted_nodes(
     ] = await filter_existing_duplicate_of_edges(driver, state.duplicate_pairs)
 
     return (
-        [node for node in state.resolved_nodes if node is not None],
+        [node for node in resolved_nodes if node is not None],
         state.uuid_map,
         new_node_duplicates,
     )
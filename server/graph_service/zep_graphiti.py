@@ -4,7 +4,7 @@ from typing import Annotated
 from fastapi import Depends, HTTPException
 from graphiti_core import Graphiti  # type: ignore
 from graphiti_core.edges import EntityEdge  # type: ignore
-from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError, NodeNotFoundError
+from graphiti_core.errors import EdgeNotFoundError, NodeNotFoundError
 from graphiti_core.llm_client import LLMClient  # type: ignore
 from graphiti_core.nodes import EntityNode, EpisodicNode  # type: ignore
 
@@ -37,24 +37,16 @@ class ZepGraphiti(Graphiti):
             raise HTTPException(status_code=404, detail=e.message) from e
 
     async def delete_group(self, group_id: str):
-        try:
-            edges = await EntityEdge.get_by_group_ids(self.driver, [group_id])
-        except GroupsEdgesNotFoundError:
-            logger.warning(f'No edges found for group {group_id}')
-            edges = []
-
-        nodes = await EntityNode.get_by_group_ids(self.driver, [group_id])
-
-        episodes = await EpisodicNode.get_by_group_ids(self.driver, [group_id])
+        # Delete page by page so large groups are never loaded into memory at once. Pages
+        # are read in descending uuid order below the cursor, so deleting as we go is safe.
+        async for edges in EntityEdge.iter_by_group_ids(self.driver, [group_id]):
+            await EntityEdge.delete_by_uuids(self.driver, [edge.uuid for edge in edges])
 
-        for edge in edges:
-            await edge.delete(self.driver)
-
-        for node in nodes:
-            await node.delete(self.driver)
+        async for nodes in EntityNode.iter_by_group_ids(self.driver, [group_id]):
+            await EntityNode.delete_by_uuids(self.driver, [node.uuid for node in nodes])
 
-        for episode in episodes:
-            await episode.delete(self.driver)
+        async for episodes in EpisodicNode.iter_by_group_ids(self.driver, [group_id]):
+            await EpisodicNode.delete_by_uuids(self.driver, [episode.uuid for episode in episodes])
 
     async def delete_entity_edge(self, uuid: str):
         try:
@@ -22,6 +22,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.driver.vector_index import VectorIndexConfig
 
 try:
     from graphiti_core.driver.falkordb_driver import FalkorDriver, FalkorDriverSession
@@ -216,6 +217,28 @@ class TestFalkorDriver:
 
             mock_execute.assert_called_once_with('CALL db.indexes()')
 
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    def test_clone_keeps_tracer(self):
+        """Test that clones keep the tracer of the driver they were cloned from."""
+        tracer = MagicMock()
+        self.driver.set_tracer(tracer)
+
+        assert self.driver.clone('other_db').tracer is tracer
+        assert self.driver.clone(self.driver.default_group_id).tracer is tracer
+
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    def test_clone_keeps_one_vector_index_per_database(self):
+        """Test that clones get the vector indexes of their own database."""
+        driver = FalkorDriver(falkor_db=MagicMock(), vector_index=VectorIndexConfig())
+        assert driver.vector_indexes is not None
+
+        other = driver.clone('other_db')
+        assert other.vector_indexes is not None
+        assert other.vector_indexes is not driver.vector_indexes
+        assert driver.clone('other_db').vector_indexes is other.vector_indexes
+        assert other.clone('default_db').vector_indexes is driver.vector_indexes
+        assert self.driver.clone('other_db').vector_indexes is None
+
 
 class TestFalkorDriverSession:
     """Test FalkorDB driver session functionality."""
@@ -0,0 +1,148 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.driver.neo4j_driver import Neo4jDriver, Neo4jDriverConfig
+from graphiti_core.tracer import NoOpSpan, Tracer
+
+
+class RecordingTracer(Tracer):
+    def __init__(self):
+        self.attributes: list[dict[str, Any]] = []
+
+    @contextmanager
+    def start_span(self, name: str):
+        span = NoOpSpan()
+        recorded: dict[str, Any] = {'name': name}
+        span.add_attributes = recorded.update  # type: ignore[method-assign]
+        self.attributes.append(recorded)
+        yield span
+
+
+def _make_driver(config: Neo4jDriverConfig | None = None):
+    clients: list[MagicMock] = []
+
+    def make_client(**kwargs):
+        client = MagicMock()
+        client.kwargs = kwargs
+        client.execute_query = AsyncMock(return_value=([], None, None))
+        client.close = AsyncMock()
+        clients.append(client)
+        return client
+
+    with (
+        patch('graphiti_core.driver.neo4j_driver.AsyncGraphDatabase') as mock_db,
+        patch.object(Neo4jDriver, 'build_indices_and_constraints', AsyncMock()),
+    ):
+        mock_db.driver.side_effect = make_client
+        driver = Neo4jDriver('neo4j://writer:7687', 'user', 'pass', config=config)
+
+    return driver, clients
+
+
+def test_pool_config_is_passed_to_driver():
+    driver, clients = _make_driver(
+        Neo4jDriverConfig(
+            max_connection_pool_size=8,
+            connection_acquisition_timeout=5.0,
+            liveness_check_timeout=30.0,
+            fetch_size=250,
+        )
+    )
+
+    assert len(clients) == 1
+    assert driver.read_client is None
+    assert clients[0].kwargs == {
+        'uri': 'neo4j://writer:7687',
+        'auth': ('user', 'pass'),
+        'max_connection_pool_size': 8,
+        'connection_acquisition_timeout': 5.0,
+        'liveness_check_timeout': 30.0,
+        'fetch_size': 250,
+    }
+
+
+def test_invalid_pool_size_raises():
+    with pytest.raises(ValueError):
+        _make_driver(Neo4jDriverConfig(max_connection_pool_size=0))
+
+
+@pytest.mark.asyncio
+async def test_reads_are_routed_to_read_uri():
+    driver, (writer, reader) = _make_driver(Neo4jDriverConfig(read_uri='neo4j://replica:7687'))
+    assert reader.kwargs['uri'] == 'neo4j://replica:7687'
+
+    await driver.execute_query('MATCH (n) RETURN n', routing_='r')
+    await driver.execute_query('CREATE (n)')
+
+    reader.execute_query.assert_awaited_once()
+    assert reader.execute_query.await_args.kwargs['routing_'] == 'r'
+    writer.execute_query.assert_awaited_once()
+
+    await driver.close()
+    reader.close.assert_awaited_once()
+    writer.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_route_reads_disabled_sends_reads_to_writer():
+    driver, (writer, reader) = _make_driver(
+        Neo4jDriverConfig(read_uri='neo4j://replica:7687', route_reads=False)
+    )
+
+    await driver.execute_query('MATCH (n) RETURN n', routing_='r')
+
+    reader.execute_query.assert_not_awaited()
+    assert 'routing_' not in writer.execute_query.await_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_are_traced_and_concurrency_is_bounded():
+    driver, (writer,) = _make_driver(Neo4jDriverConfig(max_connection_pool_size=2))
+    tracer = RecordingTracer()
+    driver.set_tracer(tracer)
+
+    running = 0
+    peak = 0
+
+    async def slow_query(*args, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return [], None, None
+
+    writer.execute_query.side_effect = slow_query
+
+    await asyncio.gather(*[driver.execute_query('RETURN 1') for _ in range(5)])
+
+    assert peak == 2
+    assert driver.pool_stats.queries == 5
+    assert driver.pool_stats.in_flight == 0
+    assert driver.pool_stats.peak_in_flight == 2
+    assert driver.pool_stats.acquisition_wait_max > 0
+
+    assert len(tracer.attributes) == 5
+    assert all(attrs['name'] == 'neo4j.execute_query' for attrs in tracer.attributes)
+    assert max(attrs['pool.utilization'] for attrs in tracer.attributes) == 1.0
+    assert all(attrs['db.routing'] == 'write' for attrs in tracer.attributes)
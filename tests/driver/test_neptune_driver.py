@@ -0,0 +1,95 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+try:
+    from graphiti_core.driver.neptune_driver import NeptuneDriver
+
+    HAS_NEPTUNE = True
+except ImportError:
+    NeptuneDriver = None
+    HAS_NEPTUNE = False
+
+pytestmark = pytest.mark.skipif(not HAS_NEPTUNE, reason='Neptune dependencies are not installed')
+
+
+def _make_driver(max_concurrent_queries: int = 4):
+    class _NeptuneDriver(NeptuneDriver):  # type: ignore[misc,valid-type]
+        async def build_indices_and_constraints(self, delete_existing: bool = False):
+            pass
+
+    with (
+        patch('graphiti_core.driver.neptune_driver.NeptuneGraph') as mock_graph,
+        patch('graphiti_core.driver.neptune_driver.boto3'),
+        patch('graphiti_core.driver.neptune_driver.OpenSearch') as mock_opensearch,
+        patch('graphiti_core.driver.neptune_driver.Urllib3AWSV4SignerAuth'),
+    ):
+        driver = _NeptuneDriver(
+            'neptune-db://localhost',
+            'aoss-host',
+            max_concurrent_queries=max_concurrent_queries,
+        )
+    return driver, mock_graph.return_value, mock_opensearch
+
+
+@pytest.mark.asyncio
+async def test_execute_query_runs_off_the_event_loop_in_parallel():
+    driver, client, _ = _make_driver(max_concurrent_queries=4)
+    loop_thread = threading.get_ident()
+    query_threads: set[int] = set()
+
+    def slow_query(query, params):
+        query_threads.add(threading.get_ident())
+        time.sleep(0.1)
+        return [{'ok': True}]
+
+    client.query.side_effect = slow_query
+
+    start = time.monotonic()
+    results = await asyncio.gather(*[driver.execute_query('RETURN 1') for _ in range(4)])
+    elapsed = time.monotonic() - start
+
+    assert all(records == [{'ok': True}] for records, _, _ in results)
+    assert loop_thread not in query_threads
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_run_aoss_query_does_not_share_query_template():
+    driver, _, _ = _make_driver()
+    driver.aoss_client = MagicMock()
+    driver.aoss_client.search.side_effect = lambda body, index: body
+
+    first, second = await asyncio.gather(
+        driver.run_aoss_query('node_name_and_summary', 'alice'),
+        driver.run_aoss_query('node_name_and_summary', 'bob'),
+    )
+
+    assert first['query']['multi_match']['query'] == 'alice'
+    assert second['query']['multi_match']['query'] == 'bob'
+
+
+def test_max_concurrent_queries_sizes_pools():
+    driver, _, mock_opensearch = _make_driver(max_concurrent_queries=8)
+
+    assert driver._executor._max_workers == 8
+    assert mock_opensearch.call_args.kwargs['pool_maxsize'] == 8
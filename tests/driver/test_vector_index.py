@@ -0,0 +1,217 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.driver.vector_index import GraphVectorIndexes, VectorIndex, VectorIndexConfig
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import edge_similarity_search, node_similarity_search
+
+
+def _random_vectors(count: int, dim: int = 16, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(count, dim)).astype(np.float32)
+
+
+def test_exact_search_orders_by_cosine_and_filters_groups():
+    index = VectorIndex('test')
+    index.add(
+        [
+            ('a', 'g1', [1.0, 0.0]),
+            ('b', 'g1', [1.0, 1.0]),
+            ('c', 'g2', [1.0, 0.1]),
+            ('d', 'g1', [0.0, 1.0]),
+        ]
+    )
+
+    results = index.search([1.0, 0.0], limit=3)
+    assert [uuid for uuid, _ in results] == ['a', 'c', 'b']
+    assert results[0][1] == pytest.approx(1.0)
+
+    assert [uuid for uuid, _ in index.search([1.0, 0.0], limit=2, group_ids=['g1'])] == ['a', 'b']
+    assert index.search([1.0, 0.0], limit=2, group_ids=['missing']) == []
+    # Vectors of a different dimension are ignored
+    assert index.search([1.0, 0.0, 0.0], limit=2) == []
+
+
+def test_remove_and_upsert_reuse_slots():
+    index = VectorIndex('test')
+    index.add([('a', 'g1', [1.0, 0.0]), ('b', 'g1', [0.0, 1.0])])
+
+    index.remove(['a'])
+    assert [uuid for uuid, _ in index.search([1.0, 0.0], limit=2)] == ['b']
+
+    index.add([('c', 'g1', [1.0, 0.0]), ('b', 'g1', [1.0, 0.1])])
+    assert len(index) == 2
+    assert [uuid for uuid, _ in index.search([1.0, 0.0], limit=2)] == ['c', 'b']
+
+    index.remove_groups(['g1'])
+    assert len(index) == 0
+    assert index.search([1.0, 0.0], limit=2) == []
+
+
+@pytest.mark.asyncio
+async def test_trained_index_recalls_nearest_neighbors(tmp_path):
+    vectors = _random_vectors(4000)
+    index = VectorIndex(
+        'test', VectorIndexConfig(train_threshold=1000, n_probe=16, path=str(tmp_path))
+    )
+    index.add((f'uuid-{i}', f'g{i % 2}', vector.tolist()) for i, vector in enumerate(vectors))
+
+    assert index.needs_training()
+    await index.train()
+    assert index.trained
+    assert not index.needs_training()
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Adds after training are assigned to the existing lists
+    index.add([('late', 'g0', vectors[0].tolist())])
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    recalled = 0
+    for i in range(50):
+        query = vectors[i] + 0.1 * _random_vectors(1, seed=i + 1)[0]
+        exact = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:10]
+        found = {uuid for uuid, _ in index.search(query.tolist(), limit=10)}
+        recalled += len({f'uuid-{j}' for j in exact} & found)
+
+    assert recalled / 500 > 0.8
+    assert 'late' in {uuid for uuid, _ in index.search(vectors[0].tolist(), limit=2)}
+
+
+@pytest.mark.asyncio
+async def test_graph_vector_indexes_load_once_from_driver():
+    driver = MagicMock()
+    driver.provider = GraphProvider.KUZU
+    driver.execute_query = AsyncMock(
+        side_effect=[
+            ([{'uuid': 'n1', 'group_id': 'g1', 'embedding': [1.0, 0.0]}], None, None),
+            (
+                [
+                    {
+                        'uuid': 'e1',
+                        'group_id': 'g1',
+                        'embedding': [0.0, 1.0],
+                        'source_node_uuid': 'n1',
+                        'target_node_uuid': 'n2',
+                    }
+                ],
+                None,
+                None,
+            ),
+        ]
+    )
+    indexes = GraphVectorIndexes(VectorIndexConfig(min_candidates=1, oversample=1))
+    indexes.add_nodes([EntityNode(uuid='n2', name='n2', group_id='g1', name_embedding=[0.9, 0.1])])
+
+    assert await indexes.search_nodes(driver, [1.0, 0.0], ['g1'], 2) == ['n1', 'n2']
+    assert await indexes.search_edges(driver, [0.0, 1.0], None, 1) == ['e1']
+    assert driver.execute_query.await_count == 2
+    assert 'RelatesToNode_' in driver.execute_query.await_args_list[1].args[0]
+
+    indexes.remove(['n1'])
+    assert await indexes.search_nodes(driver, [1.0, 0.0], ['g1'], 2) == ['n2']
+    # The fact leaving n1 was deleted with it
+    assert await indexes.search_edges(driver, [0.0, 1.0], None, 1) == []
+
+
+def test_removing_an_entity_removes_its_facts():
+    indexes = GraphVectorIndexes()
+    indexes.add_nodes(
+        EntityNode(uuid=uuid, name=uuid, group_id='g1', name_embedding=[1.0, 0.0])
+        for uuid in ['a', 'b', 'c']
+    )
+    indexes.add_edges(
+        EntityEdge(
+            uuid=uuid,
+            group_id='g1',
+            source_node_uuid=source,
+            target_node_uuid=target,
+            name='RELATES_TO',
+            fact=uuid,
+            fact_embedding=[0.0, 1.0],
+            created_at=datetime(2025, 1, 1),
+        )
+        for uuid, source, target in [('ab', 'a', 'b'), ('bc', 'b', 'c'), ('ca', 'c', 'a')]
+    )
+
+    indexes.remove(['b'])
+    assert len(indexes.nodes) == 2
+    assert [uuid for uuid, _ in indexes.edges.search([0.0, 1.0], limit=3)] == ['ca']
+
+    indexes.remove(['ca'])
+    indexes.remove_groups(['g1'])
+    assert len(indexes.nodes) == 0
+    assert len(indexes.edges) == 0
+    assert indexes._edges_by_node == {}
+
+
+def _indexed_driver() -> MagicMock:
+    driver = MagicMock()
+    driver.provider = GraphProvider.KUZU
+    driver.search_interface = None
+    driver.execute_query = AsyncMock(return_value=([], None, None))
+    driver.vector_indexes = GraphVectorIndexes(VectorIndexConfig(min_candidates=1, oversample=1))
+    driver.vector_indexes.loaded = True
+    vectors = _random_vectors(10)
+    driver.vector_indexes.add_nodes(
+        EntityNode(uuid=f'n{i}', name=f'n{i}', group_id='g1', name_embedding=vector.tolist())
+        for i, vector in enumerate(vectors)
+    )
+    return driver
+
+
+def _candidate_counts(driver: MagicMock) -> list[int]:
+    return [len(call.kwargs['candidate_uuids']) for call in driver.execute_query.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_filtered_node_search_widens_candidates():
+    driver = _indexed_driver()
+    vector = _random_vectors(1)[0].tolist()
+
+    await node_similarity_search(driver, vector, SearchFilters(), ['g1'], limit=2)
+    assert _candidate_counts(driver) == [2]
+
+    # Nothing passes the label filter, so candidates grow until the group is exhausted
+    driver.execute_query.reset_mock()
+    await node_similarity_search(
+        driver, vector, SearchFilters(node_labels=['Person']), ['g1'], limit=2
+    )
+    assert _candidate_counts(driver) == [2, 8, 10]
+
+
+@pytest.mark.asyncio
+async def test_edge_search_by_uuid_or_endpoint_skips_index():
+    driver = _indexed_driver()
+    driver.vector_indexes.search_edges = AsyncMock()
+
+    await edge_similarity_search(
+        driver, [1.0, 0.0], None, None, SearchFilters(edge_uuids=['e1']), ['g1']
+    )
+    await edge_similarity_search(driver, [1.0, 0.0], 'n1', 'n2', SearchFilters(), ['g1'])
+
+    driver.vector_indexes.search_edges.assert_not_awaited()
+    assert driver.execute_query.await_count == 2
+    assert all(
+        'candidate_uuids' not in call.kwargs for call in driver.execute_query.await_args_list
+    )
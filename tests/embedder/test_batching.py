@@ -0,0 +1,69 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+
+import pytest
+
+from graphiti_core.embedder.batching import chunk_inputs, create_batch_chunked
+
+
+def test_chunk_inputs_respects_item_and_token_limits() -> None:
+    """Test that chunks are split on item count and estimated tokens."""
+    assert chunk_inputs(['a', 'b', 'c'], max_items=2) == [['a', 'b'], ['c']]
+
+    long_text = 'x' * 40
+    assert chunk_inputs(['a', long_text, 'b', 'c'], max_items=10, max_tokens=11) == [
+        ['a'],
+        [long_text],
+        ['b', 'c'],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_batch_chunked_dedupes_and_preserves_order() -> None:
+    """Test that identical inputs are embedded once and results follow input order."""
+    requests: list[list[str]] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def embed_chunk(chunk: list[str]) -> list[list[float]]:
+        nonlocal in_flight, max_in_flight
+        requests.append(chunk)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[float(len(text))] for text in chunk]
+
+    inputs = ['aaa', 'b', 'aaa', 'cc', 'dddd', 'b']
+    result = await create_batch_chunked(embed_chunk, inputs, max_items=1, max_concurrency=2)
+
+    assert result == [[3.0], [1.0], [3.0], [2.0], [4.0], [1.0]]
+    assert requests == [['aaa'], ['b'], ['cc'], ['dddd']]
+    assert max_in_flight == 2
+    assert await create_batch_chunked(embed_chunk, [], max_items=1) == []
+
+
+@pytest.mark.asyncio
+async def test_create_batch_chunked_rejects_short_results() -> None:
+    """Test that a provider returning too few embeddings raises an error."""
+
+    async def embed_chunk(chunk: list[str]) -> list[list[float]]:
+        return [[0.0]]
+
+    with pytest.raises(ValueError):
+        await create_batch_chunked(embed_chunk, ['a', 'b'], max_items=2)
@@ -0,0 +1,104 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.embedder.cache import CachedEmbedder, EmbeddingCacheConfig
+from graphiti_core.embedder.client import EmbedderClient, EmbedderConfig
+from tests.embedder.embedder_fixtures import create_embedding_values
+
+
+@pytest.fixture
+def mock_embedder() -> MagicMock:
+    """Create a mock embedder that returns a distinct embedding per input length."""
+    embedder = MagicMock(spec=EmbedderClient)
+    embedder.config = EmbedderConfig()
+    embedder.create = AsyncMock(
+        side_effect=lambda input_data: create_embedding_values(0.1, len(input_data[0]))
+    )
+    embedder.create_batch = AsyncMock(
+        side_effect=lambda texts: [create_embedding_values(0.2, len(text)) for text in texts]
+    )
+    return embedder
+
+
+@pytest.mark.asyncio
+async def test_create_uses_cache_for_normalized_text(mock_embedder: MagicMock) -> None:
+    """Test that repeated inputs are served from the cache."""
+    embedder = CachedEmbedder(mock_embedder)
+
+    first = await embedder.create(input_data=['Alice Smith'])
+    second = await embedder.create(input_data=['  Alice   Smith '])
+
+    assert first == second
+    mock_embedder.create.assert_called_once()
+    assert embedder.stats.hits == 1
+    assert embedder.stats.misses == 1
+    assert embedder.stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_create_batch_only_embeds_distinct_misses(mock_embedder: MagicMock) -> None:
+    """Test that create_batch embeds each uncached text once and keeps input order."""
+    embedder = CachedEmbedder(mock_embedder)
+    await embedder.create(input_data=['a'])
+
+    result = await embedder.create_batch(['bb', 'a', 'ccc', 'bb'])
+
+    mock_embedder.create_batch.assert_called_once_with(['bb', 'ccc'])
+    assert [len(embedding) for embedding in result] == [2, 1, 3, 2]
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_ttl(mock_embedder: MagicMock) -> None:
+    """Test that the memory tier evicts least recently used and expired entries."""
+    embedder = CachedEmbedder(mock_embedder, EmbeddingCacheConfig(max_size=2))
+    await embedder.create_batch(['a', 'b', 'c'])
+
+    assert embedder.stats.evictions == 1
+    await embedder.create_batch(['a'])
+    assert mock_embedder.create_batch.call_count == 2
+
+    expiring = CachedEmbedder(mock_embedder, EmbeddingCacheConfig(ttl=0))
+    await expiring.create('a')
+    await expiring.create('a')
+    assert expiring.stats.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_new_instance(mock_embedder: MagicMock, tmp_path) -> None:
+    """Test that embeddings persisted to disk are reused by a new wrapper."""
+    config = EmbeddingCacheConfig(disk_cache=True, cache_dir=str(tmp_path))
+    await CachedEmbedder(mock_embedder, config).create('persisted')
+
+    embedder = CachedEmbedder(mock_embedder, config)
+    await embedder.create('persisted')
+
+    mock_embedder.create.assert_called_once()
+    assert embedder.stats.disk_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_token_inputs_bypass_cache(mock_embedder: MagicMock) -> None:
+    """Test that non-text inputs are passed through to the wrapped embedder."""
+    embedder = CachedEmbedder(mock_embedder)
+
+    await embedder.create(input_data=[[1, 2, 3]])
+
+    mock_embedder.create.assert_called_once_with([[1, 2, 3]])
+    assert embedder.stats.misses == 0
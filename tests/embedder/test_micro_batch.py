@@ -0,0 +1,98 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.embedder.micro_batch import BatchingEmbedder
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.llm_client import LLMClient
+
+
+@pytest.fixture
+def mock_embedder() -> MagicMock:
+    """Create a mock embedder whose embeddings encode the input text length."""
+    embedder = MagicMock(spec=EmbedderClient)
+    embedder.create = AsyncMock(return_value=[0.0])
+    embedder.create_batch = AsyncMock(
+        side_effect=lambda texts: [[float(len(text))] for text in texts]
+    )
+    return embedder
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creates_issue_one_batch(mock_embedder: MagicMock) -> None:
+    """Test that concurrent create calls are fanned in to a single create_batch call."""
+    embedder = BatchingEmbedder(mock_embedder, max_batch_size=10, max_wait_ms=10)
+
+    results = await asyncio.gather(*[embedder.create(input_data=['q' * i]) for i in range(1, 4)])
+
+    mock_embedder.create_batch.assert_called_once_with(['q', 'qq', 'qqq'])
+    mock_embedder.create.assert_not_called()
+    assert results == [[1.0], [2.0], [3.0]]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_at_max_batch_size(mock_embedder: MagicMock) -> None:
+    """Test that a batch is sent as soon as it is full."""
+    embedder = BatchingEmbedder(mock_embedder, max_batch_size=2, max_wait_ms=10)
+
+    await asyncio.gather(*[embedder.create('q' * i) for i in range(1, 6)])
+
+    assert [call.args[0] for call in mock_embedder.create_batch.call_args_list] == [
+        ['q', 'qq'],
+        ['qqq', 'qqqq'],
+        ['qqqqq'],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_raised_to_every_caller(mock_embedder: MagicMock) -> None:
+    """Test that a failed create_batch call fails every coalesced create call."""
+    mock_embedder.create_batch.side_effect = RuntimeError('rate limited')
+    embedder = BatchingEmbedder(mock_embedder)
+
+    results = await asyncio.gather(
+        embedder.create('a'), embedder.create('b'), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_graphiti_uses_batching_query_embedder(mock_embedder: MagicMock) -> None:
+    """Test that Graphiti only wraps the query embedder when batching is configured."""
+    driver = MagicMock(spec=GraphDriver)
+    driver.provider = GraphProvider.NEO4J
+
+    def make_graphiti(**kwargs) -> Graphiti:
+        return Graphiti(
+            graph_driver=driver,
+            llm_client=MagicMock(spec=LLMClient),
+            embedder=mock_embedder,
+            cross_encoder=MagicMock(spec=CrossEncoderClient),
+            **kwargs,
+        )
+
+    assert make_graphiti().clients.query_embedder is None
+
+    query_embedder = make_graphiti(query_embedding_batch_wait_ms=2).clients.query_embedder
+    assert isinstance(query_embedder, BatchingEmbedder)
+    assert query_embedder.embedder is mock_embedder
@@ -0,0 +1,93 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from graphiti_core.embedder.sentence_transformer import (
+    SentenceTransformerEmbedder,
+    SentenceTransformerEmbedderConfig,
+)
+
+
+@pytest.fixture
+def mock_model() -> MagicMock:
+    """Create a mock SentenceTransformer whose embeddings encode the input text length."""
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **kwargs: np.array(
+        [[float(len(text))] * 8 for text in texts]
+    )
+    return model
+
+
+@pytest.mark.asyncio
+async def test_concurrent_create_calls_share_one_forward_pass(mock_model: MagicMock) -> None:
+    """Test that concurrent create calls are micro-batched into a single encode call."""
+    config = SentenceTransformerEmbedderConfig(embedding_dim=4, max_batch_wait_ms=10)
+    embedder = SentenceTransformerEmbedder(config=config, model=mock_model)
+
+    results = await asyncio.gather(*[embedder.create(input_data=['x' * i]) for i in range(1, 6)])
+
+    mock_model.encode.assert_called_once()
+    args, kwargs = mock_model.encode.call_args
+    assert args[0] == ['x', 'xx', 'xxx', 'xxxx', 'xxxxx']
+    assert kwargs['normalize_embeddings'] is True
+    assert results == [[float(i)] * 4 for i in range(1, 6)]
+    embedder.close()
+
+
+@pytest.mark.asyncio
+async def test_create_dispatches_full_batches_early(mock_model: MagicMock) -> None:
+    """Test that a batch is encoded as soon as it reaches batch_size."""
+    config = SentenceTransformerEmbedderConfig(batch_size=2, max_batch_wait_ms=10_000)
+    embedder = SentenceTransformerEmbedder(config=config, model=mock_model)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(embedder.create('a'), embedder.create('bb')), timeout=1
+    )
+
+    assert [result[0] for result in results] == [1.0, 2.0]
+    embedder.close()
+
+
+@pytest.mark.asyncio
+async def test_create_propagates_model_errors(mock_model: MagicMock) -> None:
+    """Test that an encode failure is raised to every waiting caller."""
+    mock_model.encode.side_effect = RuntimeError('model failed')
+    embedder = SentenceTransformerEmbedder(model=mock_model)
+
+    results = await asyncio.gather(
+        embedder.create('a'), embedder.create('b'), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    embedder.close()
+
+
+@pytest.mark.asyncio
+async def test_create_batch_dedupes_and_chunks(mock_model: MagicMock) -> None:
+    """Test that create_batch encodes distinct texts in batch_size chunks."""
+    config = SentenceTransformerEmbedderConfig(batch_size=2)
+    embedder = SentenceTransformerEmbedder(config=config, model=mock_model)
+
+    result = await embedder.create_batch(['a', 'bb', 'a', 'ccc'])
+
+    assert [call.args[0] for call in mock_model.encode.call_args_list] == [['a', 'bb'], ['ccc']]
+    assert [embedding[0] for embedding in result] == [1.0, 2.0, 1.0, 3.0]
+    embedder.close()
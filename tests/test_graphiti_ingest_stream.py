@@ -0,0 +1,236 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core import graphiti as graphiti_module
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.utils.bulk_utils import RawEpisode
+from graphiti_core.utils.datetime_utils import utc_now
+from graphiti_core.utils.maintenance.graph_data_operations import (
+    fit_episodes_to_token_budget,
+    merge_pending_episodes,
+)
+
+
+def _make_graphiti() -> Graphiti:
+    driver = MagicMock(spec=GraphDriver)
+    driver.provider = GraphProvider.NEO4J
+    driver._database = 'neo4j'
+    return Graphiti(
+        graph_driver=driver,
+        llm_client=MagicMock(spec=LLMClient),
+        embedder=MagicMock(spec=EmbedderClient),
+        cross_encoder=MagicMock(spec=CrossEncoderClient),
+    )
+
+
+def _raw_episodes(count: int) -> list[RawEpisode]:
+    now = utc_now()
+    return [
+        RawEpisode(
+            name=f'episode-{i}',
+            content=f'content {i}',
+            source_description='test',
+            source=EpisodeType.message,
+            reference_time=now + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+async def _stream(raw_episodes: list[RawEpisode]):
+    for raw_episode in raw_episodes:
+        yield raw_episode
+
+
+@pytest.mark.asyncio
+async def test_ingest_stream_overlaps_extraction_and_preserves_order(monkeypatch):
+    graphiti = _make_graphiti()
+    events: list[tuple[str, str]] = []
+    previous_episode_names: dict[str, list[str]] = {}
+
+    async def fake_retrieve_episodes(*args, **kwargs):
+        return []
+
+    async def fake_extract_nodes(clients, episode, previous_episodes, *args):
+        events.append(('extract', episode.name))
+        previous_episode_names[episode.name] = [ep.name for ep in previous_episodes]
+        await asyncio.sleep(0)
+        return [EntityNode(name=f'entity-{episode.name}', group_id=episode.group_id)]
+
+    async def fake_extract_edges(*args, **kwargs):
+        return []
+
+    async def fake_resolve_nodes(clients, extracted_nodes, episode, *args):
+        events.append(('resolve', episode.name))
+        await asyncio.sleep(0.01)
+        return extracted_nodes, {node.uuid: node.uuid for node in extracted_nodes}, []
+
+    async def fake_resolve_edges(*args, **kwargs):
+        return [], []
+
+    async def fake_extract_attributes(clients, nodes, *args):
+        return nodes
+
+    monkeypatch.setattr(graphiti, 'retrieve_episodes', fake_retrieve_episodes)
+    monkeypatch.setattr(graphiti_module, 'extract_nodes', fake_extract_nodes)
+    monkeypatch.setattr(graphiti_module, 'extract_edges', fake_extract_edges)
+    monkeypatch.setattr(graphiti_module, 'resolve_extracted_nodes', fake_resolve_nodes)
+    monkeypatch.setattr(graphiti_module, 'resolve_extracted_edges', fake_resolve_edges)
+    monkeypatch.setattr(graphiti_module, 'extract_attributes_from_nodes', fake_extract_attributes)
+    monkeypatch.setattr(graphiti_module, 'add_nodes_and_edges_bulk', AsyncMock())
+
+    raw_episodes = _raw_episodes(4)
+    results = [
+        result
+        async for result in graphiti.ingest_stream(
+            _stream(raw_episodes), group_id='group', pipeline_depth=2
+        )
+    ]
+
+    assert [result.episode.name for result in results] == [ep.name for ep in raw_episodes]
+    assert [name for stage, name in events if stage == 'resolve'] == [
+        ep.name for ep in raw_episodes
+    ]
+    # Extraction of the next episode starts before the current one is resolved
+    assert events.index(('extract', 'episode-1')) < events.index(('resolve', 'episode-0'))
+    # Unsaved episodes from the stream are used as previous episode context
+    assert previous_episode_names['episode-2'] == ['episode-0', 'episode-1']
+
+
+@pytest.mark.asyncio
+async def test_ingest_stream_awaits_look_ahead_tasks_on_close(monkeypatch):
+    graphiti = _make_graphiti()
+    release = asyncio.Event()
+
+    async def fake_retrieve_episodes(*args, **kwargs):
+        return []
+
+    async def fake_extract_nodes(clients, episode, *args):
+        if episode.name == 'episode-1':
+            raise RuntimeError('extraction failed')
+        if episode.name == 'episode-2':
+            await release.wait()
+        return []
+
+    async def fake_resolve_nodes(clients, extracted_nodes, *args):
+        await asyncio.sleep(0)
+        return extracted_nodes, {}, []
+
+    monkeypatch.setattr(graphiti, 'retrieve_episodes', fake_retrieve_episodes)
+    monkeypatch.setattr(graphiti_module, 'extract_nodes', fake_extract_nodes)
+    monkeypatch.setattr(graphiti_module, 'extract_edges', AsyncMock(return_value=[]))
+    monkeypatch.setattr(graphiti_module, 'resolve_extracted_nodes', fake_resolve_nodes)
+    monkeypatch.setattr(
+        graphiti_module, 'resolve_extracted_edges', AsyncMock(return_value=([], []))
+    )
+    monkeypatch.setattr(
+        graphiti_module, 'extract_attributes_from_nodes', AsyncMock(return_value=[])
+    )
+    monkeypatch.setattr(graphiti_module, 'add_nodes_and_edges_bulk', AsyncMock())
+
+    tasks: list[asyncio.Task] = []
+    create_task = asyncio.create_task
+
+    def tracking_create_task(coro):
+        task = create_task(coro)
+        tasks.append(task)
+        return task
+
+    monkeypatch.setattr(graphiti_module.asyncio, 'create_task', tracking_create_task)
+
+    stream = graphiti.ingest_stream(_stream(_raw_episodes(3)), group_id='group', pipeline_depth=3)
+    result = await stream.__anext__()
+    await stream.aclose()
+
+    assert result.episode.name == 'episode-0'
+    assert len(tasks) == 3
+    assert all(task.done() for task in tasks)
+    assert tasks[2].cancelled()
+
+
+@pytest.mark.asyncio
+async def test_ingest_stream_rejects_invalid_pipeline_depth():
+    graphiti = _make_graphiti()
+
+    with pytest.raises(ValueError):
+        async for _ in graphiti.ingest_stream(_stream([]), pipeline_depth=0):
+            pass
+
+
+def test_merge_pending_episodes_filters_and_dedupes():
+    now = utc_now()
+    episodes = [
+        EpisodicNode(
+            name=f'episode-{i}',
+            group_id='group',
+            source=EpisodeType.message,
+            source_description='test',
+            content='',
+            valid_at=now + timedelta(seconds=i),
+        )
+        for i in range(4)
+    ]
+    text_episode = episodes[2].model_copy(update={'uuid': 'text', 'source': EpisodeType.text})
+
+    merged = merge_pending_episodes(
+        [episodes[0]],
+        [episodes[0], episodes[1], text_episode, episodes[3]],
+        reference_time=episodes[2].valid_at,
+        last_n=5,
+        source=EpisodeType.message,
+    )
+
+    assert [episode.name for episode in merged] == ['episode-0', 'episode-1']
+
+
+def test_fit_episodes_to_token_budget_truncates_oldest_first():
+    now = utc_now()
+    contents = ['Old one. ' * 100, 'Middle one. ' * 100, 'Recent.']
+    episodes = [
+        EpisodicNode(
+            name=f'episode-{i}',
+            group_id='group',
+            source=EpisodeType.text,
+            source_description='test',
+            content=content,
+            valid_at=now + timedelta(seconds=i),
+        )
+        for i, content in enumerate(contents)
+    ]
+
+    # 'Recent.' is kept whole and the middle episode is cut at a sentence to the remaining
+    # 300 - 2 tokens; too little is left for the oldest one, so it is dropped
+    fitted = fit_episodes_to_token_budget(episodes, token_budget=300)
+
+    assert [episode.name for episode in fitted] == ['episode-1', 'episode-2']
+    assert fitted[1] is episodes[2]
+    assert fitted[0].content.endswith('Middle one.')
+    assert len(fitted[0].content) <= 298 * 4
+    assert episodes[1].content == contents[1]
+
+    assert fit_episodes_to_token_budget(episodes, token_budget=None) is episodes
+    assert fit_episodes_to_token_budget(episodes, token_budget=20) == [episodes[2]]
@@ -0,0 +1,71 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.errors import GroupsEdgesNotFoundError
+from graphiti_core.nodes import EntityNode
+
+
+def _nodes(*uuids: str) -> list[EntityNode]:
+    return [EntityNode(uuid=uuid, name=uuid, group_id='g1') for uuid in uuids]
+
+
+@pytest.mark.asyncio
+async def test_node_pages_follow_uuid_cursor(monkeypatch):
+    get_by_group_ids = AsyncMock(side_effect=[_nodes('e', 'd'), _nodes('c', 'b'), _nodes('a')])
+    monkeypatch.setattr(EntityNode, 'get_by_group_ids', get_by_group_ids)
+    driver = MagicMock()
+
+    pages = [
+        [node.uuid for node in page]
+        async for page in EntityNode.iter_by_group_ids(
+            driver, ['g1'], page_size=2, with_embeddings=True
+        )
+    ]
+
+    assert pages == [['e', 'd'], ['c', 'b'], ['a']]
+    cursors = [call.kwargs['uuid_cursor'] for call in get_by_group_ids.await_args_list]
+    assert cursors == [None, 'd', 'b']
+    assert all(call.kwargs['limit'] == 2 for call in get_by_group_ids.await_args_list)
+    assert all(call.kwargs['with_embeddings'] for call in get_by_group_ids.await_args_list)
+
+
+@pytest.mark.asyncio
+async def test_full_last_page_ends_on_empty_page(monkeypatch):
+    get_by_group_ids = AsyncMock(side_effect=[_nodes('b', 'a'), []])
+    monkeypatch.setattr(EntityNode, 'get_by_group_ids', get_by_group_ids)
+
+    pages = [page async for page in EntityNode.iter_by_group_ids(MagicMock(), ['g1'], page_size=2)]
+
+    assert len(pages) == 1
+    assert get_by_group_ids.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_edge_pages_treat_missing_edges_as_end(monkeypatch):
+    monkeypatch.setattr(
+        EntityEdge,
+        'get_by_group_ids',
+        AsyncMock(side_effect=GroupsEdgesNotFoundError(['g1'])),
+    )
+
+    pages = [page async for page in EntityEdge.iter_by_group_ids(MagicMock(), ['g1'])]
+
+    assert pages == []
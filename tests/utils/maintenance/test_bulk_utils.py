@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from graphiti_core.driver.driver import GraphProvider
 from graphiti_core.edges import EntityEdge
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
@@ -326,3 +327,160 @@ async def test_dedupe_edges_bulk_deduplicates_within_episode(monkeypatch):
     for _, compared_against in comparisons_made:
         # Each edge should have access to all 3 edges as candidates
         assert len(compared_against) >= 2  # At least 2 others (self is filtered out)
+
+
+def _make_edge(fact: str, source: str, target: str, embedding: list[float] | None) -> EntityEdge:
+    return EntityEdge(
+        name='RELATES_TO',
+        fact=fact,
+        group_id='group',
+        source_node_uuid=source,
+        target_node_uuid=target,
+        created_at=utc_now(),
+        fact_embedding=embedding,
+    )
+
+
+def test_find_edge_dedupe_candidates_uses_word_overlap_and_similarity():
+    overlap = _make_edge('Alice likes jazz', 's', 't', [1.0, 0.0])
+    similar = _make_edge('Enjoys bebop', 's', 't', [0.0, 2.0])
+    paraphrase = _make_edge('Fond of saxophone', 's', 't', [0.1, 1.0])
+    unrelated = _make_edge('JAZZ records', 's', 't', None)
+
+    candidates = bulk_utils._find_edge_dedupe_candidates(
+        [overlap, similar, paraphrase, unrelated], min_score=0.6
+    )
+
+    assert candidates[overlap.uuid] == [unrelated]
+    assert candidates[similar.uuid] == [paraphrase]
+    assert candidates[paraphrase.uuid] == [similar]
+    assert candidates[unrelated.uuid] == [overlap]
+
+
+@pytest.mark.asyncio
+async def test_dedupe_edges_bulk_only_compares_edges_between_same_nodes(monkeypatch):
+    clients = _make_clients()
+    monkeypatch.setattr(bulk_utils, 'create_entity_edge_embeddings', AsyncMock())
+
+    compared: dict[str, list[str]] = {}
+
+    async def mock_resolve_extracted_edge(llm_client, extracted_edge, related_edges, *_, **__):
+        compared[extracted_edge.uuid] = [edge.uuid for edge in related_edges]
+        return extracted_edge, [], []
+
+    monkeypatch.setattr(bulk_utils, 'resolve_extracted_edge', mock_resolve_extracted_edge)
+
+    episode_a = _make_episode('a')
+    episode_b = _make_episode('b')
+    first = _make_edge('Alice plays piano', 'alice', 'piano', [1.0, 0.0])
+    second = _make_edge('Alice plays piano daily', 'alice', 'piano', [1.0, 0.0])
+    other_pair = _make_edge('Alice plays piano', 'bob', 'piano', [1.0, 0.0])
+
+    await bulk_utils.dedupe_edges_bulk(
+        clients,
+        [[first, other_pair], [second]],
+        [(episode_a, []), (episode_b, [])],
+        [],
+        {},
+        {},
+    )
+
+    assert compared == {
+        first.uuid: [second.uuid],
+        other_pair.uuid: [],
+        second.uuid: [first.uuid],
+    }
+
+
+@pytest.mark.asyncio
+async def test_add_nodes_and_edges_bulk_embeds_before_chunked_transactions(monkeypatch):
+    events: list[str] = []
+    written: list[tuple[int, int, int, int]] = []
+
+    async def fake_create_batch(texts):
+        events.append('embed')
+        return [[1.0, 0.0] for _ in texts]
+
+    embedder = MagicMock()
+    embedder.create_batch = AsyncMock(side_effect=fake_create_batch)
+
+    async def fake_tx(tx, episodic_nodes, episodic_edges, entity_nodes, entity_edges, *_, **__):
+        events.append('write')
+        written.append(
+            (len(episodic_nodes), len(entity_nodes), len(episodic_edges), len(entity_edges))
+        )
+
+    async def execute_write(func, *args, **kwargs):
+        return await func(None, *args, **kwargs)
+
+    session = MagicMock()
+    session.execute_write = AsyncMock(side_effect=execute_write)
+    session.close = AsyncMock()
+    driver = MagicMock()
+    driver.session.return_value = session
+    monkeypatch.setattr(bulk_utils, 'add_nodes_and_edges_bulk_tx', fake_tx)
+
+    episode = _make_episode('1')
+    nodes = [EntityNode(name=f'node-{i}', group_id='group', labels=['Entity']) for i in range(3)]
+    edges = [_make_edge(f'fact {i}', nodes[0].uuid, nodes[1].uuid, None) for i in range(2)]
+
+    await bulk_utils.add_nodes_and_edges_bulk(
+        driver, [episode], [], nodes, edges, embedder, chunk_size=2
+    )
+
+    assert events == ['embed', 'embed', 'write', 'write', 'write']
+    assert written == [(1, 1, 0, 0), (0, 2, 0, 0), (0, 0, 0, 2)]
+    assert all(node.name_embedding == [1.0, 0.0] for node in nodes)
+    assert all(edge.fact_embedding == [1.0, 0.0] for edge in edges)
+    assert session.close.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_add_nodes_and_edges_bulk_tx_uses_one_unwind_per_payload_on_kuzu():
+    driver = MagicMock()
+    driver.provider = GraphProvider.KUZU
+    driver.graph_operations_interface = None
+    tx = MagicMock()
+    tx.run = AsyncMock()
+
+    nodes = [
+        EntityNode(name=f'node-{i}', group_id='group', labels=['Entity'], name_embedding=[0.1])
+        for i in range(3)
+    ]
+    edges = [_make_edge(f'fact {i}', nodes[i].uuid, nodes[i + 1].uuid, [0.1]) for i in range(2)]
+
+    await bulk_utils.add_nodes_and_edges_bulk_tx(tx, [], [], nodes, edges, MagicMock(), driver)
+
+    assert tx.run.await_count == 2
+    node_call, edge_call = tx.run.await_args_list
+    assert node_call.args[0].strip().startswith('UNWIND $nodes AS node')
+    assert len(node_call.kwargs['nodes']) == 3
+    assert edge_call.args[0].strip().startswith('UNWIND $entity_edges AS edge')
+    assert len(edge_call.kwargs['entity_edges']) == 2
+
+
+@pytest.mark.asyncio
+async def test_add_nodes_and_edges_bulk_tx_embeds_only_missing_items():
+    driver = MagicMock()
+    driver.provider = GraphProvider.KUZU
+    driver.graph_operations_interface = None
+    tx = MagicMock()
+    tx.run = AsyncMock()
+    embedder = MagicMock()
+    embedder.create_batch = AsyncMock(side_effect=lambda texts: [[1.0] for _ in texts])
+
+    nodes = [
+        EntityNode(name='embedded', group_id='group', labels=['Entity'], name_embedding=[0.1]),
+        EntityNode(name='missing', group_id='group', labels=['Entity']),
+    ]
+    edges = [_make_edge('fact', nodes[0].uuid, nodes[1].uuid, None)]
+
+    await bulk_utils.add_nodes_and_edges_bulk_tx(tx, [], [], nodes, edges, embedder, driver)
+
+    assert [call.args[0] for call in embedder.create_batch.await_args_list] == [
+        ['missing'],
+        ['fact'],
+    ]
+    node_call, edge_call = tx.run.await_args_list
+    assert [node['name_embedding'] for node in node_call.kwargs['nodes']] == [[0.1], [1.0]]
+    assert edge_call.kwargs['entity_edges'][0]['fact_embedding'] == [1.0]
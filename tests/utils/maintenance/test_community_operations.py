@@ -0,0 +1,232 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.edges import CommunityEdge
+from graphiti_core.nodes import CommunityNode, EntityNode
+from graphiti_core.utils.maintenance import community_operations
+from graphiti_core.utils.maintenance.community_operations import (
+    CommunitySummaryCache,
+    Neighbor,
+    label_propagation,
+    propagate_labels,
+    summarize_community,
+    update_group_communities,
+)
+
+
+def _projection(edges: list[tuple[str, str]]) -> dict[str, list[Neighbor]]:
+    projection: dict[str, list[Neighbor]] = {}
+    for source, target in edges:
+        projection.setdefault(source, []).append(Neighbor(node_uuid=target, edge_count=1))
+        projection.setdefault(target, []).append(Neighbor(node_uuid=source, edge_count=1))
+    return projection
+
+
+def test_label_propagation_finds_triangles():
+    projection = _projection(
+        [('a', 'b'), ('b', 'c'), ('a', 'c'), ('d', 'e'), ('e', 'f'), ('d', 'f')]
+    )
+
+    clusters = sorted(sorted(cluster) for cluster in label_propagation(projection))
+
+    assert clusters == [['a', 'b', 'c'], ['d', 'e', 'f']]
+
+
+def test_propagate_labels_keeps_boundary_fixed():
+    # 'x' joins the community of its fixed neighbors; the neighbors are not relabeled
+    projection = {
+        'x': [Neighbor(node_uuid='a', edge_count=1), Neighbor(node_uuid='b', edge_count=1)]
+    }
+
+    labels = propagate_labels(projection, {'a': 0, 'b': 0, 'x': 5})
+
+    assert labels == {'x': 0}
+
+
+def _mock_group(monkeypatch, memberships: list[tuple[str, str | None]], edges):
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+    driver.execute_query = AsyncMock(
+        return_value=(
+            [
+                {'uuid': uuid, 'community_uuid': community, 'edge_uuid': f'm-{uuid}'}
+                for uuid, community in memberships
+            ],
+            None,
+            None,
+        )
+    )
+    full_projection = _projection(edges)
+
+    async def get_neighbor_projection(driver, group_id, uuids):
+        return {uuid: full_projection.get(uuid, []) for uuid in uuids}
+
+    monkeypatch.setattr(community_operations, 'get_neighbor_projection', get_neighbor_projection)
+    monkeypatch.setattr(
+        community_operations, 'get_stale_community_members', AsyncMock(return_value=set())
+    )
+    monkeypatch.setattr(CommunityEdge, 'delete_by_uuids', AsyncMock())
+    monkeypatch.setattr(CommunityNode, 'delete_by_uuids', AsyncMock())
+    monkeypatch.setattr(
+        EntityNode,
+        'get_by_uuids',
+        AsyncMock(
+            side_effect=lambda driver, uuids: [
+                EntityNode(uuid=uuid, name=uuid, group_id='g1', summary=uuid) for uuid in uuids
+            ]
+        ),
+    )
+    monkeypatch.setattr(
+        CommunityNode,
+        'get_by_uuids',
+        AsyncMock(
+            side_effect=lambda driver, uuids: [
+                CommunityNode(uuid=uuid, name=uuid, group_id='g1', summary='old') for uuid in uuids
+            ]
+        ),
+    )
+    monkeypatch.setattr(
+        community_operations,
+        'summarize_community',
+        AsyncMock(return_value=('new summary', 'new name')),
+    )
+    return driver, full_projection
+
+
+@pytest.mark.asyncio
+async def test_update_group_communities_only_touches_changed_communities(monkeypatch):
+    # 'a', 'b', 'c' are in community c1 and 'd', 'e' in c2; 'x' is new and links to 'a' and 'b'
+    driver, _ = _mock_group(
+        monkeypatch,
+        [('a', 'c1'), ('b', 'c1'), ('c', 'c1'), ('d', 'c2'), ('e', 'c2'), ('x', None)],
+        [('a', 'b'), ('b', 'c'), ('a', 'c'), ('d', 'e'), ('x', 'a'), ('x', 'b')],
+    )
+
+    nodes, edges = await update_group_communities(driver, MagicMock(), 'g1')
+
+    # Only c1 gained a member, so only c1 is re-summarized
+    assert [(node.uuid, node.summary) for node in nodes] == [('c1', 'new summary')]
+    summarize = community_operations.summarize_community
+    assert sorted(entity.uuid for entity in summarize.await_args.args[1]) == ['a', 'b', 'c', 'x']
+    # Only 'x' and its neighbors are re-clustered, so only their memberships are rewritten
+    assert sorted(CommunityEdge.delete_by_uuids.await_args.args[1]) == ['m-a', 'm-b']
+    assert sorted((edge.source_node_uuid, edge.target_node_uuid) for edge in edges) == [
+        ('c1', 'a'),
+        ('c1', 'b'),
+        ('c1', 'x'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_group_communities_keeps_memberships_when_summary_fails(monkeypatch):
+    driver, _ = _mock_group(
+        monkeypatch,
+        [('a', 'c1'), ('b', 'c1'), ('x', None)],
+        [('a', 'b'), ('x', 'a'), ('x', 'b')],
+    )
+    monkeypatch.setattr(
+        community_operations, 'summarize_community', AsyncMock(side_effect=RuntimeError('llm'))
+    )
+
+    with pytest.raises(RuntimeError):
+        await update_group_communities(driver, MagicMock(), 'g1')
+
+    CommunityEdge.delete_by_uuids.assert_not_awaited()
+    CommunityNode.delete_by_uuids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_group_communities_agrees_with_full_build(monkeypatch):
+    # 'x' is new and joined to the existing chain a1-a2-a3 by a single edge
+    edges = [('a1', 'a2'), ('a2', 'a3'), ('x', 'a1')]
+    driver, full_projection = _mock_group(
+        monkeypatch, [('a1', 'c1'), ('a2', 'c1'), ('a3', 'c1'), ('x', None)], edges
+    )
+
+    assert [sorted(cluster) for cluster in label_propagation(full_projection)] == [
+        ['a1', 'a2', 'a3', 'x']
+    ]
+
+    nodes, community_edges = await update_group_communities(driver, MagicMock(), 'g1')
+
+    # 'x' joins c1 and nothing is split off into a new community
+    assert [node.uuid for node in nodes] == ['c1']
+    assert {edge.source_node_uuid for edge in community_edges} == {'c1'}
+    assert 'x' in {edge.target_node_uuid for edge in community_edges}
+
+
+def _llm_client() -> MagicMock:
+    async def generate_response(messages, response_model=None, prompt_name=None, **kwargs):
+        if prompt_name == 'summarize_nodes.summary_description':
+            return {'description': 'description'}
+        return {'summary': f'summary {llm_client.generate_response.await_count}'}
+
+    llm_client = MagicMock()
+    llm_client.generate_response = AsyncMock(side_effect=generate_response)
+    return llm_client
+
+
+def _prompt_names(llm_client: MagicMock) -> list[str]:
+    return [call.kwargs['prompt_name'] for call in llm_client.generate_response.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_summarize_community_reduces_in_bounded_batches():
+    llm_client = _llm_client()
+    members = [
+        EntityNode(uuid=f'{i:02d}', name=str(i), group_id='g1', summary=f'entity {i}')
+        for i in range(20)
+    ]
+
+    summary, name = await summarize_community(llm_client, members, fan_in=4)
+
+    # 20 -> 5 -> 2 -> 1 summaries, the odd fifth being carried up a round without a call,
+    # then one call to name the community
+    assert _prompt_names(llm_client) == ['summarize_nodes.summarize_summaries'] * 7 + [
+        'summarize_nodes.summary_description'
+    ]
+    first_batch = llm_client.generate_response.await_args_list[0].args[0][1].content
+    assert 'entity 3' in first_batch and 'entity 4' not in first_batch
+    assert name == 'description'
+
+
+@pytest.mark.asyncio
+async def test_summarize_community_single_member_and_cache():
+    llm_client = _llm_client()
+    member = EntityNode(name='Alice', group_id='g1', summary='Alice lives in Paris.')
+
+    assert await summarize_community(llm_client, [member]) == (
+        'Alice lives in Paris.',
+        'description',
+    )
+    assert _prompt_names(llm_client) == ['summarize_nodes.summary_description']
+
+    cache = CommunitySummaryCache()
+    members = [EntityNode(name=str(i), group_id='g1', summary=f'entity {i}') for i in range(3)]
+    await summarize_community(llm_client, members, summary_cache=cache)
+    calls = llm_client.generate_response.await_count
+
+    await summarize_community(llm_client, list(reversed(members)), summary_cache=cache)
+    assert llm_client.generate_response.await_count == calls + 1
+
+    members[0].summary = 'changed'
+    await summarize_community(llm_client, members, summary_cache=cache)
+    assert llm_client.generate_response.await_count == calls + 3
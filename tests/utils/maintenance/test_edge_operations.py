@@ -12,6 +12,7 @@ from graphiti_core.utils.maintenance.edge_operations import (
     DEFAULT_EDGE_NAME,
     resolve_extracted_edge,
     resolve_extracted_edges,
+    resolve_extracted_edges_in_batches,
 )
 
 
@@ -167,7 +168,11 @@ async def test_resolve_extracted_edges_resets_unmapped_names(monkeypatch):
         return [await aw for aw in aws]
 
     monkeypatch.setattr(edge_ops, 'semaphore_gather', immediate_gather)
-    monkeypatch.setattr(edge_ops, 'search', AsyncMock(return_value=SearchResults()))
+    monkeypatch.setattr(
+        edge_ops,
+        'search_many',
+        AsyncMock(side_effect=lambda _clients, queries, **__: [SearchResults() for _ in queries]),
+    )
 
     llm_client = MagicMock()
     llm_client.generate_response = AsyncMock(
@@ -247,7 +252,11 @@ async def test_resolve_extracted_edges_keeps_unknown_names(monkeypatch):
         return [await aw for aw in aws]
 
     monkeypatch.setattr(edge_ops, 'semaphore_gather', immediate_gather)
-    monkeypatch.setattr(edge_ops, 'search', AsyncMock(return_value=SearchResults()))
+    monkeypatch.setattr(
+        edge_ops,
+        'search_many',
+        AsyncMock(side_effect=lambda _clients, queries, **__: [SearchResults() for _ in queries]),
+    )
 
     llm_client = MagicMock()
     llm_client.generate_response = AsyncMock(
@@ -560,7 +569,11 @@ async def test_resolve_extracted_edges_fast_path_deduplication(monkeypatch):
         return results
 
     monkeypatch.setattr(edge_ops, 'semaphore_gather', immediate_gather)
-    monkeypatch.setattr(edge_ops, 'search', AsyncMock(return_value=SearchResults()))
+    monkeypatch.setattr(
+        edge_ops,
+        'search_many',
+        AsyncMock(side_effect=lambda _clients, queries, **__: [SearchResults() for _ in queries]),
+    )
     monkeypatch.setattr(edge_ops, 'resolve_extracted_edge', mock_resolve_extracted_edge)
 
     llm_client = MagicMock()
@@ -645,3 +658,103 @@ async def test_resolve_extracted_edges_fast_path_deduplication(monkeypatch):
     assert resolve_call_count == 1
     assert len(resolved_edges) == 1
     assert invalidated_edges == []
+
+
+def _edge(uuid: str, fact: str, valid_at: datetime | None = None) -> EntityEdge:
+    return EntityEdge(
+        uuid=uuid,
+        source_node_uuid=f'{uuid}_source',
+        target_node_uuid=f'{uuid}_target',
+        name='RELATES_TO',
+        group_id='group_1',
+        fact=fact,
+        episodes=[],
+        created_at=datetime.now(timezone.utc),
+        valid_at=valid_at,
+    )
+
+
+def _episode() -> EpisodicNode:
+    return EpisodicNode(
+        uuid='episode_uuid',
+        name='Episode',
+        group_id='group_1',
+        source='message',
+        source_description='desc',
+        content='Episode content',
+        valid_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_edges_in_batches_maps_results_by_id(mock_llm_client):
+    now = datetime.now(timezone.utc)
+    shared = _edge('shared', 'Alice works at Acme', now - timedelta(days=2))
+    other = _edge('other', 'Bob lives in Paris', now - timedelta(days=2))
+    lonely = _edge('new_lonely', 'Carol likes tea')
+    duplicate = _edge('new_duplicate', 'Alice is employed by Acme')
+    contradiction = _edge('new_contradiction', 'Alice works at Initech', now)
+
+    mock_llm_client.generate_response.return_value = {
+        'edge_resolutions': [
+            {'id': 1, 'duplicate_facts': [], 'contradicted_facts': [0], 'fact_type': 'DEFAULT'},
+            {'id': 0, 'duplicate_facts': [0], 'contradicted_facts': [], 'fact_type': 'DEFAULT'},
+        ]
+    }
+
+    results = await resolve_extracted_edges_in_batches(
+        mock_llm_client,
+        [lonely, duplicate, contradiction],
+        [[], [shared], []],
+        [[], [other], [other, shared]],
+        _episode(),
+        [{}, {}, {}],
+        set(),
+        batch_size=10,
+    )
+
+    # The edge without candidates skips the LLM and the other two share one call
+    assert mock_llm_client.generate_response.await_count == 1
+    context_message = mock_llm_client.generate_response.await_args.args[0][1].content
+    assert context_message.count('Alice works at Acme') == 1
+
+    assert results[0] == (lonely, [], [])
+    assert results[1][0] is shared
+    assert 'episode_uuid' in shared.episodes
+    assert results[2][0] is contradiction
+    assert results[2][1] == [shared]
+    assert shared.invalid_at == contradiction.valid_at
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_edges_in_batches_falls_back_for_missing_ids(mock_llm_client):
+    candidate = _edge('candidate', 'Alice works at Acme')
+    first = _edge('first', 'Alice is employed by Acme')
+    second = _edge('second', 'Alice works for Acme')
+
+    mock_llm_client.generate_response.side_effect = [
+        {
+            'edge_resolutions': [
+                {'id': 0, 'duplicate_facts': [], 'contradicted_facts': [], 'fact_type': 'DEFAULT'}
+            ]
+        },
+        {'duplicate_facts': [0], 'contradicted_facts': [], 'fact_type': 'DEFAULT'},
+    ]
+
+    results = await resolve_extracted_edges_in_batches(
+        mock_llm_client,
+        [first, second],
+        [[candidate], [candidate]],
+        [[], []],
+        _episode(),
+        [{}, {}],
+        set(),
+        batch_size=10,
+    )
+
+    prompt_names = [
+        call.kwargs['prompt_name'] for call in mock_llm_client.generate_response.await_args_list
+    ]
+    assert prompt_names == ['dedupe_edges.resolve_edges', 'dedupe_edges.resolve_edge']
+    assert results[0][0] is first
+    assert results[1][0] is candidate
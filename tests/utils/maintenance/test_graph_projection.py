@@ -0,0 +1,99 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.utils.maintenance.graph_projection import (
+    GraphProjection,
+    get_graph_projection,
+    label_propagation_csr,
+)
+
+
+def _neighbors(projection: GraphProjection, uuid: str) -> dict[str, float]:
+    i = projection.index[uuid]
+    start, end = projection.indptr[i], projection.indptr[i + 1]
+    return {
+        projection.uuids[j]: float(weight)
+        for j, weight in zip(
+            projection.indices[start:end], projection.weights[start:end], strict=True
+        )
+    }
+
+
+def test_from_edges_builds_csr_and_sums_duplicates():
+    projection = GraphProjection.from_edges(
+        ['a', 'b', 'c'], [('a', 'b', 1), ('a', 'c', 2), ('a', 'b', 3), ('c', 'a', 1)]
+    )
+
+    assert projection.indptr.tolist() == [0, 2, 2, 3]
+    assert _neighbors(projection, 'a') == {'b': 4.0, 'c': 2.0}
+    assert _neighbors(projection, 'b') == {}
+    assert _neighbors(projection, 'c') == {'a': 1.0}
+
+
+def test_label_propagation_csr_respects_fixed_labels():
+    edges = [('a', 'b', 1), ('b', 'a', 1), ('b', 'c', 1), ('c', 'b', 1)]
+    projection = GraphProjection.from_edges(['a', 'b', 'c'], edges)
+
+    # Without fixed labels the chain collapses into the largest label
+    assert label_propagation_csr(projection).tolist() == [2, 2, 2]
+
+    labels = label_propagation_csr(
+        projection, np.array([7, 1, 0]), fixed=np.array([False, False, True])
+    )
+    assert labels.tolist() == [7, 7, 0]
+
+
+def test_label_propagation_csr_stops_oscillating():
+    # Heavier edges make 'a' and 'b' swap labels every round
+    projection = GraphProjection.from_edges(['a', 'b'], [('a', 'b', 2), ('b', 'a', 2)])
+
+    labels = label_propagation_csr(projection, max_iterations=5)
+
+    assert sorted(labels.tolist()) == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_graph_projection_pages_and_symmetrizes():
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+    driver.execute_query = AsyncMock(
+        side_effect=[
+            (
+                [
+                    {'source_uuid': 'a', 'target_uuid': 'b', 'count': 2},
+                    {'source_uuid': 'a', 'target_uuid': 'a', 'count': 1},
+                    {'source_uuid': 'b', 'target_uuid': None, 'count': 0},
+                ],
+                None,
+                None,
+            ),
+            ([{'source_uuid': 'c', 'target_uuid': 'a', 'count': 1}], None, None),
+        ]
+    )
+
+    projection = await get_graph_projection(driver, 'g1', page_size=2)
+
+    assert projection.uuids == ['a', 'b', 'c']
+    assert _neighbors(projection, 'a') == {'b': 2.0, 'c': 1.0}
+    assert _neighbors(projection, 'b') == {'a': 2.0}
+    assert _neighbors(projection, 'c') == {'a': 1.0}
+    assert driver.execute_query.await_args_list[1].kwargs['uuid'] == 'b'
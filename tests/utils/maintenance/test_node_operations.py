@@ -11,6 +11,9 @@ from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.dedup_helpers import (
     DedupCandidateIndexes,
     DedupResolutionState,
+    EntityIndexStore,
+    EntityNameIndex,
+    LSHIndex,
     _build_candidate_indexes,
     _cached_shingles,
     _has_high_entropy,
@@ -18,6 +21,7 @@ from graphiti_core.utils.maintenance.dedup_helpers import (
     _jaccard_similarity,
     _lsh_bands,
     _minhash_signature,
+    _minhash_signatures,
     _name_entropy,
     _normalize_name_for_fuzzy,
     _normalize_string_exact,
@@ -35,6 +39,8 @@ from graphiti_core.utils.maintenance.node_operations import (
 
 def _make_clients():
     driver = MagicMock()
+    # empty graph for the entity name index load
+    driver.execute_query = AsyncMock(return_value=([], None, None))
     embedder = MagicMock()
     cross_encoder = MagicMock()
     llm_client = MagicMock()
@@ -69,11 +75,11 @@ async def test_resolve_nodes_exact_match_skips_llm(monkeypatch):
     candidate = EntityNode(name='Joe Michaels', group_id='group', labels=['Entity'])
     extracted = EntityNode(name='Joe Michaels', group_id='group', labels=['Entity'])
 
-    async def fake_search(*_, **__):
-        return SearchResults(nodes=[candidate])
+    async def fake_search(_clients, queries, **__):
+        return [SearchResults(nodes=[candidate]) for _ in queries]
 
     monkeypatch.setattr(
-        'graphiti_core.utils.maintenance.node_operations.search',
+        'graphiti_core.utils.maintenance.node_operations.search_many',
         fake_search,
     )
     monkeypatch.setattr(
@@ -109,11 +115,11 @@ async def test_resolve_nodes_low_entropy_uses_llm(monkeypatch):
 
     extracted = EntityNode(name='Joe', group_id='group', labels=['Entity'])
 
-    async def fake_search(*_, **__):
-        return SearchResults(nodes=[])
+    async def fake_search(_clients, queries, **__):
+        return [SearchResults(nodes=[]) for _ in queries]
 
     monkeypatch.setattr(
-        'graphiti_core.utils.maintenance.node_operations.search',
+        'graphiti_core.utils.maintenance.node_operations.search_many',
         fake_search,
     )
     monkeypatch.setattr(
@@ -140,11 +146,11 @@ async def test_resolve_nodes_fuzzy_match(monkeypatch):
     candidate = EntityNode(name='Joe-Michaels', group_id='group', labels=['Entity'])
     extracted = EntityNode(name='Joe Michaels', group_id='group', labels=['Entity'])
 
-    async def fake_search(*_, **__):
-        return SearchResults(nodes=[candidate])
+    async def fake_search(_clients, queries, **__):
+        return [SearchResults(nodes=[candidate]) for _ in queries]
 
     monkeypatch.setattr(
-        'graphiti_core.utils.maintenance.node_operations.search',
+        'graphiti_core.utils.maintenance.node_operations.search_many',
         fake_search,
     )
     monkeypatch.setattr(
@@ -177,9 +183,9 @@ async def test_collect_candidate_nodes_dedupes_and_merges_override(monkeypatch):
     )
     extracted = EntityNode(name='Alice', group_id='group', labels=['Entity'])
 
-    search_mock = AsyncMock(return_value=SearchResults(nodes=[candidate]))
+    search_mock = AsyncMock(return_value=[SearchResults(nodes=[candidate])])
     monkeypatch.setattr(
-        'graphiti_core.utils.maintenance.node_operations.search',
+        'graphiti_core.utils.maintenance.node_operations.search_many',
         search_mock,
     )
 
@@ -202,8 +208,8 @@ def test_build_candidate_indexes_populates_structures():
     normalized_key = candidate.name.lower()
     assert indexes.normalized_existing[normalized_key][0].uuid == candidate.uuid
     assert indexes.nodes_by_uuid[candidate.uuid] is candidate
-    assert candidate.uuid in indexes.shingles_by_candidate
-    assert any(candidate.uuid in bucket for bucket in indexes.lsh_buckets.values())
+    assert candidate.uuid in indexes.lsh_index.shingles_by_uuid
+    assert any(candidate.uuid in bucket for bucket in indexes.lsh_index.buckets.values())
 
 
 def test_normalize_helpers():
@@ -235,8 +241,255 @@ def test_hash_minhash_and_lsh():
     assert len(signature) == 32
     bands = _lsh_bands(signature)
     assert all(len(band) == 4 for band in bands)
-    hashed = {_hash_shingle(s, 0) for s in shingles}
+    hashed = {_hash_shingle(s) for s in shingles}
     assert len(hashed) == len(shingles)
+    assert _minhash_signature(shingles) == signature
+    assert _minhash_signature(set()) == tuple()
+
+
+def test_minhash_signatures_match_single_signatures():
+    shingle_sets = [{'abc', 'bcd'}, {'xyz'}, {'abc', 'bcd', 'cde', 'def'}]
+
+    signatures = _minhash_signatures(shingle_sets)
+
+    assert signatures.shape == (3, 32)
+    for shingles, signature in zip(shingle_sets, signatures, strict=True):
+        assert tuple(int(value) for value in signature) == _minhash_signature(shingles)
+
+
+def test_lsh_index_incremental_updates():
+    index = LSHIndex()
+    node = EntityNode(name='Thelonious Monk', group_id='group', labels=['Entity'])
+    index.add([node])
+
+    shingles = _cached_shingles(_normalize_name_for_fuzzy('Thelonious Monk'))
+    assert index.query(shingles) == {node.uuid}
+
+    # Re-adding an unchanged node is a no-op; renaming re-indexes it
+    index.add([node])
+    assert len(index) == 1
+    renamed = node.model_copy(update={'name': 'Bud Powell Trio'})
+    index.add([renamed])
+    assert index.query(shingles) == set()
+
+    index.remove(node.uuid)
+    assert node.uuid not in index
+    assert not index.buckets
+
+
+def test_entity_index_store_persists_per_group_and_evicts():
+    store = EntityIndexStore(max_groups=2)
+    index = store.get('group-a')
+    index.add([EntityNode(name='Charles Mingus', group_id='group-a', labels=['Entity'])])
+
+    assert store.get('group-a') is index
+    store.get('group-b')
+    store.get('group-c')
+    assert store.get('group-a') is not index
+
+
+def test_entity_name_index_matches_only_when_complete_and_unique():
+    index = EntityNameIndex()
+    node = EntityNode(name='Charles Mingus Sextet', group_id='group', labels=['Entity'])
+    index.add([node])
+
+    assert index.match('charles mingus sextet') is None
+    index.complete = True
+    assert index.match('charles mingus sextet') == node.uuid
+    assert index.match('Charles Mingus Sextets') == node.uuid
+    assert index.match('Joe') is None
+
+    twin = EntityNode(name='Charles Mingus Sextet', group_id='group', labels=['Entity'])
+    index.add([twin])
+    assert index.match('charles mingus sextet') is None
+
+    index.remove([twin.uuid])
+    assert index.match('charles mingus sextet') == node.uuid
+
+    node.name = 'Mingus Big Band'
+    index.add([node])
+    assert index.match('charles mingus sextet') is None
+    assert index.match('Mingus Big Band') == node.uuid
+
+
+def test_entity_name_index_skips_unchanged_names():
+    index = EntityNameIndex()
+    node = EntityNode(name='Charles  Mingus Sextet', group_id='group', labels=['Entity'])
+    index.add([node])
+    index.lsh_index = MagicMock(wraps=index.lsh_index)
+
+    index.add([node])
+    index.lsh_index.add.assert_called_once_with([])
+
+    node.name = 'Mingus Big Band'
+    index.add([node])
+    assert index.names_by_uuid[node.uuid] == 'mingus big band'
+    assert index.lsh_index.add.call_args.args[0] == [node]
+
+
+def test_entity_index_store_syncs_saves_and_deletes():
+    store = EntityIndexStore()
+    index = store.get('group')
+    index.loaded = True
+    index.complete = True
+    node = EntityNode(name='Bill Evans Trio', group_id='group', labels=['Entity'])
+    other = EntityNode(name='Bill Evans Trio', group_id='other', labels=['Entity'])
+
+    store.add_nodes([node, other])
+    assert index.match('bill evans trio') == node.uuid
+    assert 'other' not in store._indexes
+
+    store.remove_nodes([node.uuid])
+    assert index.match('bill evans trio') is None
+
+
+@pytest.mark.asyncio
+async def test_resolve_nodes_uses_entity_name_index_without_search(monkeypatch):
+    clients, llm_generate = _make_clients()
+
+    existing = EntityNode(name='Thelonious Monk Quartet', group_id='group', labels=['Entity'])
+    extracted = EntityNode(name='Thelonious Monk Quartet', group_id='group', labels=['Entity'])
+    new_entity = EntityNode(name='Blue Note Records', group_id='group', labels=['Entity'])
+
+    get_by_group_ids = AsyncMock(return_value=[existing])
+    get_by_uuids = AsyncMock(return_value=[existing])
+    monkeypatch.setattr(EntityNode, 'get_by_group_ids', get_by_group_ids)
+    monkeypatch.setattr(EntityNode, 'get_by_uuids', get_by_uuids)
+
+    searched: list[str] = []
+
+    async def fake_search(_clients, queries, **__):
+        searched.extend(queries)
+        return [SearchResults(nodes=[]) for _ in queries]
+
+    monkeypatch.setattr(
+        'graphiti_core.utils.maintenance.node_operations.search_many',
+        fake_search,
+    )
+    monkeypatch.setattr(
+        'graphiti_core.utils.maintenance.node_operations.filter_existing_duplicate_of_edges',
+        AsyncMock(side_effect=lambda _, pairs: pairs),
+    )
+    llm_generate.return_value = {
+        'entity_resolutions': [
+            {'id': 0, 'duplicate_idx': -1, 'name': 'Blue Note Records', 'duplicates': []}
+        ]
+    }
+
+    resolved, uuid_map, duplicates = await resolve_extracted_nodes(
+        clients,
+        [extracted, new_entity],
+        episode=_make_episode(),
+        previous_episodes=[],
+    )
+
+    assert [node.uuid for node in resolved] == [existing.uuid, new_entity.uuid]
+    assert uuid_map[extracted.uuid] == existing.uuid
+    assert duplicates == [(extracted, existing)]
+    assert searched == ['Blue Note Records']
+
+    # the index is loaded once per group and reused by later episodes
+    await resolve_extracted_nodes(clients, [extracted], episode=_make_episode())
+    get_by_group_ids.assert_awaited_once()
+    assert searched == ['Blue Note Records']
+
+
+@pytest.mark.asyncio
+async def test_resolve_nodes_drops_stale_entity_index_entries(monkeypatch):
+    clients, llm_generate = _make_clients()
+
+    deleted = EntityNode(name='Sonny Rollins Trio', group_id='group', labels=['Entity'])
+    extracted = EntityNode(name='Sonny Rollins Trio', group_id='group', labels=['Entity'])
+
+    monkeypatch.setattr(EntityNode, 'get_by_group_ids', AsyncMock(return_value=[deleted]))
+    monkeypatch.setattr(EntityNode, 'get_by_uuids', AsyncMock(return_value=[]))
+
+    async def fake_search(_clients, queries, **__):
+        return [SearchResults(nodes=[]) for _ in queries]
+
+    monkeypatch.setattr(
+        'graphiti_core.utils.maintenance.node_operations.search_many',
+        fake_search,
+    )
+    monkeypatch.setattr(
+        'graphiti_core.utils.maintenance.node_operations.filter_existing_duplicate_of_edges',
+        AsyncMock(return_value=[]),
+    )
+    llm_generate.return_value = {
+        'entity_resolutions': [
+            {'id': 0, 'duplicate_idx': -1, 'name': 'Sonny Rollins Trio', 'duplicates': []}
+        ]
+    }
+
+    resolved, _, _ = await resolve_extracted_nodes(
+        clients, [extracted], episode=_make_episode(), previous_episodes=[]
+    )
+
+    assert resolved[0].uuid == extracted.uuid
+    assert deleted.uuid not in clients.entity_indexes.get('group').names_by_uuid
+
+
+@pytest.mark.asyncio
+async def test_resolve_nodes_keeps_search_candidates_out_of_entity_index(monkeypatch):
+    clients, llm_generate = _make_clients()
+    index = clients.entity_indexes.get('group')
+    # A group over the size cap is loaded but never complete
+    index.loaded = True
+    candidate = EntityNode(name='Dexter Gordon Quartet', group_id='group', labels=['Entity'])
+    override = EntityNode(name='Wayne Shorter Quartet', group_id='group', labels=['Entity'])
+    extracted = EntityNode(name='Dexter Gordon Quartet', group_id='group', labels=['Entity'])
+
+    async def fake_search(_clients, queries, **__):
+        return [SearchResults(nodes=[candidate]) for _ in queries]
+
+    monkeypatch.setattr(
+        'graphiti_core.utils.maintenance.node_operations.search_many',
+        fake_search,
+    )
+    monkeypatch.setattr(
+        'graphiti_core.utils.maintenance.node_operations.filter_existing_duplicate_of_edges',
+        AsyncMock(return_value=[]),
+    )
+    llm_generate.return_value = {'entity_resolutions': []}
+
+    await resolve_extracted_nodes(clients, [extracted], episode=_make_episode())
+    assert len(index.lsh_index) == 0
+
+    index.complete = True
+    await resolve_extracted_nodes(
+        clients, [extracted], episode=_make_episode(), existing_nodes_override=[override]
+    )
+    assert len(index.lsh_index) == 0
+
+
+def test_entity_name_index_lends_lsh_index_only_when_it_covers_candidates():
+    index = EntityNameIndex()
+    node = EntityNode(name='Art Blakey Quintet', group_id='group', labels=['Entity'])
+    other = EntityNode(name='Art Blakey Quartet', group_id='group', labels=['Entity'])
+    index.add([node])
+
+    assert index.candidate_lsh_index([node]) is not index.lsh_index
+    index.complete = True
+    assert index.candidate_lsh_index([node]) is index.lsh_index
+    assert index.candidate_lsh_index([node, other]) is not index.lsh_index
+
+
+def test_build_candidate_indexes_reuses_persistent_index():
+    lsh_index = LSHIndex()
+    stale = EntityNode(name='Art Blakey Quintet', group_id='group', labels=['Entity'])
+    candidate = EntityNode(name='Art Blakey Quartet', group_id='group', labels=['Entity'])
+    extracted = EntityNode(name='Art Blakey Quintet', group_id='group', labels=['Entity'])
+    _build_candidate_indexes([stale], lsh_index)
+
+    indexes = _build_candidate_indexes([candidate], lsh_index)
+    state = DedupResolutionState(resolved_nodes=[None], uuid_map={}, unresolved_indices=[])
+    _resolve_with_similarity([extracted], indexes, state)
+
+    # Nodes indexed in earlier runs are not candidates unless they are part of this run
+    assert indexes.lsh_index is lsh_index
+    assert stale.uuid in lsh_index
+    assert state.resolved_nodes[0] is None
+    assert state.unresolved_indices == [0]
 
 
 def test_jaccard_similarity_edges():
@@ -268,8 +521,7 @@ def test_resolve_with_similarity_low_entropy_defers_resolution():
         existing_nodes=[],
         nodes_by_uuid={},
         normalized_existing=defaultdict(list),
-        shingles_by_candidate={},
-        lsh_buckets=defaultdict(list),
+        lsh_index=LSHIndex(),
     )
     state = DedupResolutionState(resolved_nodes=[None], uuid_map={}, unresolved_indices=[])
 
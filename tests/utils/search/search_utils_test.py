@@ -1,10 +1,36 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.edges import EntityEdge
+from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.nodes import EntityNode
+from graphiti_core.search.search import edge_search, node_search, search_many
+from graphiti_core.search.search_config import (
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    NodeSearchConfig,
+    NodeSearchMethod,
+    SearchResults,
+)
+from graphiti_core.search.search_config_recipes import (
+    EDGE_HYBRID_SEARCH_RRF,
+    NODE_HYBRID_SEARCH_CROSS_ENCODER,
+)
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.search.search_utils import hybrid_node_search
+from graphiti_core.search.search_utils import (
+    calculate_cosine_similarities,
+    calculate_cosine_similarity,
+    edge_bfs_search_scored,
+    hybrid_node_search,
+    maximal_marginal_relevance,
+    node_distance_reranker,
+    node_fulltext_search_many,
+    parse_embedding_strings,
+    top_k_scores,
+)
 
 
 @pytest.mark.asyncio
@@ -161,3 +187,330 @@ async def test_hybrid_node_search_with_limit_and_duplicates():
         mock_similarity_search.assert_called_with(
             mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], 4
         )
+
+
+def test_parse_embedding_strings_skips_empty_and_mismatched_rows():
+    matrix, row_indices = parse_embedding_strings(['1,0,0', '', None, '1,2', '0.5,0.5,1e-1'], 3)
+
+    assert matrix.shape == (2, 3)
+    assert row_indices.tolist() == [0, 4]
+    np.testing.assert_allclose(matrix[1], [0.5, 0.5, 0.1])
+
+
+def test_calculate_cosine_similarities_matches_scalar_version():
+    query = [0.3, -0.2, 0.9]
+    rows = [[0.1, 0.2, 0.3], [-1.0, 0.5, 0.0], [0.0, 0.0, 0.0]]
+
+    scores = calculate_cosine_similarities(query, np.array(rows))
+
+    expected = [calculate_cosine_similarity(query, row) for row in rows]
+    np.testing.assert_allclose(scores, expected)
+
+
+def test_top_k_scores_orders_filters_and_limits():
+    scores = np.array([0.2, 0.9, 0.7, 0.95, 0.5, 0.8])
+
+    assert top_k_scores(scores, min_score=0.6).tolist() == [3, 1, 5, 2]
+    assert top_k_scores(scores, min_score=0.6, limit=2).tolist() == [3, 1]
+    assert top_k_scores(scores, min_score=0.99).tolist() == []
+
+
+def test_maximal_marginal_relevance_greedy_selection():
+    query = [0.6, 0.8]
+    candidates = {
+        'a': [0.01, 1.0],
+        'a_duplicate': [0.0, 1.0],
+        'b': [1.0, 0.0],
+    }
+    a = np.array(candidates['a']) / np.linalg.norm(candidates['a'])
+    relevance = {'a': float(a @ query), 'a_duplicate': 0.8, 'b': 0.6}
+
+    # Pure relevance keeps the near-duplicate next to the best match
+    uuids, scores = maximal_marginal_relevance(query, candidates, mmr_lambda=1)
+    assert uuids == ['a', 'a_duplicate', 'b']
+    assert scores == pytest.approx([relevance[uuid] for uuid in uuids])
+
+    # Balancing relevance with diversity promotes the dissimilar candidate over the duplicate
+    uuids, scores = maximal_marginal_relevance(query, candidates, mmr_lambda=0.5)
+    assert uuids == ['a', 'b', 'a_duplicate']
+    assert scores == pytest.approx(
+        [
+            0.5 * relevance['a'],
+            0.5 * relevance['b'] - 0.5 * a[0],
+            0.5 * relevance['a_duplicate'] - 0.5 * a[1],
+        ]
+    )
+
+
+def test_maximal_marginal_relevance_limit_and_min_score():
+    query = [1.0, 0.0]
+    candidates = {'a': [1.0, 0.0], 'b': [0.0, 1.0], 'c': [0.6, 0.8]}
+
+    uuids, scores = maximal_marginal_relevance(query, candidates, mmr_lambda=1, limit=2)
+    assert uuids == ['a', 'c']
+    assert scores == pytest.approx([1.0, 0.6])
+
+    uuids, _ = maximal_marginal_relevance(query, candidates, mmr_lambda=1, min_score=0.5)
+    assert uuids == ['a', 'c']
+
+    assert maximal_marginal_relevance(query, {}) == ([], [])
+
+
+def _node_record(query_idx: int, uuid: str, name: str) -> dict:
+    return {
+        'query_idx': query_idx,
+        'uuid': uuid,
+        'name': name,
+        'group_id': 'group',
+        'labels': ['Entity'],
+        'created_at': '2025-01-01T00:00:00Z',
+        'summary': '',
+        'attributes': {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_node_fulltext_search_many_splits_results_per_query():
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+    driver.search_interface = None
+    driver.fulltext_syntax = ''
+    driver.execute_query = AsyncMock(
+        return_value=(
+            [
+                _node_record(0, 'a', 'Alice'),
+                _node_record(2, 'c', 'Carol'),
+                _node_record(0, 'b', 'Alicia'),
+            ],
+            None,
+            None,
+        )
+    )
+
+    results = await node_fulltext_search_many(
+        driver, ['Alice', 'Bob', 'Carol'], SearchFilters(), group_ids=['group']
+    )
+
+    driver.execute_query.assert_awaited_once()
+    query_rows = driver.execute_query.call_args.kwargs['queries']
+    assert [row['idx'] for row in query_rows] == [0, 1, 2]
+    assert 'UNWIND $queries AS q' in driver.execute_query.call_args.args[0]
+    assert [[node.uuid for node in result] for result in results] == [['a', 'b'], [], ['c']]
+
+
+def _make_search_clients() -> GraphitiClients:
+    embedder = MagicMock()
+    embedder.create_batch = AsyncMock(return_value=[[1.0, 0.0], [0.0, 1.0]])
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+    return GraphitiClients.model_construct(
+        driver=driver,
+        embedder=embedder,
+        cross_encoder=MagicMock(),
+        llm_client=MagicMock(),
+    )
+
+
+def _edge(uuid: str) -> EntityEdge:
+    return EntityEdge(
+        uuid=uuid,
+        group_id='group',
+        source_node_uuid='s',
+        target_node_uuid='t',
+        name='RELATES_TO',
+        fact=uuid,
+        created_at='2025-01-01T00:00:00Z',
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_many_batches_hybrid_edge_search():
+    clients = _make_search_clients()
+    fulltext = AsyncMock(return_value=[[_edge('x'), _edge('y')], [_edge('z')]])
+    similarity = AsyncMock(return_value=[[_edge('y')], []])
+
+    with (
+        patch('graphiti_core.search.search.edge_fulltext_search_many', fulltext),
+        patch('graphiti_core.search.search.edge_similarity_search_many', similarity),
+    ):
+        results = await search_many(
+            clients,
+            ['first fact', 'second fact'],
+            group_ids=['group'],
+            config=EDGE_HYBRID_SEARCH_RRF,
+            search_filter=[SearchFilters(edge_uuids=['x', 'y']), SearchFilters()],
+        )
+
+    # one embedding request and one database query per search method
+    clients.embedder.create_batch.assert_awaited_once_with(['first fact', 'second fact'])
+    fulltext.assert_awaited_once()
+    similarity.assert_awaited_once()
+    assert fulltext.call_args.args[5] == [['x', 'y'], None]
+    assert similarity.call_args.args[1] == [[1.0, 0.0], [0.0, 1.0]]
+
+    assert [edge.uuid for edge in results[0].edges] == ['y', 'x']
+    assert [edge.uuid for edge in results[1].edges] == ['z']
+
+
+@pytest.mark.asyncio
+async def test_search_many_falls_back_for_unbatchable_configs():
+    clients = _make_search_clients()
+    search_mock = AsyncMock(side_effect=lambda *args, **kwargs: SearchResults())
+
+    with patch('graphiti_core.search.search.search', search_mock):
+        results = await search_many(
+            clients,
+            ['Alice', 'Bob'],
+            group_ids=['group'],
+            config=NODE_HYBRID_SEARCH_CROSS_ENCODER,
+            search_filter=SearchFilters(),
+        )
+
+    assert len(results) == 2
+    assert search_mock.await_count == 2
+
+
+def _edge_record(uuid: str, source: str, target: str) -> dict:
+    return {
+        'uuid': uuid,
+        'source_node_uuid': source,
+        'target_node_uuid': target,
+        'group_id': 'group',
+        'created_at': '2025-01-01T00:00:00Z',
+        'name': 'RELATES_TO',
+        'fact': uuid,
+        'episodes': [],
+        'expired_at': None,
+        'valid_at': None,
+        'invalid_at': None,
+        'attributes': {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_edge_bfs_search_expands_level_by_level_and_stops_at_limit():
+    # a -> b, a -> c, b -> c, c -> d
+    graph = {'a': ['b', 'c'], 'b': ['c'], 'c': ['d'], 'd': []}
+
+    async def execute_query(query, **kwargs):
+        frontier = kwargs['frontier']
+        if 'UNION' in query:
+            return [{'uuid': target} for uuid in frontier for target in graph[uuid]], None, None
+        records = [
+            _edge_record(f'{uuid}->{target}', uuid, target)
+            for uuid in frontier
+            for target in graph[uuid]
+            if f'{uuid}->{target}' not in kwargs['seen_uuids']
+        ]
+        return records[: kwargs['limit']], None, None
+
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+    driver.execute_query = AsyncMock(side_effect=execute_query)
+
+    edges, scores = await edge_bfs_search_scored(driver, ['a', 'a'], 3, SearchFilters(), limit=10)
+    assert [edge.uuid for edge in edges] == ['a->b', 'a->c', 'b->c', 'c->d']
+    assert scores == [1.0, 1.0, 0.5, 0.5]
+    # c is reached at depth 1 and is not expanded again at depth 2
+    frontiers = [call.kwargs['frontier'] for call in driver.execute_query.await_args_list]
+    assert frontiers == [['a'], ['a'], ['b', 'c'], ['b', 'c'], ['d']]
+
+    driver.execute_query.reset_mock()
+    edges, scores = await edge_bfs_search_scored(driver, ['a'], 3, SearchFilters(), limit=2)
+    assert [edge.uuid for edge in edges] == ['a->b', 'a->c']
+    assert driver.execute_query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_edge_search_runs_one_bfs_over_all_method_seeds():
+    config = EdgeSearchConfig(
+        search_methods=[
+            EdgeSearchMethod.bm25,
+            EdgeSearchMethod.cosine_similarity,
+            EdgeSearchMethod.bfs,
+        ]
+    )
+    fulltext = AsyncMock(return_value=[_edge('x').model_copy(update={'source_node_uuid': 'a'})])
+    similarity = AsyncMock(
+        return_value=[
+            _edge('x').model_copy(update={'source_node_uuid': 'a'}),
+            _edge('y').model_copy(update={'source_node_uuid': 'b'}),
+        ]
+    )
+    bfs = AsyncMock(return_value=[_edge('z')])
+
+    with (
+        patch('graphiti_core.search.search.edge_fulltext_search', fulltext),
+        patch('graphiti_core.search.search.edge_similarity_search', similarity),
+        patch('graphiti_core.search.search.edge_bfs_search', bfs),
+    ):
+        edges, _ = await edge_search(
+            MagicMock(), MagicMock(), 'query', [0.1], None, config, SearchFilters()
+        )
+
+    bfs.assert_awaited_once()
+    assert bfs.await_args.args[1] == ['a', 'b']
+    assert {edge.uuid for edge in edges} == {'x', 'y', 'z'}
+
+
+@pytest.mark.asyncio
+async def test_node_search_seeds_bfs_from_results_with_center_node():
+    config = NodeSearchConfig(search_methods=[NodeSearchMethod.bm25, NodeSearchMethod.bfs])
+    fulltext = AsyncMock(return_value=[EntityNode(uuid='1', name='Alice', group_id='group')])
+    bfs = AsyncMock(return_value=[EntityNode(uuid='2', name='Bob', group_id='group')])
+
+    with (
+        patch('graphiti_core.search.search.node_fulltext_search', fulltext),
+        patch('graphiti_core.search.search.node_bfs_search', bfs),
+    ):
+        nodes, _ = await node_search(
+            MagicMock(),
+            MagicMock(),
+            'query',
+            [0.1],
+            None,
+            config,
+            SearchFilters(),
+            center_node_uuid='center',
+            limit=10,
+        )
+
+    # The center node only drives reranking; BFS still expands from the search results
+    bfs.assert_awaited_once()
+    assert bfs.await_args.args[1] == ['1']
+    assert {node.uuid for node in nodes} == {'1', '2'}
+
+
+@pytest.mark.asyncio
+async def test_node_distance_reranker_scores_multi_hop_distances():
+    # undirected chain: center - a - b - c - d
+    graph = {
+        'center': ['a'],
+        'a': ['center', 'b'],
+        'b': ['a', 'c'],
+        'c': ['b', 'd'],
+        'd': ['c'],
+    }
+
+    async def execute_query(query, **kwargs):
+        neighbors = [m for uuid in kwargs['frontier'] for m in graph.get(uuid, [])]
+        if 'candidate_uuids' in kwargs:
+            neighbors = [m for m in neighbors if m in kwargs['candidate_uuids']]
+        return [{'uuid': m} for m in dict.fromkeys(neighbors)], None, None
+
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+    driver.execute_query = AsyncMock(side_effect=execute_query)
+
+    uuids, scores = await node_distance_reranker(
+        driver, ['unrelated', 'c', 'center', 'a', 'd', 'b'], 'center'
+    )
+
+    assert uuids == ['center', 'a', 'b', 'c', 'unrelated', 'd']
+    assert scores == pytest.approx([10.0, 1.0, 0.5, 1 / 3, 0.0, 0.0])
+
+    driver.execute_query.reset_mock()
+    uuids, _ = await node_distance_reranker(driver, ['a'], 'center', min_score=0.5)
+    assert uuids == ['a']
+    # the BFS stops once every candidate has been placed
+    assert driver.execute_query.await_count == 2
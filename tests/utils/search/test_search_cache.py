@@ -0,0 +1,145 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from graphiti_core import graphiti as graphiti_module
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search import search_cache as search_cache_module
+from graphiti_core.search.search_cache import SearchCache, SearchCacheConfig
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
+from graphiti_core.search.search_filters import SearchFilters
+
+
+def _key(query: str, group_ids: list[str] | None) -> str:
+    return SearchCache.make_key(query, EDGE_HYBRID_SEARCH_RRF, SearchFilters(), group_ids)
+
+
+def _results(name: str) -> SearchResults:
+    return SearchResults(nodes=[EntityNode(name=name, group_id='g1')])
+
+
+def test_make_key_normalizes_whitespace_and_group_order():
+    assert _key('where  does\nAlice live', ['g2', 'g1']) == _key(
+        'where does Alice live', ['g1', 'g2']
+    )
+    assert _key('where does Alice live', ['g1']) != _key('where does Bob live', ['g1'])
+    assert SearchCache.make_key(
+        'q', EDGE_HYBRID_SEARCH_RRF, SearchFilters(), ['g1']
+    ) != SearchCache.make_key('q', EDGE_HYBRID_SEARCH_RRF, SearchFilters(edge_types=['X']), ['g1'])
+
+
+def test_get_returns_copy_and_counts_hits():
+    cache = SearchCache()
+    key = _key('q', ['g1'])
+
+    assert cache.get(key) is None
+    cache.set(key, ['g1'], _results('Alice'))
+
+    cached = cache.get(key)
+    assert cached is not None
+    cached.nodes[0].name = 'mutated'
+    assert cache.get(key).nodes[0].name == 'Alice'
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+
+
+def test_ttl_and_lru_eviction(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(search_cache_module, 'monotonic', lambda: now)
+    cache = SearchCache(SearchCacheConfig(max_size=2, ttl=10.0))
+
+    cache.set('a', ['g1'], _results('a'))
+    cache.set('b', ['g1'], _results('b'))
+    assert cache.get('a') is not None
+    cache.set('c', ['g1'], _results('c'))
+
+    # 'b' was least recently used
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+
+    now = 111.0
+    assert cache.get('a') is None
+    assert cache.get('c') is None
+
+
+def test_invalidate_groups_drops_matching_and_all_group_entries():
+    cache = SearchCache()
+    cache.set('g1', ['g1'], _results('g1'))
+    cache.set('g2', ['g2'], _results('g2'))
+    cache.set('both', ['g1', 'g2'], _results('both'))
+    cache.set('all', None, _results('all'))
+
+    cache.invalidate_groups(['g1'])
+
+    assert cache.get('g1') is None
+    assert cache.get('both') is None
+    assert cache.get('all') is None
+    assert cache.get('g2') is not None
+    assert cache.stats.invalidations == 3
+
+
+def test_set_skips_results_that_overlapped_an_invalidation():
+    cache = SearchCache()
+    generation = cache.generation
+
+    cache.invalidate_groups(['g1'])
+    cache.set('q', ['g1'], _results('stale'), generation)
+
+    assert cache.get('q') is None
+
+
+@pytest.mark.asyncio
+async def test_graphiti_search_uses_cache_until_group_is_written(monkeypatch):
+    driver = MagicMock(spec=GraphDriver)
+    driver.provider = GraphProvider.NEO4J
+    driver._database = 'neo4j'
+    graphiti = Graphiti(
+        graph_driver=driver,
+        llm_client=MagicMock(spec=LLMClient),
+        embedder=MagicMock(spec=EmbedderClient),
+        cross_encoder=MagicMock(spec=CrossEncoderClient),
+        search_cache=SearchCacheConfig(),
+    )
+
+    calls: list[str] = []
+
+    async def fake_search(clients, query, *args, **kwargs):
+        calls.append(query)
+        return _results(query)
+
+    monkeypatch.setattr(graphiti_module, 'search', fake_search)
+
+    await graphiti.search_('who is Alice', group_ids=['g1'])
+    results = await graphiti.search_('who is  Alice', group_ids=['g1'])
+    assert calls == ['who is Alice']
+    assert results.nodes[0].name == 'who is Alice'
+
+    graphiti._invalidate_search_cache(['g2'])
+    await graphiti.search_('who is Alice', group_ids=['g1'])
+    assert len(calls) == 1
+
+    graphiti._invalidate_search_cache(['g1'])
+    await graphiti.search_('who is Alice', group_ids=['g1'])
+    assert len(calls) == 2